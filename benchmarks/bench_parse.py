@@ -0,0 +1,56 @@
+"""Compare the stdlib table extractor with the BeautifulSoup path.
+
+Run from the repository root:
+
+    python benchmarks/bench_parse.py [--repeat N] [--page PATH]
+
+Prints the mean time per parse and the peak traced memory of one parse for
+each extraction path, on the recorded page in tests/fixtures.
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+import tracemalloc
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_PAGE = ROOT / "tests" / "fixtures" / "vlaginstructie.html"
+
+sys.path.insert(0, str(ROOT / "tests"))
+from component import load  # noqa: E402
+
+parsing = load("parsing")
+
+
+def peak_memory(func, *args) -> int:
+    """Return the peak traced memory in bytes of a single call."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--page", type=Path, default=DEFAULT_PAGE)
+    args = parser.parse_args()
+
+    html = args.page.read_text(encoding="utf-8")
+    paths = {"stdlib": parsing.extract_table_rows_fast}
+    if parsing.BeautifulSoup is not None:
+        paths["bs4"] = parsing.extract_table_rows_bs4
+
+    print(f"page: {args.page.name} ({len(html)} chars), {args.repeat} runs")
+    print(f"{'path':<8} {'mean ms':>10} {'peak KiB':>10}")
+    for name, func in paths.items():
+        mean = timeit.timeit(lambda: func(html), number=args.repeat) / args.repeat
+        peak = peak_memory(func, html)
+        print(f"{name:<8} {mean * 1000:>10.3f} {peak / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
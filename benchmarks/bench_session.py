@@ -0,0 +1,105 @@
+"""Per-fetch latency with a fresh session per fetch versus a shared pooled session.
+
+Run from the repository root (needs the openssl command line tool):
+
+    python benchmarks/bench_session.py [--fetches N]
+
+Starts a local HTTPS stand-in for the government page with a throwaway
+self-signed certificate and times FetchManager's download stage, once without a
+session (new connector, DNS lookup and TLS handshake per fetch) and once with an
+injected session that keeps connections alive, like Home Assistant's shared one.
+"""
+
+import argparse
+import asyncio
+from datetime import date
+import os
+from pathlib import Path
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+PAGE = ROOT / "tests" / "fixtures" / "vlaginstructie.html"
+
+
+def make_certificate(directory: Path) -> tuple[Path, Path]:
+    """Create a self-signed certificate for localhost and return (cert, key)."""
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", str(key), "-out", str(cert), "-days", "1",
+            "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+async def run(fetches: int, cert: Path, key: Path):
+    # imported here so aiohttp's default SSL context picks up SSL_CERT_FILE
+    from aiohttp import ClientSession, web
+
+    sys.path.insert(0, str(ROOT / "tests"))
+    from component import load
+
+    scraper = load("scraper")
+    html = PAGE.read_text(encoding="utf-8")
+
+    async def handler(request):
+        return web.Response(text=html, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    server_ssl = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_ssl.load_cert_chain(cert, key)
+    site = web.TCPSite(runner, "localhost", 0, ssl_context=server_ssl)
+    await site.start()
+    port = runner.addresses[0][1]
+    url = f"https://localhost:{port}/"
+
+    async def measure(manager):
+        timings = []
+        for _ in range(fetches):
+            start = time.perf_counter()
+            page = await manager._async_fetch_page(date.today(), stream=False)
+            timings.append(time.perf_counter() - start)
+            assert page and page["body"], "fetch failed"
+        return timings
+
+    results = {"new session": await measure(scraper.FetchManager(url))}
+    async with ClientSession() as session:
+        results["shared session"] = await measure(scraper.FetchManager(url, session=session))
+    await runner.cleanup()
+
+    print(f"{fetches} fetches of {len(html)} chars over HTTPS (localhost)")
+    print(f"{'mode':<16} {'mean ms':>9} {'median ms':>10} {'p95 ms':>9}")
+    for mode, timings in results.items():
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(
+            f"{mode:<16} {statistics.mean(timings) * 1000:>9.2f} "
+            f"{statistics.median(timings) * 1000:>10.2f} {p95 * 1000:>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fetches", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = make_certificate(Path(tmp))
+        os.environ["SSL_CERT_FILE"] = str(cert)
+        asyncio.run(run(args.fetches, cert, key))
+
+
+if __name__ == "__main__":
+    main()
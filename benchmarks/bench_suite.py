@@ -0,0 +1,222 @@
+"""Benchmark the fetch, parse and entity-read hot paths, with JSON output.
+
+Run from the repository root:
+
+    python benchmarks/bench_suite.py [--quick] [--output results.json]
+    python benchmarks/bench_suite.py --baseline results.json [--threshold 0.25]
+
+Cases:
+  parse_date_string[page]  every date cell of a recorded page
+  build_vlagdagen[page]    the row loop of fetch_vlagdagen on pre-extracted rows
+  parse_vlagdagen[page]    table extraction plus the row loop
+  fetch_vlagdagen[local]   a full fetch from a local aiohttp stand-in server
+  day_snapshot             resolving today, tomorrow and the next flag day
+  entity_reads             every property of every sensor and binary sensor
+                           (needs Home Assistant; skipped otherwise)
+
+Pages are the recorded layouts in tests/fixtures. Each case reports the best and
+mean time per call in microseconds. With --baseline, the run exits with status 1
+when a case's best time is more than --threshold slower than in the baseline.
+"""
+
+import argparse
+import asyncio
+from datetime import date, datetime, timezone
+import json
+from pathlib import Path
+import platform
+import re
+import sys
+import time
+import timeit
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURES = ROOT / "tests" / "fixtures"
+PAGES = {
+    "current": FIXTURES / "vlaginstructie.html",
+    "2022": FIXTURES / "vlaginstructie_2022.html",
+    "2019": FIXTURES / "vlaginstructie_2019.html",
+}
+TODAY = date(2026, 5, 1)
+NOW = datetime(2026, 5, 4, 12, 0, tzinfo=timezone.utc)
+REPEAT = 5
+
+sys.path.insert(0, str(ROOT / "tests"))
+from component import load  # noqa: E402
+
+parsing = load("parsing")
+day_snapshot = load("day_snapshot")
+flag_calendar = load("flag_calendar")
+
+
+def measure(func, repeat: int, number: int | None = None) -> dict:
+    """Return best/mean microseconds per call of func over repeat rounds."""
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    rounds = [total / number * 1e6 for total in timer.repeat(repeat=repeat, number=number)]
+    return {"best_us": min(rounds), "mean_us": sum(rounds) / len(rounds), "calls": number * repeat}
+
+
+def date_cells(rows) -> list[str]:
+    """Return the date strings of the rows as build_vlagdagen splits them."""
+    cells = []
+    for cols in rows:
+        match = re.match(r"^(.*?)\s*\((.*?)\)\s*$", cols[0])
+        cells.extend(match.groups() if match else [cols[0]])
+    return [cell.strip() for cell in cells]
+
+
+def bench_pages(results: dict, repeat: int) -> None:
+    for label, path in PAGES.items():
+        html = path.read_text(encoding="utf-8")
+        rows = parsing.extract_table_rows(html)
+        cells = date_cells(rows)
+
+        def parse_cells(cells=cells):
+            for cell in cells:
+                parsing.parse_date_string(cell)
+
+        results[f"parse_date_string[{label}]"] = measure(parse_cells, repeat)
+        results[f"build_vlagdagen[{label}]"] = measure(
+            lambda rows=rows: parsing.build_vlagdagen(rows, TODAY), repeat
+        )
+        results[f"parse_vlagdagen[{label}]"] = measure(
+            lambda html=html: parsing.parse_vlagdagen(html, TODAY), repeat
+        )
+
+
+async def _bench_fetch(repeat: int, number: int) -> dict:
+    from aiohttp import ClientSession, web
+    from aiohttp.test_utils import TestServer
+
+    scraper = load("scraper")
+
+    html = PAGES["current"].read_text(encoding="utf-8")
+
+    async def handler(request):
+        return web.Response(text=html, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    server = TestServer(app)
+    await server.start_server()
+    url = str(server.make_url("/"))
+    rounds = []
+    try:
+        async with ClientSession() as session:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                for _ in range(number):
+                    # a new manager has no cache, so every call downloads and parses
+                    await scraper.FetchManager(url, session=session).async_fetch()
+                rounds.append((time.perf_counter() - started) / number * 1e6)
+    finally:
+        await server.close()
+    return {"best_us": min(rounds), "mean_us": sum(rounds) / len(rounds), "calls": number * repeat}
+
+
+def bench_fetch(results: dict, skipped: dict, repeat: int, quick: bool) -> None:
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError as err:
+        skipped["fetch_vlagdagen[local]"] = str(err)
+        return
+    results["fetch_vlagdagen[local]"] = asyncio.run(_bench_fetch(repeat, 10 if quick else 50))
+
+
+def bench_entities(results: dict, skipped: dict, repeat: int) -> None:
+    html = PAGES["current"].read_text(encoding="utf-8")
+    calendar = flag_calendar.FlagCalendar(parsing.parse_vlagdagen(html, TODAY))
+    results["day_snapshot"] = measure(
+        lambda: day_snapshot.build_day_snapshot(calendar, NOW, TODAY), repeat
+    )
+
+    try:
+        scraper = load("scraper")
+        sensor = load("sensor")
+        binary_sensor = load("binary_sensor")
+    except ImportError as err:
+        skipped["entity_reads"] = str(err)
+        return
+
+    # the entities exactly as the platforms create them, on a coordinator stand-in
+    # that only carries the day snapshot and the fetcher they read from
+    coordinator = SimpleNamespace(
+        day_snapshot=day_snapshot.build_day_snapshot(calendar, NOW, TODAY),
+        fetcher=scraper.FetchManager(),
+    )
+    hass = SimpleNamespace(data={"vlaginstructie": {"bench": coordinator}})
+    entry = SimpleNamespace(entry_id="bench")
+    entities = []
+    for module in (sensor, binary_sensor):
+        asyncio.run(module.async_setup_entry(hass, entry, entities.extend))
+    reads = [
+        (entity, name)
+        for entity in entities
+        for name in ("name", "unique_id", "state", "is_on", "extra_state_attributes")
+        if hasattr(type(entity), name)
+    ]
+
+    def read_all():
+        for entity, name in reads:
+            getattr(entity, name)
+
+    results["entity_reads"] = measure(read_all, repeat)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return a line for every case that is slower than the baseline allows."""
+    regressions = []
+    for case, base in baseline.get("results", {}).items():
+        current = results.get(case)
+        if current is None:
+            continue
+        limit = base["best_us"] * (1 + threshold)
+        if current["best_us"] > limit:
+            regressions.append(
+                f"{case}: {current['best_us']:.2f} us > {limit:.2f} us "
+                f"(baseline {base['best_us']:.2f} us + {threshold:.0%})"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer rounds, for smoke runs")
+    parser.add_argument("--output", type=Path, help="write the results JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    repeat = 3 if args.quick else REPEAT
+    results: dict = {}
+    skipped: dict = {}
+    bench_pages(results, repeat)
+    bench_fetch(results, skipped, repeat, args.quick)
+    bench_entities(results, skipped, repeat)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+        "skipped": skipped,
+    }
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
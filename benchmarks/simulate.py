@@ -0,0 +1,50 @@
+"""Simulate the integration minute by minute over years on a simulated clock.
+
+Run from the repository root:
+
+    python benchmarks/simulate.py [--start 2026-01-01] [--years 3] [--verify-every 60]
+
+Steps the integration's coordinator and its nine sensor and binary sensor
+entities, on light Home Assistant stand-ins, through every minute of the period
+against a local stand-in for the government page (see tests/simulation.py)
+and prints a JSON report: state transitions per entity, minutes where an entity
+showed a stale value, page requests (200 and 304), parses, refreshes, and CPU
+time per simulated day. Exits with status 1 when any stale minute was found.
+"""
+
+import argparse
+from datetime import date
+import json
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tests"))
+from simulation import simulate  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2026, 1, 1))
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--verify-every", type=int, default=60, help="minutes between checks")
+    parser.add_argument("--transitions", action="store_true", help="list every state transition")
+    args = parser.parse_args()
+
+    end = args.start.replace(year=args.start.year + args.years)
+    report = simulate(args.start, (end - args.start).days, args.verify_every)
+    summary = report.summary()
+    if args.transitions:
+        summary["transition_log"] = [
+            [when.isoformat(), entity_id, old, new] for when, entity_id, old, new in report.transitions
+        ]
+    summary["stale_log"] = [
+        [when.isoformat(), entity_id, shown, expected] for when, entity_id, shown, expected in report.stale
+    ]
+    print(json.dumps(summary, indent=2))
+    if report.stale:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
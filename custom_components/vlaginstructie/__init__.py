@@ -1,28 +1,55 @@
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
+from .const import DOMAIN, STORAGE_KEY, STORAGE_VERSION
 from .coordinator import VlagInstructieDataUpdateCoordinator
+from .services import async_setup_services
+from .views import VlagInstructieIcsView
+from .websocket_api import async_setup_websocket_api
 
-PLATFORMS = ["sensor", "binary_sensor"]
+PLATFORMS = ["sensor", "binary_sensor", "calendar"]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 async def async_setup(hass: HomeAssistant, config: dict):
-    """Set up is not used because this integration uses config flow."""
+    """Set up services, the ICS feed and websocket commands; entities use the config flow."""
+    async_setup_services(hass)
+    hass.http.register_view(VlagInstructieIcsView())
+    async_setup_websocket_api(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up VlagInstructie from a config entry."""
-    coordinator = VlagInstructieDataUpdateCoordinator(hass)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = VlagInstructieDataUpdateCoordinator(hass, entry)
+    # Stale-while-revalidate: entities start from the stored snapshot or the
+    # rule-compiled calendar, the network refresh never blocks setup.
+    if not await coordinator.async_restore_snapshot():
+        coordinator.async_publish_rules_calendar()
+    if coordinator.snapshot_is_stale:
+        coordinator.async_start_background_refresh()
+
+    coordinator.async_start_transitions()
+    entry.async_on_unload(coordinator.async_stop_transitions)
+    entry.async_on_unload(coordinator.async_cancel_retry)
+    entry.async_on_unload(coordinator.profiler.disarm)
+    entry.async_on_unload(coordinator.async_close_archive)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry):
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a VlagInstructie config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -30,3 +57,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove the calendar snapshot of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_remove()
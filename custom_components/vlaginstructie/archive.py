@@ -0,0 +1,271 @@
+"""Append-only SQLite archive of the fetched flag instruction tables."""
+
+from __future__ import annotations
+
+from datetime import date
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import threading
+
+SCHEMA_VERSION = 1
+
+KIND_HALFSTOK = "halfstok"
+KIND_WIMPEL = "wimpel"
+KIND_VLAG = "vlag"
+KINDS = (KIND_HALFSTOK, KIND_WIMPEL, KIND_VLAG)
+GROUPS = ("year", "kind", "name")
+
+# snapshots: every distinct table once, keyed by its content fingerprint
+# observations: appended whenever the fetched table differs from the previous one
+# flag_days: the resolved days of each snapshot
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    first_seen TEXT NOT NULL,
+    days INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshot_years (
+    year INTEGER NOT NULL,
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    PRIMARY KEY (year, snapshot_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    observed_on TEXT NOT NULL,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS observations_snapshot ON observations (snapshot_id);
+CREATE TABLE IF NOT EXISTS flag_days (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    day TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    halfstok INTEGER NOT NULL,
+    wimpel INTEGER NOT NULL,
+    scope TEXT,
+    PRIMARY KEY (snapshot_id, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS flag_days_day ON flag_days (day, snapshot_id);
+CREATE INDEX IF NOT EXISTS flag_days_kind ON flag_days (kind, day);
+"""
+
+# per archived year, the snapshot of the latest observation that covers it
+_CURRENT = """
+current (year, snapshot_id) AS (
+    SELECT y.year, (
+        SELECT o.snapshot_id FROM observations o
+        JOIN snapshot_years sy ON sy.snapshot_id = o.snapshot_id AND sy.year = y.year
+        ORDER BY o.id DESC LIMIT 1
+    )
+    FROM (SELECT DISTINCT year FROM snapshot_years) y
+)
+"""
+
+
+def day_kind(info) -> str:
+    """Return the flag type of a day: halfstok, wimpel or vlag."""
+    if info.get("halfstok"):
+        return KIND_HALFSTOK
+    if info.get("wimpel"):
+        return KIND_WIMPEL
+    return KIND_VLAG
+
+
+def table_fingerprint(vlagdagen) -> str:
+    """Return a SHA-256 fingerprint of the resolved days, independent of key order."""
+    return hashlib.sha256(json.dumps(vlagdagen, sort_keys=True).encode()).hexdigest()
+
+
+class FlagArchive:
+    """
+    Append-only archive of the tables fetch_vlagdagen() returned over time.
+
+    Every distinct table is stored once (deduplicated by content fingerprint) with
+    its resolved days, indexed by date and by flag type. Each time the fetched
+    table differs from the previous one an observation is appended, so the
+    archive shows how the official table changed; a day is resolved from the
+    latest observed table that covers its year. Queries run in SQLite and only
+    return the requested rows.
+
+    All methods block; call them from an executor. They share one connection,
+    opened on first use and serialized with a lock. Closing is final: a closed
+    archive ignores new tables and refuses queries, so an add that was still
+    queued when the entry unloaded cannot reopen the database.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed archive.")
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            # SQLite's lower() only folds ASCII; match names the way get_flag_days does
+            connection.create_function("casefold", 1, str.casefold, deterministic=True)
+            connection.executescript(_SCHEMA)
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            self.closed = True
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def add(self, vlagdagen, observed_on: date, source: str | None = None) -> bool:
+        """
+        Archive a fetched table. Returns True when it differs from the latest
+        observed table and was recorded; an empty table, or any table once the
+        archive is closed, is ignored.
+        """
+        if not vlagdagen:
+            return False
+        fingerprint = table_fingerprint(vlagdagen)
+        with self._lock:
+            if self.closed:
+                return False
+            connection = self._connect()
+            latest = connection.execute(
+                "SELECT s.fingerprint FROM observations o JOIN snapshots s ON s.id = o.snapshot_id"
+                " ORDER BY o.id DESC LIMIT 1"
+            ).fetchone()
+            if latest is not None and latest["fingerprint"] == fingerprint:
+                return False
+
+            with connection:
+                row = connection.execute(
+                    "SELECT id FROM snapshots WHERE fingerprint = ?", (fingerprint,)
+                ).fetchone()
+                if row is not None:
+                    snapshot_id = row["id"]
+                else:
+                    snapshot_id = connection.execute(
+                        "INSERT INTO snapshots (fingerprint, first_seen, days) VALUES (?, ?, ?)",
+                        (fingerprint, observed_on.isoformat(), len(vlagdagen)),
+                    ).lastrowid
+                    connection.executemany(
+                        "INSERT INTO flag_days"
+                        " (snapshot_id, day, year, kind, name, halfstok, wimpel, scope)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (
+                                snapshot_id,
+                                iso_key,
+                                int(iso_key[:4]),
+                                day_kind(info),
+                                info.get("name") or "",
+                                bool(info.get("halfstok")),
+                                bool(info.get("wimpel")),
+                                info.get("scope"),
+                            )
+                            for iso_key, info in sorted(vlagdagen.items())
+                        ],
+                    )
+                    connection.executemany(
+                        "INSERT INTO snapshot_years (year, snapshot_id) VALUES (?, ?)",
+                        [(year, snapshot_id) for year in sorted({int(key[:4]) for key in vlagdagen})],
+                    )
+                connection.execute(
+                    "INSERT INTO observations (snapshot_id, observed_on, source) VALUES (?, ?, ?)",
+                    (snapshot_id, observed_on.isoformat(), source),
+                )
+            return True
+
+    @staticmethod
+    def _filters(start: date, end: date, kind: str | None, name: str | None) -> tuple[str, list]:
+        clauses = ["f.day >= ?", "f.day < ?"]
+        params: list = [start.isoformat(), end.isoformat()]
+        if kind is not None:
+            clauses.append("f.kind = ?")
+            params.append(kind)
+        if name is not None:
+            clauses.append("instr(casefold(f.name), ?) > 0")
+            params.append(name.casefold())
+        return " AND ".join(clauses), params
+
+    def days(self, start: date, end: date, kind: str | None = None, name: str | None = None) -> list[dict]:
+        """
+        Return the resolved archived days from start up to, not including, end,
+        optionally of one flag type or with name in the occasion (case-insensitive).
+        """
+        where, params = self._filters(start, end, kind, name)
+        with self._lock:
+            rows = self._connect().execute(
+                f"WITH {_CURRENT}"
+                " SELECT f.day, f.name, f.halfstok, f.wimpel, f.scope FROM flag_days f"
+                " JOIN current c ON c.snapshot_id = f.snapshot_id AND c.year = f.year"
+                f" WHERE {where} ORDER BY f.day",
+                params,
+            ).fetchall()
+        return [
+            {
+                "date": row["day"],
+                "name": row["name"],
+                "halfstok": bool(row["halfstok"]),
+                "wimpel": bool(row["wimpel"]),
+                "scope": row["scope"],
+            }
+            for row in rows
+        ]
+
+    def counts(
+        self, start: date, end: date, group_by: str = "year", kind: str | None = None, name: str | None = None
+    ) -> dict[str, int]:
+        """Return the number of resolved archived days in the range per year, kind or name."""
+        if group_by not in GROUPS:
+            raise ValueError(f"group_by must be one of {', '.join(GROUPS)}")
+        column = "CAST(f.year AS TEXT)" if group_by == "year" else f"f.{group_by}"
+        where, params = self._filters(start, end, kind, name)
+        with self._lock:
+            rows = self._connect().execute(
+                f"WITH {_CURRENT}"
+                f" SELECT {column} AS grp, COUNT(*) AS n FROM flag_days f"
+                " JOIN current c ON c.snapshot_id = f.snapshot_id AND c.year = f.year"
+                f" WHERE {where} GROUP BY grp ORDER BY grp",
+                params,
+            ).fetchall()
+        return {row["grp"]: row["n"] for row in rows}
+
+    def history(self, day: date) -> list[dict]:
+        """
+        Return the date as it appeared in every observed table covering its year,
+        oldest first; flag_day is None in tables that did not list it.
+        """
+        iso_key = day.isoformat()
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT o.observed_on, o.source, f.name, f.halfstok, f.wimpel, f.scope"
+                " FROM observations o"
+                " JOIN snapshot_years sy ON sy.snapshot_id = o.snapshot_id AND sy.year = ?"
+                " LEFT JOIN flag_days f ON f.snapshot_id = o.snapshot_id AND f.day = ?"
+                " ORDER BY o.id",
+                (day.year, iso_key),
+            ).fetchall()
+        return [
+            {
+                "observed_on": row["observed_on"],
+                "source": row["source"],
+                "flag_day": None
+                if row["name"] is None
+                else {
+                    "date": iso_key,
+                    "name": row["name"],
+                    "halfstok": bool(row["halfstok"]),
+                    "wimpel": bool(row["wimpel"]),
+                    "scope": row["scope"],
+                },
+            }
+            for row in rows
+        ]
@@ -1,17 +1,11 @@
-from datetime import date, datetime, time, timedelta
-
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import ChangeOnlyWriteMixin
 
 
-def _get_info_for_day(day: date, vlagdagen):
-    """Return vlaginfo dict for given day if it exists."""
-    return vlagdagen.get(day.isoformat())
-
-
-class VlagInstructieBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class VlagInstructieBinarySensor(ChangeOnlyWriteMixin, CoordinatorEntity, BinarySensorEntity):
     def __init__(self, coordinator):
         super().__init__(coordinator)
 
@@ -27,10 +21,7 @@ class VlagUithangenToday(VlagInstructieBinarySensor):
 
     @property
     def is_on(self):
-        info = _get_info_for_day(date.today(), self.coordinator.data)
-        if not info:
-            return False
-        return True
+        return self.coordinator.day_snapshot.today.info is not None
 
 
 class VlagHalfstokToday(VlagInstructieBinarySensor):
@@ -44,16 +35,8 @@ class VlagHalfstokToday(VlagInstructieBinarySensor):
 
     @property
     def is_on(self):
-        today = date.today()
-        now = datetime.now()
-        info = _get_info_for_day(today, self.coordinator.data)
-        if not info:
-            return False
-
-        if today.day == 4 and today.month == 5:
-            return now.time() < time(18, 0)
-
-        return info.get("halfstok", False)
+        # includes the 18:00 cutoff on 4 May
+        return self.coordinator.day_snapshot.halfstok_today
 
 
 class OranjeWimpelToday(VlagInstructieBinarySensor):
@@ -67,10 +50,7 @@ class OranjeWimpelToday(VlagInstructieBinarySensor):
 
     @property
     def is_on(self):
-        info = _get_info_for_day(date.today(), self.coordinator.data)
-        if not info:
-            return False
-        return info.get("wimpel", False)
+        return self.coordinator.day_snapshot.today.wimpel
 
 
 class OranjeWimpelTomorrow(VlagInstructieBinarySensor):
@@ -84,11 +64,7 @@ class OranjeWimpelTomorrow(VlagInstructieBinarySensor):
 
     @property
     def is_on(self):
-        tomorrow = date.today() + timedelta(days=1)
-        info = _get_info_for_day(tomorrow, self.coordinator.data)
-        if not info:
-            return False
-        return info.get("wimpel", False)
+        return self.coordinator.day_snapshot.tomorrow.wimpel
 
 
 class VlagUithangenTomorrow(VlagInstructieBinarySensor):
@@ -102,8 +78,7 @@ class VlagUithangenTomorrow(VlagInstructieBinarySensor):
 
     @property
     def is_on(self):
-        tomorrow = date.today() + timedelta(days=1)
-        return bool(_get_info_for_day(tomorrow, self.coordinator.data))
+        return self.coordinator.day_snapshot.tomorrow.info is not None
 
 
 class VlagHalfstokTomorrow(VlagInstructieBinarySensor):
@@ -117,11 +92,7 @@ class VlagHalfstokTomorrow(VlagInstructieBinarySensor):
 
     @property
     def is_on(self):
-        tomorrow = date.today() + timedelta(days=1)
-        info = _get_info_for_day(tomorrow, self.coordinator.data)
-        if not info:
-            return False
-        return info.get("halfstok", False)
+        return self.coordinator.day_snapshot.tomorrow.halfstok
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -0,0 +1,55 @@
+"""Calendar of Dutch flag days, read from the coordinator's event store."""
+
+from datetime import datetime, time, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .entity import ChangeOnlyWriteMixin
+from .event_store import FlagEvent
+
+
+def _calendar_event(event: FlagEvent) -> CalendarEvent:
+    return CalendarEvent(
+        start=event.day,
+        end=event.day + timedelta(days=1),
+        summary=event.name,
+        description=event.description,
+        uid=f"{DOMAIN}-{event.day.isoformat()}",
+    )
+
+
+class VlagInstructieCalendar(ChangeOnlyWriteMixin, CoordinatorEntity, CalendarEntity):
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+
+    @property
+    def name(self):
+        return "vlaginstructie"
+
+    @property
+    def unique_id(self):
+        return "vlaginstructie_calendar"
+
+    @property
+    def event(self):
+        """Return today's flag day, or the next one."""
+        today = self.coordinator.day_snapshot.today.day
+        event = self.coordinator.event_store.next_on_or_after(today)
+        return _calendar_event(event) if event else None
+
+    async def async_get_events(self, hass, start_date: datetime, end_date: datetime):
+        """Return the all-day flag day events overlapping start_date..end_date."""
+        start = dt_util.as_local(start_date).date()
+        end_local = dt_util.as_local(end_date)
+        end = end_local.date()
+        if end_local.time() != time.min:
+            end += timedelta(days=1)
+        return [_calendar_event(event) for event in self.coordinator.event_store.between(start, end)]
+
+
+async def async_setup_entry(hass, entry, async_add_entities):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([VlagInstructieCalendar(coordinator)])
@@ -0,0 +1,86 @@
+"""Compact calendar payloads for frontend cards, serialized once per version."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from .day_snapshot import DaySnapshot
+from .flag_calendar import FlagCalendar
+
+
+def compact_days(calendar: FlagCalendar) -> dict[str, list]:
+    """Return {iso date: [name, UITHANGEN/HALFSTOK/WIMPEL bits]} for every flag day."""
+    return {
+        day.isoformat(): [calendar.info(day).get("name"), calendar.flags(day)]
+        for day in calendar.dates
+    }
+
+
+def day_state(snapshot: DaySnapshot) -> dict:
+    """Return the part of the day snapshot that changes at transitions."""
+    next_flag_day = snapshot.next_flag_day
+    return {
+        "today": snapshot.today.day.isoformat(),
+        "halfstok_today": snapshot.halfstok_today,
+        "next_flag_day": next_flag_day.day.isoformat() if next_flag_day else None,
+        "data_age_days": snapshot.data_age_days,
+    }
+
+
+def diff_days(old: dict[str, list], new: dict[str, list]) -> tuple[dict[str, list], list[str]]:
+    """Return (added or changed days, removed dates) going from old to new."""
+    changed = {iso: entry for iso, entry in new.items() if old.get(iso) != entry}
+    removed = sorted(iso for iso in old if iso not in new)
+    return changed, removed
+
+
+class CalendarPublisher:
+    """
+    Versioned calendar payloads shared by all websocket clients.
+
+    update() is called whenever the coordinator notifies its listeners. When the
+    calendar or the day state changed it bumps the version and serializes the diff
+    once; every subscriber is sent the same bytes. The full payload for new clients
+    is serialized at most once per version.
+    """
+
+    def __init__(self, dumps: Callable[[object], bytes]) -> None:
+        """dumps serializes a payload to JSON bytes."""
+        self._dumps = dumps
+        self.version = 0
+        self._calendar: FlagCalendar | None = None
+        self._days: dict[str, list] = {}
+        self._day: dict | None = None
+        self._full: bytes | None = None
+
+    def update(self, calendar: FlagCalendar, snapshot: DaySnapshot) -> bytes | None:
+        """Return the serialized diff for a new version, or None when nothing changed."""
+        payload = {}
+        if calendar is not self._calendar:
+            days = compact_days(calendar)
+            changed, removed = diff_days(self._days, days)
+            self._calendar = calendar
+            self._days = days
+            if changed or removed:
+                payload["set"] = changed
+                payload["removed"] = removed
+        day = day_state(snapshot)
+        if day != self._day:
+            self._day = day
+            payload["day"] = day
+        if not payload:
+            return None
+
+        self.version += 1
+        self._full = None
+        payload["version"] = self.version
+        return self._dumps(payload)
+
+    @property
+    def full(self) -> bytes:
+        """Return the serialized current version: all days plus the day state."""
+        if self._full is None:
+            self._full = self._dumps(
+                {"version": self.version, "days": self._days, "day": self._day}
+            )
+        return self._full
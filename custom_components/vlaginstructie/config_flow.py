@@ -1,7 +1,10 @@
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig, TextSelectorType
 
-from .const import DOMAIN
+from .const import CONF_HORIZON_YEARS, CONF_SOURCES, DEFAULT_HORIZON_YEARS, DOMAIN
+from .scraper import URL
 
 
 class VlaginstructieConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -16,17 +19,32 @@ class VlaginstructieConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(title="Vlaginstructie Nederland", data={})
         return self.async_show_form(step_id="user", data_schema=vol.Schema({}))
 
-    async def async_get_options_flow(self, config_entry):
-        return VlaginstructieOptionsFlowHandler(config_entry)
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return VlaginstructieOptionsFlowHandler()
 
 
 class VlaginstructieOptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options for VlagInstructie."""
 
-    def __init__(self, config_entry):
-        self.config_entry = config_entry
-
     async def async_step_init(self, user_input=None):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
-        return self.async_show_form(step_id="init", data_schema=vol.Schema({}))
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_HORIZON_YEARS,
+                        default=options.get(CONF_HORIZON_YEARS, DEFAULT_HORIZON_YEARS),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+                    vol.Optional(
+                        CONF_SOURCES,
+                        default=options.get(CONF_SOURCES, [URL]),
+                    ): TextSelector(TextSelectorConfig(type=TextSelectorType.URL, multiple=True)),
+                }
+            ),
+        )
@@ -1,3 +1,17 @@
 """Constants for the Vlaginstructie integration."""
 
 DOMAIN = "vlaginstructie"
+
+# On-disk snapshot of the parsed flag calendar (homeassistant.helpers.storage).
+STORAGE_KEY = f"{DOMAIN}.calendar"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+# Append-only SQLite archive of every fetched table, in the config directory.
+ARCHIVE_FILE = f"{DOMAIN}_archive.db"
+
+# Options
+CONF_HORIZON_YEARS = "horizon_years"
+DEFAULT_HORIZON_YEARS = 5
+# ordered URLs of the government page, copies of it or JSON exports of the calendar
+CONF_SOURCES = "sources"
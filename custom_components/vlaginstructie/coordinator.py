@@ -1,31 +1,328 @@
 """Data coordinator for the Vlaginstructie integration."""
 
-from datetime import timedelta
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
 import logging
+import sqlite3
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later, async_track_point_in_utc_time
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
-from .scraper import fetch_vlagdagen
+from .const import (
+    ARCHIVE_FILE,
+    CONF_HORIZON_YEARS,
+    CONF_SOURCES,
+    DEFAULT_HORIZON_YEARS,
+    DOMAIN,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .archive import FlagArchive
+from .calendar_payload import CalendarPublisher
+from .day_snapshot import DaySnapshot, build_day_snapshot
+from .event_store import FlagEventStore
+from .flag_calendar import FlagCalendar
+from .ics import IcsFeed
+from .profiler import RefreshProfiler
+from .rules import compile_calendar, merge_calendars
+from .scheduler import next_transition
+from .scraper import FetchManager
 
 _LOGGER = logging.getLogger(__name__)
 
-UPDATE_INTERVAL = timedelta(minutes=5)
+# Remote data changes a few times a year and the scraper only goes to the network
+# on the first of the month; entity values change at the transitions set below.
+UPDATE_INTERVAL = timedelta(hours=6)
 
 
-class VlagInstructieDataUpdateCoordinator(DataUpdateCoordinator):
+class VlagInstructieDataUpdateCoordinator(DataUpdateCoordinator[FlagCalendar]):
     """Coordinate fetching Dutch flag instruction data."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=entry,
             name=DOMAIN,
             update_interval=UPDATE_INTERVAL,
+            # an identical calendar does not notify the entities
+            always_update=False,
         )
+        # per-entry cache state; overlapping refreshes share one in-flight fetch
+        # over Home Assistant's pooled session
+        self.fetcher = FetchManager(
+            session=async_get_clientsession(hass),
+            today=self._today,
+            sources=[url.strip() for url in entry.options.get(CONF_SOURCES, []) if url.strip()],
+        )
+        # current aware local time; replaceable to run the coordinator on a simulated clock
+        self.now: Callable[[], datetime] = dt_util.now
+        # runs the parse stage off the event loop; wrapped while the profiler is armed
+        self.parse_executor = hass.async_add_executor_job
+        self.profiler = RefreshProfiler(self)
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}")
+        # history of every fetched table; blocking, only used from the executor
+        self.archive = FlagArchive(hass.config.path(ARCHIVE_FILE))
+        self._saved_update = None
+        self._unsub_transition: CALLBACK_TYPE | None = None
+        self._unsub_retry: CALLBACK_TYPE | None = None
+        self._day_snapshot: DaySnapshot | None = None
+        self._event_store: FlagEventStore | None = None
+        self._ics_feed: IcsFeed | None = None
+        # websocket payloads, serialized once per version for all subscribers
+        self.publisher = CalendarPublisher(json_bytes)
+        self._calendar_subscribers: list[Callable[[bytes], None]] = []
+        # diagnostic sensors; updated after every refresh without touching the others
+        self._metrics_listeners: list[CALLBACK_TYPE] = []
+        self._raw_data = None
+        self._calendar_year = None
+        self.horizon_years = entry.options.get(CONF_HORIZON_YEARS, DEFAULT_HORIZON_YEARS)
+        self.unchanged_refreshes = 0
+        # entity state writes skipped because nothing changed, see entity.py
+        self.avoided_state_writes = 0
+
+    def _today(self) -> date:
+        return self.now().date()
+
+    @property
+    def day_snapshot(self) -> DaySnapshot:
+        """Return the resolved view of today, tomorrow and the next flag day."""
+        snapshot = self._day_snapshot
+        if snapshot is None or snapshot.source is not self.data:
+            snapshot = self._async_rebuild_day_snapshot()
+        return snapshot
+
+    @property
+    def event_store(self) -> FlagEventStore:
+        """Return the range-indexed events of the current calendar for the calendar entity."""
+        store = self._event_store
+        if store is None or store.calendar is not self.data:
+            store = self._event_store = FlagEventStore(self.data)
+        return store
+
+    @property
+    def ics_feed(self) -> IcsFeed:
+        """Return the iCalendar feed of the current calendar, rendered once per data change."""
+        feed = self._ics_feed
+        if feed is None or feed.source is not self.data:
+            stamp = self.fetcher.cache["last_update"] or date(self._calendar_year, 1, 1)
+            feed = self._ics_feed = IcsFeed(self.data, stamp)
+        return feed
+
+    @callback
+    def _async_rebuild_day_snapshot(self) -> DaySnapshot:
+        self._day_snapshot = build_day_snapshot(
+            self.data, self.now(), self.fetcher.cache["last_update"]
+        )
+        return self._day_snapshot
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Rebuild the day snapshot, then update all registered listeners."""
+        self._async_rebuild_day_snapshot()
+        self._async_publish_calendar()
+        super().async_update_listeners()
+
+    @property
+    def calendar_payload(self) -> bytes:
+        """Return the serialized compact calendar and day state for a new client."""
+        if not self.publisher.version:
+            # nothing published yet, so no subscriber has missed a diff
+            self.publisher.update(self.data, self.day_snapshot)
+        return self.publisher.full
+
+    @callback
+    def _async_publish_calendar(self) -> None:
+        """Send the diff of a new payload version to every subscriber."""
+        diff = self.publisher.update(self.data, self.day_snapshot)
+        if diff is not None:
+            for send in tuple(self._calendar_subscribers):
+                send(diff)
+
+    @callback
+    def async_subscribe_calendar(self, send: Callable[[bytes], None]) -> CALLBACK_TYPE:
+        """Call send with the serialized diff of every new payload version."""
+        self._calendar_subscribers.append(send)
+
+        @callback
+        def unsubscribe() -> None:
+            self._calendar_subscribers.remove(send)
+
+        return unsubscribe
+
+    @callback
+    def async_start_transitions(self) -> None:
+        """Update the entities at every moment their value can change."""
+        self.async_stop_transitions()
+        point = next_transition(self.now())
+        _LOGGER.debug("Next entity transition at %s", point.isoformat())
+        self._unsub_transition = async_track_point_in_utc_time(
+            self.hass, self._async_handle_transition, dt_util.as_utc(point)
+        )
+
+    @callback
+    def async_stop_transitions(self) -> None:
+        """Cancel the pending transition timer."""
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+
+    @callback
+    def _async_handle_transition(self, _now) -> None:
+        """Push the new day (or the half-mast cutoff) to the entities."""
+        self._unsub_transition = None
+        self.async_start_transitions()
+        self.async_update_listeners()
+
+    @callback
+    def async_add_metrics_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback after every refresh, also when the calendar did not change."""
+        self._metrics_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._metrics_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_update_metrics_listeners(self) -> None:
+        for update_callback in tuple(self._metrics_listeners):
+            update_callback()
+
+    @property
+    def breaker_state(self) -> str:
+        """Return the fetch circuit breaker state: closed, open or half_open."""
+        return self.fetcher.breaker.state
+
+    @callback
+    def _async_schedule_retry(self) -> None:
+        """Retry a failed fetch after the backoff delay instead of waiting for the next poll."""
+        self.async_cancel_retry()
+        delay = self.fetcher.breaker.retry_in()
+        if delay is None:
+            return
+        _LOGGER.debug("Fetch failed, retrying in %.0f s (circuit %s)", delay, self.breaker_state)
+        self._unsub_retry = async_call_later(self.hass, delay, self._async_handle_retry)
+
+    @callback
+    def async_cancel_retry(self) -> None:
+        """Cancel the pending retry timer."""
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
+
+    @callback
+    def _async_handle_retry(self, _now) -> None:
+        self._unsub_retry = None
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_refresh(), f"{DOMAIN}_retry"
+        )
+
+    def _build_calendar(self, raw) -> FlagCalendar:
+        """Index the rule-compiled calendar, patched with the scraped days."""
+        year = self.now().year
+        compiled = compile_calendar(year, year + self.horizon_years - 1)
+        merged, mismatches = merge_calendars(compiled, raw)
+        if mismatches:
+            _LOGGER.warning(
+                "Flag instruction rules and the scraped table differ on %d days; "
+                "rule days the table does not move elsewhere are kept",
+                mismatches,
+            )
+        self._raw_data = raw
+        self._calendar_year = year
+        return FlagCalendar(merged)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the on-disk calendar snapshot and publish it as coordinator data."""
+        snapshot = await self._store.async_load()
+        if not self.fetcher.restore_cache(snapshot):
+            return False
+
+        self._saved_update = self.fetcher.cache["last_update"]
+        self.async_set_updated_data(self._build_calendar(self.fetcher.cache["vlagdagen"]))
+        self._async_archive()
+        return True
+
+    @callback
+    def _async_archive(self) -> None:
+        """Append the fetched table to the archive without holding up the refresh."""
+        cache = self.fetcher.cache
+        if not cache["vlagdagen"]:
+            return
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_add_to_archive(cache["vlagdagen"], cache["last_update"], cache["source"]),
+            f"{DOMAIN}_archive",
+        )
+
+    async def _async_add_to_archive(self, vlagdagen, observed_on: date, source: str | None) -> None:
+        try:
+            added = await self.hass.async_add_executor_job(self.archive.add, vlagdagen, observed_on, source)
+        except sqlite3.Error as err:
+            _LOGGER.warning("Could not archive the flag instruction table: %s", err)
+            return
+        if added:
+            _LOGGER.debug("Archived a changed flag instruction table observed on %s", observed_on)
+
+    async def async_close_archive(self) -> None:
+        """Close the archive database for good; a table still being archived is dropped."""
+        await self.hass.async_add_executor_job(self.archive.close)
+
+    @callback
+    def async_publish_rules_calendar(self) -> None:
+        """Publish the rule-compiled calendar while no fetched data is available."""
+        self.async_set_updated_data(self._build_calendar({}))
+
+    @callback
+    def async_start_background_refresh(self) -> None:
+        """Fetch from the network without holding up setup; entities update when it lands."""
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_refresh(), f"{DOMAIN}_refresh"
+        )
+
+    @property
+    def snapshot_is_stale(self) -> bool:
+        """Return True when the cached calendar should be refreshed from the network."""
+        return self.fetcher.cache_is_stale()
+
+    async def _async_update_data(self) -> FlagCalendar:
+        """Fetch the latest flag instruction data and index it."""
+        raw = await self.fetcher.async_fetch(self.parse_executor)
+        self._async_update_metrics_listeners()
+        if self.fetcher.breaker.failures:
+            self._async_schedule_retry()
+        else:
+            self.async_cancel_retry()
+        last_update = self.fetcher.cache["last_update"]
+        fetched = last_update != self._saved_update
+        if fetched:
+            self._saved_update = last_update
+            self._store.async_delay_save(self.fetcher.export_cache, STORAGE_SAVE_DELAY)
+            self._async_archive()
+
+        if (
+            raw is self._raw_data
+            and self._calendar_year == self.now().year
+            and self.data is not None
+        ):
+            self.unchanged_refreshes += 1
+            _LOGGER.debug(
+                "Calendar unchanged, skipped entity updates for %d refreshes",
+                self.unchanged_refreshes,
+            )
+            if fetched:
+                # same calendar, but the data age shown by the sensors changed
+                self.async_update_listeners()
+            return self.data
 
-    async def _async_update_data(self):
-        """Fetch the latest flag instruction data."""
-        return await fetch_vlagdagen()
+        return self._build_calendar(raw)
@@ -0,0 +1,112 @@
+"""Per-day view of the flag calendar shared by all Vlaginstructie entities."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+
+from .flag_calendar import FlagCalendar
+from .scheduler import halfstok_cutoff, next_transition
+
+
+@dataclass(frozen=True, slots=True)
+class DayInfo:
+    """Resolved flag instruction for one date."""
+
+    day: date
+    info: Mapping | None
+    attributes: Mapping
+
+    @property
+    def name(self) -> str | None:
+        """Return the occasion, or None on days without a flag instruction."""
+        return self.info.get("name") if self.info else None
+
+    @property
+    def halfstok(self) -> bool:
+        """Return True when the flag goes at half-mast on this date."""
+        return bool(self.info and self.info.get("halfstok", False))
+
+    @property
+    def wimpel(self) -> bool:
+        """Return True when the orange pennant is used on this date."""
+        return bool(self.info and self.info.get("wimpel", False))
+
+
+@dataclass(frozen=True, slots=True)
+class DaySnapshot:
+    """
+    Immutable view of the calendar for one moment, built by the coordinator on data
+    changes and at every transition so that all entities agree on "today".
+    """
+
+    source: FlagCalendar
+    today: DayInfo
+    tomorrow: DayInfo
+    next_flag_day: DayInfo | None
+    halfstok_cutoff: datetime | None
+    halfstok_today: bool
+    valid_until: datetime
+    # last day the government page was fetched or confirmed; None while the
+    # calendar only comes from the rules
+    fetched_on: date | None
+    data_age_days: int | None
+
+
+def _attributes(day: date, info, freshness: dict) -> Mapping:
+    """Return the entity attributes for a date, as exposed by the sensors."""
+    if not info:
+        return MappingProxyType({"date": day.isoformat(), **freshness})
+    return MappingProxyType(
+        {
+            "reason": info.get("name"),
+            "date": day.isoformat(),
+            "scope": info.get("scope"),
+            "wimpel": info.get("wimpel"),
+            "halfstok": info.get("halfstok"),
+            **freshness,
+        }
+    )
+
+
+def _day_info(day: date, info, freshness: dict) -> DayInfo:
+    return DayInfo(day, MappingProxyType(info) if info else None, _attributes(day, info, freshness))
+
+
+def build_day_snapshot(vlagdagen, now: datetime, fetched_on: date | None = None) -> DaySnapshot:
+    """
+    Resolve today, tomorrow and the next flag day for an aware local datetime.
+    vlagdagen is a FlagCalendar; plain ISO-date mappings are indexed first.
+    fetched_on is the date of the last successful fetch, exposed as data age.
+    """
+    if not isinstance(vlagdagen, FlagCalendar):
+        vlagdagen = FlagCalendar(vlagdagen)
+    data_age_days = (now.date() - fetched_on).days if fetched_on else None
+    freshness = {
+        "data_fetched": fetched_on.isoformat() if fetched_on else None,
+        "data_age_days": data_age_days,
+    }
+    today = _day_info(now.date(), vlagdagen.info(now.date()), freshness)
+    tomorrow = today.day + timedelta(days=1)
+    upcoming = vlagdagen.next_on_or_after(today.day)
+    cutoff = halfstok_cutoff(today.day, now.tzinfo)
+    if not today.info:
+        halfstok_today = False
+    elif cutoff is not None:
+        halfstok_today = now < cutoff
+    else:
+        halfstok_today = today.halfstok
+
+    return DaySnapshot(
+        source=vlagdagen,
+        today=today,
+        tomorrow=_day_info(tomorrow, vlagdagen.info(tomorrow), freshness),
+        next_flag_day=_day_info(*upcoming, freshness) if upcoming else None,
+        halfstok_cutoff=cutoff,
+        halfstok_today=halfstok_today,
+        valid_until=next_transition(now),
+        fetched_on=fetched_on,
+        data_age_days=data_age_days,
+    )
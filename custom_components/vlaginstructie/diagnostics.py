@@ -0,0 +1,36 @@
+"""Diagnostics support for Vlaginstructie."""
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return fetch metrics, cache state and coordinator state for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    fetcher = coordinator.fetcher
+    cache = fetcher.cache
+    return {
+        "options": dict(entry.options),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "unchanged_refreshes": coordinator.unchanged_refreshes,
+            "avoided_state_writes": coordinator.avoided_state_writes,
+            "horizon_years": coordinator.horizon_years,
+            "calendar_days": len(coordinator.data) if coordinator.data is not None else None,
+            "circuit": coordinator.breaker_state,
+        },
+        "cache": {
+            "days": len(cache["vlagdagen"]),
+            "last_update": cache["last_update"].isoformat() if cache["last_update"] else None,
+            "etag": cache["etag"],
+            "last_modified": cache["last_modified"],
+            "body_size": cache["body_size"],
+            "source": cache["source"],
+            "stale": fetcher.cache_is_stale(coordinator.now().date()),
+        },
+        "fetch_stats": fetcher.get_fetch_stats(),
+        "metrics": fetcher.metrics.as_dict(),
+    }
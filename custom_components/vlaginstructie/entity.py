@@ -0,0 +1,39 @@
+"""Shared entity behaviour for Vlaginstructie."""
+
+from homeassistant.core import callback
+
+
+class ChangeOnlyWriteMixin:
+    """
+    Skip state writes that would not change the entity's state or attributes.
+
+    Most coordinator updates and transitions leave most entities as they were;
+    writing them anyway still serializes and compares the attributes in the state
+    machine and fires an event. The entity remembers what it last wrote, whoever
+    wrote it (the platform, a coordinator update or the calendar's own alarms),
+    and counts the writes it skipped on coordinator.avoided_state_writes.
+    """
+
+    _last_written: tuple | None = None
+
+    def _state_key(self) -> tuple:
+        return (self.available, self.state, self.state_attributes, self.extra_state_attributes)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._last_written = self._state_key()
+        super().async_write_ha_state()
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        """Write the state unless it equals the last written one."""
+        key = self._state_key()
+        if key == self._last_written:
+            self.coordinator.avoided_state_writes += 1
+            return
+        self._last_written = key
+        super().async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self.async_write_ha_state_if_changed()
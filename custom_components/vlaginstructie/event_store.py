@@ -0,0 +1,155 @@
+"""Range-indexed flag day events for the calendar platform."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+
+from .flag_calendar import FlagCalendar
+from .rules import compile_year
+
+# Later years are compiled lazily up to this one; the rules mean nothing far ahead
+MAX_YEAR = 2999
+
+# Memoized get_flag_days matches per store, least recently used evicted first
+QUERY_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True, slots=True)
+class FlagEvent:
+    """One all-day flag day event."""
+
+    day: date
+    name: str
+    halfstok: bool = False
+    wimpel: bool = False
+    scope: str = "all"
+
+    @classmethod
+    def from_info(cls, day: date, info) -> FlagEvent:
+        """Build an event from a calendar info dict."""
+        return cls(
+            day,
+            info.get("name") or "Flag day",
+            bool(info.get("halfstok", False)),
+            bool(info.get("wimpel", False)),
+            info.get("scope", "all"),
+        )
+
+    def as_dict(self) -> dict:
+        """Return the event as a service response item."""
+        return {
+            "date": self.day.isoformat(),
+            "name": self.name,
+            "halfstok": self.halfstok,
+            "wimpel": self.wimpel,
+            "scope": self.scope,
+        }
+
+    @property
+    def description(self) -> str:
+        """Return how the flag is flown on this day."""
+        if self.halfstok:
+            text = "Flag at half-mast until 18:00."
+        else:
+            text = "Fly the flag."
+        if self.wimpel:
+            text += " Add the orange pennant."
+        if self.scope != "all":
+            text += f" Applies to: {self.scope}."
+        return text
+
+
+class FlagEventStore:
+    """
+    Flag day events indexed per year for range queries.
+
+    Years covered by the coordinator's calendar come from it; any later year is
+    compiled from the rules the first time it is asked for. Years before the first
+    covered one have no events: today's rules say nothing about past flag days,
+    which get_archived_flag_days answers from the archive. Each year is kept as a
+    sorted date tuple with the matching events, so a range query bisects its first
+    and last year and slices the years in between.
+
+    A store belongs to one calendar object; the coordinator replaces it when new
+    data arrives, which also drops the memoized query responses.
+    """
+
+    __slots__ = ("calendar", "first_year", "_covered", "_years", "_queries", "query_hits")
+
+    def __init__(self, calendar: FlagCalendar) -> None:
+        """Index the events of a flag calendar."""
+        self.calendar = calendar
+        self._covered = frozenset(day.year for day in calendar.dates)
+        self.first_year = min(self._covered) if self._covered else date.today().year
+        self._years: dict[int, tuple[tuple[date, ...], tuple[FlagEvent, ...]]] = {}
+        self._queries: OrderedDict[tuple, tuple[FlagEvent, ...]] = OrderedDict()
+        self.query_hits = 0
+
+    def _year(self, year: int) -> tuple[tuple[date, ...], tuple[FlagEvent, ...]]:
+        indexed = self._years.get(year)
+        if indexed is None:
+            if year in self._covered:
+                pairs = self.calendar.between(date(year, 1, 1), date(year + 1, 1, 1))
+            else:
+                pairs = sorted(
+                    (date.fromisoformat(iso_key), info)
+                    for iso_key, info in compile_year(year).items()
+                )
+            events = tuple(FlagEvent.from_info(day, info) for day, info in pairs)
+            indexed = self._years[year] = (tuple(event.day for event in events), events)
+        return indexed
+
+    def between(self, start: date, end: date) -> list[FlagEvent]:
+        """Return the events for start <= day < end in ascending order."""
+        result: list[FlagEvent] = []
+        for year in range(max(start.year, self.first_year), min(end.year, MAX_YEAR) + 1):
+            days, events = self._year(year)
+            lo = bisect_left(days, start) if year == start.year else 0
+            hi = bisect_left(days, end, lo) if year == end.year else len(days)
+            result.extend(events[lo:hi])
+        return result
+
+    def next_on_or_after(self, day: date) -> FlagEvent | None:
+        """Return the first event on or after day, or None."""
+        for year in range(max(day.year, self.first_year), MAX_YEAR + 1):
+            days, events = self._year(year)
+            index = bisect_left(days, day)
+            if index < len(days):
+                return events[index]
+        return None
+
+    def query(
+        self,
+        start: date,
+        end: date,
+        halfstok: bool | None = None,
+        wimpel: bool | None = None,
+        name: str | None = None,
+    ) -> list[dict]:
+        """
+        Return the events for start <= day < end as dicts, filtered on the half-mast
+        and pennant flags and on a case-insensitive part of the name. The matching
+        events are memoized per range and filters; every call gets fresh dicts, so
+        callers may change the response.
+        """
+        needle = name.casefold() if name else None
+        key = (start, end, halfstok, wimpel, needle)
+        queries = self._queries
+        events = queries.get(key)
+        if events is not None:
+            queries.move_to_end(key)
+            self.query_hits += 1
+        else:
+            events = queries[key] = tuple(
+                event
+                for event in self.between(start, end)
+                if (halfstok is None or event.halfstok == halfstok)
+                and (wimpel is None or event.wimpel == wimpel)
+                and (needle is None or needle in event.name.casefold())
+            )
+            if len(queries) > QUERY_CACHE_SIZE:
+                queries.popitem(last=False)
+        return [event.as_dict() for event in events]
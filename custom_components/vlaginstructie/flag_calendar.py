@@ -0,0 +1,103 @@
+"""Indexed flag calendar built once from the scraper's ISO-date dict."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator, Mapping
+from datetime import date
+from types import MappingProxyType
+
+# day-of-year flag bits
+UITHANGEN = 1
+HALFSTOK = 2
+WIMPEL = 4
+
+
+class FlagCalendar(Mapping):
+    """
+    Read-only calendar of flag days.
+
+    Behaves as the original mapping of ISO date strings to info dicts, so existing
+    consumers keep working, and adds indexed lookups: info(day) and flags(day) are
+    O(1) through a date dict and a per-year day-of-year bitmap, next_on_or_after()
+    and between() are O(log n) through a sorted date array.
+    """
+
+    __slots__ = ("_source", "_by_date", "_dates", "_bitmaps")
+
+    def __init__(self, vlagdagen: Mapping | None = None) -> None:
+        """Index a mapping of 'YYYY-MM-DD' -> info; invalid keys are skipped."""
+        self._source = MappingProxyType(dict(vlagdagen or {}))
+        self._by_date: dict[date, Mapping] = {}
+        self._bitmaps: dict[int, bytearray] = {}
+        for iso_key, info in self._source.items():
+            try:
+                day = date.fromisoformat(iso_key)
+            except (TypeError, ValueError):
+                continue
+            self._by_date[day] = info
+            bits = UITHANGEN
+            if info.get("halfstok"):
+                bits |= HALFSTOK
+            if info.get("wimpel"):
+                bits |= WIMPEL
+            bitmap = self._bitmaps.get(day.year)
+            if bitmap is None:
+                bitmap = self._bitmaps[day.year] = bytearray(367)
+            bitmap[day.timetuple().tm_yday] = bits
+        self._dates = tuple(sorted(self._by_date))
+
+    # ---------- mapping view ----------
+    def __getitem__(self, iso_key: str) -> Mapping:
+        return self._source[iso_key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FlagCalendar):
+            return self._source is other._source or self._source == other._source
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"<FlagCalendar {len(self._dates)} days>"
+
+    def as_dict(self) -> dict:
+        """Return a plain dict copy, e.g. for storage."""
+        return dict(self._source)
+
+    # ---------- indexed lookups ----------
+    @property
+    def dates(self) -> tuple[date, ...]:
+        """Return all flag days in ascending order."""
+        return self._dates
+
+    def info(self, day: date) -> Mapping | None:
+        """Return the info for a date, or None on days without a flag instruction."""
+        return self._by_date.get(day)
+
+    def flags(self, day: date) -> int:
+        """Return the UITHANGEN/HALFSTOK/WIMPEL bits for a date."""
+        bitmap = self._bitmaps.get(day.year)
+        if bitmap is None:
+            return 0
+        return bitmap[day.timetuple().tm_yday]
+
+    def next_on_or_after(self, day: date) -> tuple[date, Mapping] | None:
+        """Return (date, info) of the first flag day on or after day, or None."""
+        index = bisect_left(self._dates, day)
+        if index == len(self._dates):
+            return None
+        found = self._dates[index]
+        return found, self._by_date[found]
+
+    def between(self, start: date, end: date) -> list[tuple[date, Mapping]]:
+        """Return (date, info) pairs for start <= date < end in ascending order."""
+        lo = bisect_left(self._dates, start)
+        hi = bisect_left(self._dates, end, lo)
+        return [(day, self._by_date[day]) for day in self._dates[lo:hi]]
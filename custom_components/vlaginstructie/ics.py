@@ -0,0 +1,94 @@
+"""iCalendar (RFC 5545) rendering of the flag calendar."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+import hashlib
+
+from .flag_calendar import FlagCalendar
+
+PRODID = "-//Vlaginstructie Nederland//Home Assistant//NL"
+CALENDAR_NAME = "Vlaginstructie"
+# content lines are folded at 75 octets
+LINE_LIMIT = 75
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> bytes:
+    """Return one content line, folded at LINE_LIMIT octets without splitting characters."""
+    raw = line.encode("utf-8")
+    if len(raw) <= LINE_LIMIT:
+        return raw + b"\r\n"
+    parts = []
+    limit = LINE_LIMIT
+    while raw:
+        cut = min(limit, len(raw))
+        # do not cut inside a UTF-8 sequence
+        while cut < len(raw) and raw[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(raw[:cut])
+        raw = raw[cut:]
+        # continuation lines start with a space
+        limit = LINE_LIMIT - 1
+    return b"\r\n ".join(parts) + b"\r\n"
+
+
+def _description(info) -> str:
+    if info.get("halfstok"):
+        text = "Flag at half-mast until 18:00."
+    else:
+        text = "Fly the flag."
+    if info.get("wimpel"):
+        text += " Add the orange pennant."
+    scope = info.get("scope")
+    if scope and scope != "all":
+        text += f" Applies to: {scope}."
+    return text
+
+
+def render_ics(calendar: FlagCalendar, stamp: date) -> bytes:
+    """
+    Render every flag day as an all-day VEVENT. stamp is used as DTSTAMP, so the same
+    calendar and stamp always render to the same bytes.
+    """
+    dtstamp = f"{stamp:%Y%m%d}T000000Z"
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{CALENDAR_NAME}",
+    ]
+    for day in calendar.dates:
+        info = calendar.info(day)
+        lines += (
+            "BEGIN:VEVENT",
+            f"UID:{day.isoformat()}@vlaginstructie",
+            f"DTSTAMP:{dtstamp}",
+            f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+            f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+            f"SUMMARY:{_escape(info.get('name') or 'Flag day')}",
+            f"DESCRIPTION:{_escape(_description(info))}",
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        )
+    lines.append("END:VCALENDAR")
+    return b"".join(_fold(line) for line in lines)
+
+
+class IcsFeed:
+    """Rendered feed bytes with a strong ETag, built once per calendar object."""
+
+    __slots__ = ("source", "body", "etag")
+
+    def __init__(self, calendar: FlagCalendar, stamp: date) -> None:
+        """Render the calendar and fingerprint the result."""
+        self.source = calendar
+        self.body = render_ics(calendar, stamp)
+        self.etag = hashlib.sha256(self.body).hexdigest()[:32]
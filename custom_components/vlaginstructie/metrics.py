@@ -0,0 +1,107 @@
+"""Bounded fetch and parse metrics for diagnostics."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timezone
+import math
+
+# samples kept per metric; older samples are dropped
+METRICS_WINDOW = 50
+
+
+class RollingWindow:
+    """The last size samples of one metric."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, size: int = METRICS_WINDOW) -> None:
+        self._values: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: float) -> None:
+        self._values.append(value)
+
+    @property
+    def last(self) -> float | None:
+        return self._values[-1] if self._values else None
+
+    @property
+    def mean(self) -> float | None:
+        return sum(self._values) / len(self._values) if self._values else None
+
+    def summary(self) -> dict:
+        """Return count, last, mean, 95th percentile and max over the window."""
+        values = sorted(self._values)
+        if not values:
+            return {"count": 0, "last": None, "mean": None, "p95": None, "max": None}
+        return {
+            "count": len(values),
+            "last": self._values[-1],
+            "mean": sum(values) / len(values),
+            "p95": values[max(math.ceil(len(values) * 0.95) - 1, 0)],
+            "max": values[-1],
+        }
+
+
+class FetchMetrics:
+    """
+    Timings and counters of one FetchManager.
+
+    Latency, size and parse duration keep a rolling window of samples; the row and
+    cache counters are running totals since startup.
+    """
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self.http_latency_ms = RollingWindow(window)
+        self.bytes_received = RollingWindow(window)
+        self.parse_ms = RollingWindow(window)
+        self.rows_parsed = 0
+        self.rows_skipped = 0
+        self.cache_hits = 0
+        self.fetches = 0
+        self.last_success: datetime | None = None
+        self.last_failure: datetime | None = None
+        self.last_error: str | None = None
+
+    def record_response(self, latency: float, wire_size: int) -> None:
+        """Record a completed HTTP request; latency in seconds."""
+        self.fetches += 1
+        self.http_latency_ms.add(latency * 1000)
+        self.bytes_received.add(wire_size)
+
+    def record_parse(self, seconds: float, rows_parsed: int, rows_skipped: int) -> None:
+        self.parse_ms.add(seconds * 1000)
+        self.rows_parsed += rows_parsed
+        self.rows_skipped += rows_skipped
+
+    def record_success(self) -> None:
+        self.last_success = datetime.now(timezone.utc)
+
+    def record_failure(self, error: str) -> None:
+        self.last_failure = datetime.now(timezone.utc)
+        self.last_error = error
+
+    @property
+    def cache_hit_ratio(self) -> float | None:
+        """Return the share of refreshes answered from the cache without a request."""
+        total = self.cache_hits + self.fetches
+        return self.cache_hits / total if total else None
+
+    def as_dict(self) -> dict:
+        """Return all metrics as a JSON-serializable dict."""
+        return {
+            "http_latency_ms": self.http_latency_ms.summary(),
+            "bytes_received": self.bytes_received.summary(),
+            "parse_ms": self.parse_ms.summary(),
+            "rows_parsed": self.rows_parsed,
+            "rows_skipped": self.rows_skipped,
+            "cache_hits": self.cache_hits,
+            "fetches": self.fetches,
+            "cache_hit_ratio": self.cache_hit_ratio,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_failure": self.last_failure.isoformat() if self.last_failure else None,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,392 @@
+"""
+Parse stage of the Vlaginstructie scraper: the government page or a JSON export
+to the flag days dict.
+
+Everything here is synchronous and free of network code, so it runs in the
+executor and can be tested and benchmarked without aiohttp. scraper.py
+re-exports these names for existing callers.
+"""
+
+from datetime import date
+from html.parser import HTMLParser
+import hashlib
+import json
+import logging
+import re
+import time
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+from .rules import get_variable_days_for_year, is_christian_holiday
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Dutch month name -> month number
+MONTHS = {
+    "januari": 1, "februari": 2, "maart": 3, "april": 4,
+    "mei": 5, "juni": 6, "juli": 7, "augustus": 8,
+    "september": 9, "oktober": 10, "november": 11, "december": 12
+}
+
+
+# ---------- helpers to parse date strings ----------
+def parse_date_string(raw: str):
+    """
+    Parse a raw date string and return tuple (day, month, year_or_None, had_year_bool).
+    Supports formats:
+      - "04-05-2025"
+      - "04-05"
+      - "4 mei 2025"
+      - "4 mei"
+    Returns (day:int, month:int, year:int|None, had_year:bool) or (None, None, None, False).
+    """
+    raw = raw.strip().lower()
+    # direct numeric with dashes: dd-mm-yyyy or dd-mm
+    m = re.match(r"^(\d{1,2})[-/](\d{1,2})[-/](\d{4})$", raw)
+    if m:
+        return int(m.group(1)), int(m.group(2)), int(m.group(3)), True
+    m = re.match(r"^(\d{1,2})[-/](\d{1,2})$", raw)
+    if m:
+        return int(m.group(1)), int(m.group(2)), None, False
+
+    # textual month (Dutch)
+    m = re.match(r"^(\d{1,2})\s+([^\W\d_]+)\s+(\d{4})$", raw)
+    if m:
+        day = int(m.group(1))
+        month_name = m.group(2)
+        month = MONTHS.get(month_name)
+        if month:
+            return day, month, int(m.group(3)), True
+
+    m = re.match(r"^(\d{1,2})\s+([^\W\d_]+)$", raw)
+    if m:
+        day = int(m.group(1))
+        month = MONTHS.get(m.group(2))
+        if month:
+            return day, month, None, False
+
+    return None, None, None, False
+
+
+# ---------- parse stage (synchronous, runs in the executor) ----------
+class _TableComplete(Exception):
+    """Raised by TableExtractor to stop parsing once the first table is closed."""
+
+
+class TableExtractor(HTMLParser):
+    """
+    Streaming extractor for the first <table> of a page, built on html.parser.
+    Collects the text of the <td> cells of each row (text nodes stripped and joined
+    by a space, like BeautifulSoup's get_text(" ", strip=True)) and stops parsing as
+    soon as the table closes. Everything outside the table is skipped.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self.found = False
+        self.done = False
+        self.nested = False
+        self._depth = 0
+        self._row = None
+        self._cell = None
+
+    def feed(self, data: str):
+        """Feed more markup; a no-op once the table has been completed."""
+        if self.done:
+            return
+        try:
+            super().feed(data)
+        except _TableComplete:
+            self.done = True
+
+    def _close_cell(self):
+        if self._cell is not None:
+            if self._row is not None:
+                self._row.append(" ".join(self._cell))
+            self._cell = None
+
+    def _close_row(self):
+        self._close_cell()
+        if self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            if self._depth:
+                self.nested = True
+            self.found = True
+            self._depth += 1
+        elif self._depth != 1:
+            return
+        elif tag == "tr":
+            self._close_row()
+            self._row = []
+        elif tag in ("td", "th"):
+            self._close_cell()
+            if self._row is None:
+                self._row = []
+            # header cells close the previous cell but are not collected
+            self._cell = [] if tag == "td" else None
+
+    def handle_endtag(self, tag):
+        if not self._depth:
+            return
+        if tag == "table":
+            self._depth -= 1
+            if not self._depth:
+                self._close_row()
+                raise _TableComplete
+        elif self._depth != 1:
+            return
+        elif tag == "tr":
+            self._close_row()
+        elif tag in ("td", "th"):
+            self._close_cell()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            data = data.strip()
+            if data:
+                self._cell.append(data)
+
+
+def table_rows_are_valid(rows) -> bool:
+    """
+    Structural check for rows from TableExtractor: enough two-column rows, most of
+    them starting with a parseable date. Failing rows select the BeautifulSoup path.
+    """
+    if not rows:
+        return False
+    body = [cols for cols in rows[1:] if len(cols) >= 2]
+    if len(body) < 3:
+        return False
+    dated = sum(
+        1 for cols in body
+        if parse_date_string(re.sub(r"\s*\(.*?\)\s*$", "", cols[0]))[0] is not None
+    )
+    return dated * 2 >= len(body)
+
+
+_TABLE_START = re.compile(r"<table\b", re.IGNORECASE)
+
+
+def extract_table_rows_fast(html: str):
+    """Return all rows of the first table using TableExtractor, or None without a table."""
+    # skip the navigation and article text in front of the table without tokenizing it
+    start = _TABLE_START.search(html)
+    if start is None:
+        return None
+    extractor = TableExtractor()
+    extractor.feed(html[start.start():])
+    if not extractor.done:
+        extractor.close()
+        extractor._close_row()
+    if not extractor.found or extractor.nested:
+        return None
+    return extractor.rows
+
+
+def extract_table_rows_bs4(html: str):
+    """Return all rows of the first table using BeautifulSoup, or None without a table."""
+    soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table")
+    if not table:
+        return None
+
+    return [
+        [col.get_text(" ", strip=True) for col in row.find_all("td")]
+        for row in table.find_all("tr")
+    ]
+
+
+def extract_table_rows(html: str, fast: bool = True):
+    """
+    Return the cell texts of every row of the first table after the header row,
+    or None when the page has no table.
+    Uses the stdlib TableExtractor and falls back to BeautifulSoup when its result
+    fails table_rows_are_valid() (and beautifulsoup4 is installed). With fast=False
+    only BeautifulSoup is used.
+    """
+    if not fast and BeautifulSoup is not None:
+        rows = extract_table_rows_bs4(html)
+    else:
+        rows = extract_table_rows_fast(html)
+    if fast and not table_rows_are_valid(rows) and BeautifulSoup is not None:
+        _LOGGER.debug("extract_table_rows - fast extractor rejected the table, using BeautifulSoup")
+        rows = extract_table_rows_bs4(html)
+    if rows is None:
+        return None
+    return rows[1:]
+
+
+def build_vlagdagen(rows, today: date, counts: dict | None = None):
+    """
+    Return dict keyed by ISO dates 'YYYY-MM-DD' -> info for the given table rows.
+    When counts is given, its rows_parsed and rows_skipped are set to the number of
+    rows that did and did not produce a date.
+    """
+    result = {}
+    parsed = skipped = 0
+    for cols in rows:
+        if len(cols) < 2:
+            skipped += 1
+            continue
+
+        raw_date_cell = cols[0]
+        reason = cols[1]
+
+        pm = re.match(r"^(.*?)\s*\((.*?)\)\s*$", raw_date_cell)
+        if pm:
+            main_raw = pm.group(1).strip()
+            alt_raw = pm.group(2).strip()
+        else:
+            main_raw = raw_date_cell.strip()
+            alt_raw = None
+
+        main_day, main_month, main_year, main_has_year = parse_date_string(main_raw)
+        alt_day = alt_month = alt_year = None
+        alt_has_year = False
+        if alt_raw:
+            alt_day, alt_month, alt_year, alt_has_year = parse_date_string(alt_raw)
+
+        years = [main_year] if main_has_year else [today.year, today.year + 1]
+
+        produced = False
+        for y in years:
+            if main_day is None or main_month is None:
+                _LOGGER.debug("Skipping unparseable date cell: %s", raw_date_cell)
+                continue
+
+            try:
+                main_dt = date(y, main_month, main_day)
+            except ValueError as e:
+                _LOGGER.debug("Skipping invalid date cell '%s': %s", raw_date_cell, e)
+                continue
+
+            alt_dt = None
+            if alt_raw and (alt_day is not None and alt_month is not None):
+                try:
+                    alt_dt = date(alt_year if alt_has_year else y, alt_month, alt_day)
+                except ValueError as e:
+                    _LOGGER.debug("Ignoring invalid alternative date '%s': %s", alt_raw, e)
+
+            use_dt = main_dt
+            if alt_dt and (main_dt.weekday() == 6 or is_christian_holiday(main_dt)):
+                use_dt = alt_dt
+                _LOGGER.debug(
+                    "Row '%s' reason '%s': main %s is Sunday/holiday -> using alt %s for year %d",
+                    raw_date_cell, reason, main_dt.isoformat(), alt_dt.isoformat(), y
+                )
+
+            key = use_dt.isoformat()
+            result[key] = {
+                "name": reason,
+                "halfstok": "dodenherdenking" in reason.lower(),
+                "wimpel": "koning" in reason.lower() or "koningsdag" in reason.lower() or "wimpel" in reason.lower(),
+                "scope": "all",
+            }
+            produced = True
+
+        if produced:
+            parsed += 1
+        else:
+            skipped += 1
+
+    if counts is not None:
+        counts["rows_parsed"] = parsed
+        counts["rows_skipped"] = skipped
+
+    # add variable days for this and next year
+    result.update(get_variable_days_for_year(today.year))
+    result.update(get_variable_days_for_year(today.year + 1))
+    return result
+
+
+def parse_vlagdagen(html: str, today: date, fast: bool = True):
+    """
+    Parse the government page into the ISO-date dict returned by fetch_vlagdagen().
+    Pure and synchronous: no I/O, safe to run in an executor. Returns None when
+    the page has no table.
+    """
+    rows = extract_table_rows(html, fast)
+    if rows is None:
+        return None
+    return build_vlagdagen(rows, today)
+
+
+def rows_fingerprint(rows) -> str:
+    """Return a SHA-256 fingerprint of the table rows with whitespace normalized."""
+    digest = hashlib.sha256()
+    for cols in rows:
+        digest.update("\x1f".join(" ".join(col.split()) for col in cols).encode())
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+def parse_page(html: str, today: date, fast: bool = True, known_fingerprint=None, counts=None):
+    """
+    Parse stage used by fetch_vlagdagen().
+    Returns (fingerprint, vlagdagen): fingerprint of the table rows, or None when the
+    page has no table; vlagdagen is None when the fingerprint equals known_fingerprint,
+    in which case the calendar is not rebuilt. counts, when given, receives the row
+    counts of build_vlagdagen and the parse time in seconds.
+    """
+    started = time.perf_counter()
+    try:
+        rows = extract_table_rows(html, fast)
+        if rows is None:
+            return None, None
+        fingerprint = rows_fingerprint(rows)
+        if fingerprint == known_fingerprint:
+            return fingerprint, None
+        return fingerprint, build_vlagdagen(rows, today, counts)
+    finally:
+        if counts is not None:
+            counts["seconds"] = time.perf_counter() - started
+
+
+def parse_export(text: str, counts: dict | None = None):
+    """
+    Parse a JSON export of the calendar: an object keyed by ISO dates -> info as
+    returned by fetch_vlagdagen(), optionally wrapped in {"vlagdagen": ...} as in
+    export_cache(). Entries without a valid date or a name are skipped. Returns
+    None when the text is not such an export or has no usable entry; counts, when
+    given, receives rows_parsed and rows_skipped.
+    """
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(data, dict) and isinstance(data.get("vlagdagen"), dict):
+        data = data["vlagdagen"]
+    if not isinstance(data, dict):
+        return None
+
+    result = {}
+    skipped = 0
+    for iso_key, info in data.items():
+        try:
+            day = date.fromisoformat(iso_key)
+        except (TypeError, ValueError):
+            skipped += 1
+            continue
+        if not isinstance(info, dict) or not isinstance(info.get("name"), str):
+            skipped += 1
+            continue
+        result[day.isoformat()] = {
+            "name": info["name"],
+            "halfstok": bool(info.get("halfstok", False)),
+            "wimpel": bool(info.get("wimpel", False)),
+            "scope": info.get("scope") or "all",
+        }
+
+    if counts is not None:
+        counts["rows_parsed"] = len(result)
+        counts["rows_skipped"] = skipped
+    return result or None
@@ -0,0 +1,199 @@
+"""On-demand profiling of the coordinator's refresh path."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import cProfile
+from dataclasses import dataclass
+from datetime import datetime
+import io
+from pathlib import Path
+import pstats
+import tracemalloc
+
+# attributes wrapped on the coordinator instance while armed
+WRAPPED = ("_async_update_data", "async_update_listeners", "parse_executor")
+
+
+@dataclass(slots=True)
+class ProfileResult:
+    """Collected profile of one armed run."""
+
+    stats: pstats.Stats
+    refreshes: int
+    top: int
+    # formatted top allocation sites, when memory tracing was requested
+    memory: list[str] | None = None
+
+
+class RefreshProfiler:
+    """
+    Profile a coordinator's next refreshes.
+
+    Arming shadows _async_update_data, async_update_listeners and the parse
+    executor with profiling wrappers as instance attributes; when the requested
+    number of refreshes has run the original attributes are put back, so a
+    disarmed profiler leaves nothing in the call path and costs nothing.
+
+    The event loop part is profiled with one cProfile.Profile that is enabled
+    around each wrapped call, so it also sees other work the loop runs while a
+    refresh awaits. The parse stage runs in an executor thread and gets its own
+    profile, merged into the result (on Python 3.12+ profiling is interpreter-wide
+    and the event loop profile already covers the thread).
+    """
+
+    def __init__(self, coordinator) -> None:
+        self._coordinator = coordinator
+        self._profile: cProfile.Profile | None = None
+        self._thread_profiles: list[cProfile.Profile] = []
+        self._shots = 0
+        self._done = 0
+        self._depth = 0
+        self._active = False
+        self._top = 20
+        self._trace_memory = False
+        self._started_tracing = False
+        self._on_complete: Callable[[ProfileResult], None] | None = None
+        # instance attributes replaced by the wrappers; None when it was a method
+        self._originals: dict = {}
+
+    @property
+    def armed(self) -> bool:
+        return self._profile is not None
+
+    def arm(
+        self,
+        on_complete: Callable[[ProfileResult], None],
+        shots: int = 1,
+        trace_memory: bool = False,
+        top: int = 20,
+    ) -> None:
+        """Profile the next shots refreshes, then call on_complete with the result."""
+        if self.armed:
+            raise RuntimeError("The profiler is already armed")
+        self._profile = cProfile.Profile()
+        self._thread_profiles = []
+        self._shots = shots
+        self._done = 0
+        self._depth = 0
+        self._top = top
+        self._on_complete = on_complete
+        self._trace_memory = trace_memory
+        self._started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+        coordinator = self._coordinator
+        self._originals = {name: vars(coordinator).get(name) for name in WRAPPED}
+        update_data = coordinator._async_update_data
+        update_listeners = coordinator.async_update_listeners
+        parse_executor = coordinator.parse_executor
+
+        async def profiled_update_data(*args, **kwargs):
+            self._enable()
+            try:
+                return await update_data(*args, **kwargs)
+            finally:
+                self._disable()
+                self._done += 1
+                if self._done >= self._shots:
+                    # let the refresh finish its listener fan-out first
+                    asyncio.get_running_loop().call_soon(self._finish)
+
+        def profiled_update_listeners(*args, **kwargs):
+            self._enable()
+            try:
+                return update_listeners(*args, **kwargs)
+            finally:
+                self._disable()
+
+        def profiled_parse_executor(func, *args):
+            return parse_executor(self._run_in_thread, func, *args)
+
+        coordinator._async_update_data = profiled_update_data
+        coordinator.async_update_listeners = profiled_update_listeners
+        coordinator.parse_executor = profiled_parse_executor
+
+    def _enable(self) -> None:
+        # wrapped calls nest: update data notifies the listeners itself
+        self._depth += 1
+        if self._depth == 1:
+            try:
+                self._profile.enable()
+                self._active = True
+            except ValueError:
+                # another profiler is active; the refresh must still run
+                self._active = False
+
+    def _disable(self) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._active:
+            self._profile.disable()
+            self._active = False
+
+    def _run_in_thread(self, func, *args):
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return func(*args)
+        try:
+            return func(*args)
+        finally:
+            profile.disable()
+            self._thread_profiles.append(profile)
+
+    def disarm(self) -> None:
+        """Remove the wrappers and drop anything collected so far."""
+        if self.armed:
+            self._restore()
+
+    def _finish(self) -> None:
+        if not self.armed:
+            return
+        stats = pstats.Stats(self._profile)
+        for profile in self._thread_profiles:
+            stats.add(profile)
+        memory = None
+        if self._trace_memory and tracemalloc.is_tracing():
+            top_stats = tracemalloc.take_snapshot().statistics("lineno")[: self._top]
+            memory = [str(stat) for stat in top_stats]
+        result = ProfileResult(stats, self._done, self._top, memory)
+        on_complete = self._on_complete
+        self._restore()
+        on_complete(result)
+
+    def _restore(self) -> None:
+        attributes = vars(self._coordinator)
+        for name, original in self._originals.items():
+            if original is None:
+                attributes.pop(name, None)
+            else:
+                attributes[name] = original
+        self._originals = {}
+        if self._started_tracing:
+            tracemalloc.stop()
+        self._profile = None
+        self._thread_profiles = []
+        self._started_tracing = False
+        self._on_complete = None
+
+
+def write_results(result: ProfileResult, directory: Path, stamp: datetime) -> tuple[Path, Path]:
+    """Write <prefix>.prof and a top-N <prefix>.txt summary; returns both paths. Blocking."""
+    prefix = directory / f"vlaginstructie_profile_{stamp:%Y%m%d_%H%M%S}"
+    prof_path = prefix.with_suffix(".prof")
+    summary_path = prefix.with_suffix(".txt")
+    result.stats.dump_stats(prof_path)
+
+    out = io.StringIO()
+    out.write(f"Vlaginstructie refresh profile, {result.refreshes} refresh(es), {stamp.isoformat()}\n\n")
+    result.stats.stream = out
+    result.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(result.top)
+    if result.memory is not None:
+        out.write(f"\nTop {result.top} allocation sites\n\n")
+        out.write("\n".join(result.memory))
+        out.write("\n")
+    summary_path.write_text(out.getvalue(), encoding="utf-8")
+    return prof_path, summary_path
@@ -0,0 +1,175 @@
+"""Retry, timeout, hedging and circuit breaker policy for fetching the government page."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+import random
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Exponential backoff with jitter: a random delay between half and all of base * factor**n."""
+
+    base: float = 60.0
+    factor: float = 2.0
+    max_delay: float = 6 * 3600.0
+
+    def delay(self, attempt: int, rng=random.random) -> float:
+        """Return the delay in seconds before retry number attempt (0-based)."""
+        ceiling = min(self.max_delay, self.base * self.factor ** max(attempt, 0))
+        return ceiling / 2 + ceiling / 2 * rng()
+
+
+class AdaptiveTimeout:
+    """
+    Request timeout derived from observed latency, like TCP's retransmission timer:
+    smoothed latency plus four times its mean deviation, clamped to [minimum, maximum].
+    """
+
+    def __init__(self, initial: float = 20.0, minimum: float = 5.0, maximum: float = 20.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self._initial = initial
+        self._smoothed: float | None = None
+        self._deviation = 0.0
+
+    @property
+    def current(self) -> float:
+        """Return the timeout in seconds for the next request."""
+        if self._smoothed is None:
+            return self._initial
+        return min(self.maximum, max(self.minimum, self._smoothed + 4 * self._deviation))
+
+    def observe(self, latency: float) -> None:
+        """Record the latency in seconds of a successful request."""
+        if self._smoothed is None:
+            self._smoothed = latency
+            self._deviation = latency / 2
+            return
+        self._deviation = 0.75 * self._deviation + 0.25 * abs(self._smoothed - latency)
+        self._smoothed = 0.875 * self._smoothed + 0.125 * latency
+
+
+class CircuitBreaker:
+    """
+    Stop fetching after repeated failures.
+
+    Every failure schedules the next attempt after a RetryPolicy delay. After
+    failure_threshold consecutive failures the breaker opens and rejects requests
+    until that delay has passed; it then lets one trial request through (half-open).
+    A success closes it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        policy: RetryPolicy | None = None,
+        clock=time.monotonic,
+        rng=random.random,
+    ):
+        self.failure_threshold = failure_threshold
+        self.policy = policy or RetryPolicy()
+        self._clock = clock
+        self._rng = rng
+        self.failures = 0
+        self._retry_at: float | None = None
+        self._opened = False
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if not self._opened:
+            return STATE_CLOSED
+        if self._clock() < self._retry_at:
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    def retry_in(self) -> float | None:
+        """Return the seconds until the next attempt is due, or None when not failing."""
+        if self._retry_at is None:
+            return None
+        return max(0.0, self._retry_at - self._clock())
+
+    def allow_request(self) -> bool:
+        """Return False while the breaker is open."""
+        return self.state != STATE_OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure count."""
+        if self._opened:
+            _LOGGER.info("Fetching recovered after %d failures, circuit closed", self.failures)
+        self.failures = 0
+        self._retry_at = None
+        self._opened = False
+
+    def record_failure(self) -> None:
+        """Count a failure and schedule the next attempt."""
+        self.failures += 1
+        delay = self.policy.delay(self.failures - 1, self._rng)
+        self._retry_at = self._clock() + delay
+        if self.failures >= self.failure_threshold:
+            if not self._opened:
+                _LOGGER.warning(
+                    "Fetching failed %d times in a row, pausing requests (next attempt in %.0f s)",
+                    self.failures,
+                    delay,
+                )
+            self._opened = True
+
+
+async def async_hedged(
+    attempts: list[Callable[[], Awaitable]],
+    delay: float,
+    on_hedge: Callable[[int], None] | None = None,
+) -> tuple[int | None, object]:
+    """
+    Run attempts in order and return (index, result) of the first valid answer.
+
+    Each attempt is a coroutine function that returns None when it failed. The
+    first one starts straight away; the next starts when none of the running ones
+    has answered within delay seconds (on_hedge is called with its index), or as
+    soon as one fails. Once an attempt succeeds the others are cancelled. Returns
+    (None, None) when every attempt failed.
+    """
+    running: dict[asyncio.Future, int] = {}
+    upcoming = iter(enumerate(attempts))
+
+    def start_next() -> int | None:
+        for index, attempt in upcoming:
+            running[asyncio.ensure_future(attempt())] = index
+            return index
+        return None
+
+    start_next()
+    try:
+        while running:
+            done, _ = await asyncio.wait(running, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                # over the latency budget: hedge with the next attempt
+                index = start_next()
+                if index is not None and on_hedge is not None:
+                    on_hedge(index)
+                continue
+            # prefer the earlier attempt when several answered at once
+            for future in sorted(done, key=running.__getitem__):
+                index = running.pop(future)
+                result = future.result()
+                if result is not None:
+                    return index, result
+            start_next()
+        return None, None
+    finally:
+        for future in running:
+            future.cancel()
+        if running:
+            await asyncio.wait(running)
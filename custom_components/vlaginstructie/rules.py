@@ -0,0 +1,203 @@
+"""Rule-compiled Dutch flag instruction.
+
+The flag instruction is a handful of rules: fixed dates, some of which move when
+they fall on a Sunday or a Christian holiday, and weekday-of-month rules. This
+module compiles them into the scraper's ISO-date dict for any year range, so the
+calendar is available without the network; the scraped table confirms or patches
+the years it covers (see merge_calendars).
+"""
+
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+SUNDAY = 6
+
+
+# ---------- Easter algorithm & christian-holidays ----------
+def easter_date(year: int) -> date:
+    """Return Easter Sunday date for given Gregorian year (Meeus/Jones algorithm)."""
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = ((h + l - 7 * m + 114) % 31) + 1
+    return date(year, month, day)
+
+
+# Easter-relative holidays as day offsets from Easter Sunday
+EASTER_HOLIDAYS = {
+    "Goede Vrijdag": -2,
+    "Eerste Paasdag": 0,
+    "Tweede Paasdag": 1,
+    "Hemelvaartsdag": 39,
+    "Eerste Pinksterdag": 49,
+    "Tweede Pinksterdag": 50,
+}
+
+
+@lru_cache(maxsize=64)
+def christian_holidays(year: int) -> frozenset[date]:
+    """Return the commonly recognized Christian holidays of a year (memoized)."""
+    easter = easter_date(year)
+    holidays = {easter + timedelta(days=offset) for offset in EASTER_HOLIDAYS.values()}
+    holidays.update((date(year, 12, 25), date(year, 12, 26)))
+    return frozenset(holidays)
+
+
+def is_christian_holiday(d: date) -> bool:
+    """Return True for commonly recognized Christian holidays used in NL context."""
+    return d in christian_holidays(d.year)
+
+
+# ---------- weekday-of-month helpers ----------
+def last_weekday_of_month(year, month, weekday: int):
+    """Last weekday (0=Mon) of month."""
+    last_day = date(year, month, calendar.monthrange(year, month)[1])
+    offset = (last_day.weekday() - weekday) % 7
+    return last_day - timedelta(days=offset)
+
+
+def nth_weekday_of_month(year, month, weekday: int, n: int):
+    """Nth weekday (0=Mon) of month."""
+    first_day = date(year, month, 1)
+    first_weekday = first_day.weekday()
+    delta_days = (weekday - first_weekday + 7) % 7 + (n - 1) * 7
+    return first_day + timedelta(days=delta_days)
+
+
+# ---------- rules ----------
+@dataclass(frozen=True, slots=True)
+class FlagRule:
+    """
+    One line of the flag instruction.
+
+    Exactly one way of finding the date is used: a fixed day of month, the nth
+    weekday of month (nth=-1 for the last one), or an offset from Easter Sunday.
+    shift moves a date that falls on a Sunday or a Christian holiday by that many
+    days; 0 keeps it in place.
+    """
+
+    name: str
+    month: int = 0
+    day: int = 0
+    weekday: int | None = None
+    nth: int = 0
+    easter_offset: int | None = None
+    shift: int = 0
+    halfstok: bool = False
+    wimpel: bool = False
+    scope: str = "all"
+
+    def date_for_year(self, year: int) -> date:
+        """Return the date the flag goes out in the given year."""
+        if self.easter_offset is not None:
+            return easter_date(year) + timedelta(days=self.easter_offset)
+        if self.weekday is not None:
+            if self.nth < 0:
+                return last_weekday_of_month(year, self.month, self.weekday)
+            return nth_weekday_of_month(year, self.month, self.weekday, self.nth)
+
+        result = date(year, self.month, self.day)
+        if self.shift and (result.weekday() == SUNDAY or is_christian_holiday(result)):
+            result += timedelta(days=self.shift)
+        return result
+
+    def info(self) -> dict:
+        """Return the info dict stored in the calendar for this rule."""
+        return {
+            "name": self.name,
+            "halfstok": self.halfstok,
+            "wimpel": self.wimpel,
+            "scope": self.scope,
+        }
+
+
+# the scraper adds these to every scraped table, under these names
+VARIABLE_RULES = (
+    FlagRule("Veteranendag", month=6, weekday=5, nth=-1),  # last Saturday of June
+    FlagRule("Prinsjesdag", month=9, weekday=1, nth=3),  # third Tuesday of September
+)
+
+# names and pennants as in the government table; shift only where the table
+# gives an alternate date
+RULES = (
+    FlagRule("Verjaardag van Prinses Beatrix", month=1, day=31),
+    FlagRule(
+        "Koningsdag, verjaardag van Koning Willem-Alexander (met oranje wimpel)",
+        month=4,
+        day=27,
+        shift=-1,
+        wimpel=True,
+    ),
+    FlagRule("Dodenherdenking (vlag halfstok van 18.00 uur tot zonsondergang)", month=5, day=4, halfstok=True),
+    FlagRule("Bevrijdingsdag", month=5, day=5),
+    FlagRule("Verjaardag van Koningin Máxima (met oranje wimpel)", month=5, day=17, wimpel=True),
+    FlagRule("Herdenking van het einde van de Tweede Wereldoorlog in het Koninkrijk", month=8, day=15),
+    FlagRule("Verjaardag van Prinses Catharina-Amalia (met oranje wimpel)", month=12, day=7, wimpel=True),
+    FlagRule("Koninkrijksdag", month=12, day=15, shift=1),
+) + VARIABLE_RULES
+
+
+def get_variable_days_for_year(year: int):
+    """Return mapping of ISO-dates to info for variable days of the given year."""
+    return {rule.date_for_year(year).isoformat(): rule.info() for rule in VARIABLE_RULES}
+
+
+@lru_cache(maxsize=32)
+def compile_year(year: int) -> MappingProxyType:
+    """Return the rule-compiled calendar of one year (memoized, read-only)."""
+    return MappingProxyType(
+        {rule.date_for_year(year).isoformat(): rule.info() for rule in RULES}
+    )
+
+
+def compile_calendar(first_year: int, last_year: int) -> dict:
+    """Return the rule-compiled ISO-date dict for first_year..last_year inclusive."""
+    result = {}
+    for year in range(first_year, last_year + 1):
+        result.update(compile_year(year))
+    return result
+
+
+def merge_calendars(compiled, scraped) -> tuple[dict, int]:
+    """
+    Combine a compiled calendar with the scraped one.
+    Scraped days win, and compiled days fill the years the scrape does not cover.
+    In the covered years a compiled day is only dropped when the scrape contradicts
+    it: has the same occasion on another day of that year. Returns (calendar,
+    mismatches), where mismatches counts the days in the covered years that only
+    one of the two sources has.
+    """
+    scraped_names = {(iso_key[:4], info.get("name")) for iso_key, info in scraped.items()}
+    covered = {year for year, _ in scraped_names}
+    compiled_years = set()
+    result = {}
+    mismatches = 0
+    for iso_key, info in compiled.items():
+        year = iso_key[:4]
+        compiled_years.add(year)
+        if year not in covered:
+            result[iso_key] = info
+        elif iso_key not in scraped:
+            mismatches += 1
+            if (year, info["name"]) not in scraped_names:
+                result[iso_key] = info
+    mismatches += sum(
+        1 for iso_key in scraped if iso_key[:4] in compiled_years and iso_key not in compiled
+    )
+    result.update(scraped)
+    return result, mismatches
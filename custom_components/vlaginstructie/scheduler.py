@@ -0,0 +1,37 @@
+"""Transition times for the Vlaginstructie entities.
+
+Entity values only depend on the calendar and the local date, plus the half-mast
+cutoff on Dodenherdenking. Instead of polling, the coordinator sets one timer for
+the next of these moments.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+# Dodenherdenking: the flag is at half-mast on 4 May until 18:00 local time
+DODENHERDENKING = (5, 4)
+HALFSTOK_CUTOFF = time(18, 0)
+
+
+def halfstok_cutoff(day: date, tzinfo) -> datetime | None:
+    """Return the half-mast cutoff on the given day, or None when the day has none."""
+    if (day.month, day.day) != DODENHERDENKING:
+        return None
+    return datetime.combine(day, HALFSTOK_CUTOFF, tzinfo=tzinfo)
+
+
+def start_of_day(day: date, tzinfo) -> datetime:
+    """Return local midnight of the given day as an aware datetime."""
+    return datetime.combine(day, time(0), tzinfo=tzinfo)
+
+
+def next_transition(now: datetime) -> datetime:
+    """
+    Return the first moment after now at which an entity value can change.
+    now must be an aware datetime in the Home Assistant time zone; the result is in
+    the same zone. Wall-clock arithmetic keeps this correct across DST changes.
+    """
+    today = now.date()
+    cutoff = halfstok_cutoff(today, now.tzinfo)
+    if cutoff is not None and now < cutoff:
+        return cutoff
+    return start_of_day(today + timedelta(days=1), now.tzinfo)
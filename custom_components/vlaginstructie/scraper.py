@@ -1,9 +1,43 @@
 import aiohttp
-from bs4 import BeautifulSoup
-from datetime import date, datetime, timedelta
-import calendar
+from aiohttp import hdrs
+from datetime import date
+import asyncio
+import contextlib
+import hashlib
 import re
 import logging
+import time
+
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:
+    HAS_BROTLI = False
+
+from .metrics import FetchMetrics
+from .parsing import (  # noqa: F401 - re-exported for existing callers
+    MONTHS,
+    BeautifulSoup,
+    TableExtractor,
+    _TABLE_START,
+    build_vlagdagen,
+    extract_table_rows,
+    extract_table_rows_bs4,
+    extract_table_rows_fast,
+    parse_date_string,
+    parse_export,
+    parse_page,
+    parse_vlagdagen,
+    rows_fingerprint,
+    table_rows_are_valid,
+)
+from .resilience import AdaptiveTimeout, CircuitBreaker, async_hedged
+from .rules import (  # noqa: F401 - re-exported for existing callers
+    easter_date,
+    get_variable_days_for_year,
+    is_christian_holiday,
+    last_weekday_of_month,
+    nth_weekday_of_month,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,244 +46,545 @@ URL = (
     "vraag-en-antwoord/wanneer-kan-ik-de-vlag-uithangen-en-wat-is-de-vlaginstructie"
 )
 REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=20)
+# latency budget in seconds before the next source is asked as well
+HEDGE_DELAY = 2.0
+# lower bound for the adaptive request timeout, in seconds
+MIN_REQUEST_TIMEOUT = 5
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+STREAM_CHUNK_SIZE = 8192
+
+
+# ---------- fetch stage (async) ----------
+_NOT_MODIFIED = object()
+
 
-_cache = {"vlagdagen": {}, "last_update": None}
-
-# Dutch month name -> month number
-MONTHS = {
-    "januari": 1, "februari": 2, "maart": 3, "april": 4,
-    "mei": 5, "juni": 6, "juli": 7, "augustus": 8,
-    "september": 9, "oktober": 10, "november": 11, "december": 12
-}
-
-
-# ---------- Easter algorithm & christian-holidays ----------
-def easter_date(year: int) -> date:
-    """Return Easter Sunday date for given Gregorian year (Meeus/Jones algorithm)."""
-    a = year % 19
-    b = year // 100
-    c = year % 100
-    d = b // 4
-    e = b % 4
-    f = (b + 8) // 25
-    g = (b - f + 1) // 3
-    h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
-    l = (32 + 2 * e + 2 * i - h - k) % 7
-    m = (a + 11 * h + 22 * l) // 451
-    month = (h + l - 7 * m + 114) // 31
-    day = ((h + l - 7 * m + 114) % 31) + 1
-    return date(year, month, day)
-
-
-def is_christian_holiday(d: date) -> bool:
-    """Return True for commonly recognized Christian holidays used in NL context."""
-    year = d.year
-    easter = easter_date(year)
-    good_friday = easter - timedelta(days=2)
-    easter_monday = easter + timedelta(days=1)
-    ascension = easter + timedelta(days=39)
-    pentecost = easter + timedelta(days=49)  # Pinksteren (Sunday)
-    pentecost_monday = easter + timedelta(days=50)
-    christmas_1 = date(year, 12, 25)
-    christmas_2 = date(year, 12, 26)
-
-    holidays = {good_friday, easter, easter_monday, ascension, pentecost, pentecost_monday, christmas_1, christmas_2}
-    return d in holidays
-
-
-# ---------- helpers to parse date strings ----------
-def parse_date_string(raw: str):
+class TableEndScanner:
     """
-    Parse a raw date string and return tuple (day, month, year_or_None, had_year_bool).
-    Supports formats:
-      - "04-05-2025"
-      - "04-05"
-      - "4 mei 2025"
-      - "4 mei"
-    Returns (day:int, month:int, year:int|None, had_year:bool) or (None, None, None, False).
+    Track <table> nesting in raw body bytes to see when the first table has closed.
+    Only tags are matched, no text is decoded, so it is cheap enough to run on the
+    event loop for every received chunk; parsing itself stays in the executor.
     """
-    raw = raw.strip().lower()
-    # direct numeric with dashes: dd-mm-yyyy or dd-mm
-    m = re.match(r"^(\d{1,2})[-/](\d{1,2})[-/](\d{4})$", raw)
-    if m:
-        return int(m.group(1)), int(m.group(2)), int(m.group(3)), True
-    m = re.match(r"^(\d{1,2})[-/](\d{1,2})$", raw)
-    if m:
-        return int(m.group(1)), int(m.group(2)), None, False
-
-    # textual month (Dutch)
-    m = re.match(r"^(\d{1,2})\s+([^\W\d_]+)\s+(\d{4})$", raw)
-    if m:
-        day = int(m.group(1))
-        month_name = m.group(2)
-        month = MONTHS.get(month_name)
-        if month:
-            return day, month, int(m.group(3)), True
-
-    m = re.match(r"^(\d{1,2})\s+([^\W\d_]+)$", raw)
-    if m:
-        day = int(m.group(1))
-        month = MONTHS.get(m.group(2))
-        if month:
-            return day, month, None, False
-
-    return None, None, None, False
-
-
-# ---------- variable days ----------
-def last_weekday_of_month(year, month, weekday: int):
-    """Last weekday (0=Mon) of month."""
-    last_day = date(year, month, calendar.monthrange(year, month)[1])
-    offset = (last_day.weekday() - weekday) % 7
-    return last_day - timedelta(days=offset)
-
-
-def nth_weekday_of_month(year, month, weekday: int, n: int):
-    """Nth weekday (0=Mon) of month."""
-    first_day = date(year, month, 1)
-    first_weekday = first_day.weekday()
-    delta_days = (weekday - first_weekday + 7) % 7 + (n - 1) * 7
-    return first_day + timedelta(days=delta_days)
-
-
-def get_variable_days_for_year(year: int):
-    """Return mapping of ISO-dates to info for variable days of the given year."""
-    v = {}
-
-    # Veteranendag = last Saturday of June
-    vet = last_weekday_of_month(year, 6, 5)  # 5 = Saturday
-    v[vet.isoformat()] = {
-        "name": "Veteranendag",
-        "halfstok": False,
-        "wimpel": False,
-        "scope": "all",
-    }
 
-    # Prinsjesdag = third Tuesday of September
-    prins = nth_weekday_of_month(year, 9, 1, 3)  # 1 = Tuesday
-    v[prins.isoformat()] = {
-        "name": "Prinsjesdag",
-        "halfstok": False,
-        "wimpel": False,
-        "scope": "all",
+    _TAG = re.compile(rb"<(/?)table\b[^<>]*>", re.IGNORECASE)
+    _MAX_TAIL = 256
+
+    def __init__(self):
+        self.depth = 0
+        self.done = False
+        self._tail = b""
+
+    def feed(self, chunk: bytes):
+        """Scan the next chunk of the body."""
+        if self.done:
+            return
+        data = self._tail + chunk
+        pos = 0
+        for match in self._TAG.finditer(data):
+            pos = match.end()
+            if match.group(1):
+                if self.depth:
+                    self.depth -= 1
+                    if not self.depth:
+                        self.done = True
+                        return
+            else:
+                self.depth += 1
+        # keep a tag that may continue in the next chunk
+        lt = data.rfind(b"<", pos)
+        self._tail = data[lt:] if lt != -1 and len(data) - lt <= self._MAX_TAIL else b""
+
+
+def _decode_body(body: bytes, charset: str | None) -> str:
+    """Decode a response body with its declared charset; an unknown one falls back to UTF-8."""
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        _LOGGER.debug("fetch_vlagdagen - unknown charset %r, decoding as UTF-8", charset)
+        return body.decode("utf-8", errors="replace")
+
+
+async def _async_read_until_table_end(resp):
+    """
+    Read the body chunk by chunk and stop once the first table is complete.
+    Returns (body, complete) where complete is False when reading stopped early.
+    """
+    scanner = TableEndScanner()
+    chunks = []
+    async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+        chunks.append(chunk)
+        scanner.feed(chunk)
+        if scanner.done:
+            break
+    body = b"".join(chunks)
+    return body, not scanner.done or resp.content.at_eof()
+
+
+# ---------- fetch manager ----------
+def _empty_cache():
+    return {
+        "vlagdagen": {},
+        "last_update": None,
+        # response validators for conditional requests
+        "etag": None,
+        "last_modified": None,
+        "fingerprint": None,
+        "rows_fingerprint": None,
+        "body_size": 0,
+        # source the validators above were received from
+        "source": None,
     }
 
-    return v
+
+def _empty_stats():
+    return {
+        "requests": 0,
+        "conditional_requests": 0,
+        "not_modified": 0,
+        "bytes_received": 0,
+        "bytes_saved": 0,
+        "streams_stopped_early": 0,
+        # refreshes answered with the existing calendar object
+        "unchanged_body": 0,
+        "unchanged_rows": 0,
+        # callers that joined a fetch already in flight
+        "coalesced": 0,
+        "failures": 0,
+        # refreshes not attempted because the circuit breaker was open
+        "rejected": 0,
+        # requests to a further source because the earlier ones were over the latency budget
+        "hedged": 0,
+        # requests abandoned because another source answered first
+        "cancelled": 0,
+        # refreshes answered by a source other than the first
+        "fallback_answers": 0,
+    }
 
 
-# ---------- main fetcher ----------
-async def fetch_vlagdagen():
+class FetchManager:
     """
-    Return dict keyed by ISO dates 'YYYY-MM-DD' -> info.
-    Only fetches remote data on the first day of the month (or when cache is empty).
+    Cache and fetch state of one consumer (a config entry).
+    Concurrent async_fetch() calls share a single in-flight fetch, so overlapping
+    refreshes cause one request and see the same result.
+
+    session is an aiohttp.ClientSession to reuse, e.g. Home Assistant's shared
+    session, so pooled keep-alive connections and DNS caching carry over between
+    fetches. Without it every fetch opens and closes its own session.
+
+    sources is an ordered list of URLs serving the government page, a copy of it
+    or a JSON export of the calendar (see parse_export); it defaults to url, or the
+    government page. A fetch asks the first source and hedges with the next one
+    whenever no request has answered within hedge_delay seconds or a request
+    failed; the first valid answer is used and the other requests are cancelled.
     """
-    global _cache
-    today = date.today()
-    should_fetch = not _cache["vlagdagen"] or today.day == 1
-    if not should_fetch:
+
+    def __init__(
+        self,
+        url: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+        breaker: CircuitBreaker | None = None,
+        today=None,
+        sources: list[str] | None = None,
+        hedge_delay: float = HEDGE_DELAY,
+    ):
+        self.url = url
+        self.sources = list(sources) if sources else []
+        self.hedge_delay = hedge_delay
+        self.session = session
+        # callable returning the current date; date.today() when not given
+        self.today = today
+        self.cache = _empty_cache()
+        self.stats = _empty_stats()
+        # failed fetches back off exponentially; repeated failures open the breaker
+        self.breaker = breaker or CircuitBreaker()
+        self.timeout = AdaptiveTimeout(REQUEST_TIMEOUT.total, MIN_REQUEST_TIMEOUT, REQUEST_TIMEOUT.total)
+        self.metrics = FetchMetrics()
+        self._inflight: asyncio.Future | None = None
+
+    # ---------- cache snapshot ----------
+    def cache_is_stale(self, today: date | None = None) -> bool:
+        """Return True when the cache is empty or was fetched before the current month."""
+        today = today or self._today()
+        last_update = self.cache["last_update"]
+        if not self.cache["vlagdagen"] or last_update is None:
+            return True
+        return (last_update.year, last_update.month) < (today.year, today.month)
+
+    def _today(self) -> date:
+        return self.today() if self.today is not None else date.today()
+
+    def export_cache(self):
+        """Return a JSON-serializable snapshot of the cache, or None when it is empty."""
+        cache = self.cache
+        if not cache["vlagdagen"] or cache["last_update"] is None:
+            return None
+        return {
+            "vlagdagen": dict(cache["vlagdagen"]),
+            "last_update": cache["last_update"].isoformat(),
+            "etag": cache["etag"],
+            "last_modified": cache["last_modified"],
+            "fingerprint": cache["fingerprint"],
+            "rows_fingerprint": cache["rows_fingerprint"],
+            "body_size": cache["body_size"],
+            "source": cache["source"],
+        }
+
+    def restore_cache(self, snapshot) -> bool:
+        """
+        Load a snapshot produced by export_cache() into the cache.
+        Returns True when the snapshot was usable; malformed snapshots leave the cache untouched.
+        """
+        if not isinstance(snapshot, dict):
+            return False
+        vlagdagen = snapshot.get("vlagdagen")
+        if not isinstance(vlagdagen, dict) or not vlagdagen:
+            return False
+        try:
+            last_update = date.fromisoformat(snapshot["last_update"])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        cache = self.cache
+        cache["vlagdagen"] = vlagdagen
+        cache["last_update"] = last_update
+        cache["etag"] = snapshot.get("etag")
+        cache["last_modified"] = snapshot.get("last_modified")
+        cache["fingerprint"] = snapshot.get("fingerprint")
+        cache["rows_fingerprint"] = snapshot.get("rows_fingerprint")
+        cache["body_size"] = snapshot.get("body_size") or 0
+        cache["source"] = snapshot.get("source")
         _LOGGER.debug(
-            "fetch_vlagdagen - skipping remote fetch (day=%d), returning cached %d items",
-            today.day,
-            len(_cache["vlagdagen"]),
+            "restore_cache - restored %d items fetched on %s",
+            len(vlagdagen),
+            last_update.isoformat(),
         )
-        return _cache["vlagdagen"]
+        return True
+
+    def get_fetch_stats(self):
+        """Return transfer counters, the share of 304 answers and the circuit breaker state."""
+        stats = dict(self.stats)
+        conditional = stats["conditional_requests"]
+        stats["not_modified_ratio"] = stats["not_modified"] / conditional if conditional else 0.0
+        stats["circuit"] = self.breaker.state
+        stats["consecutive_failures"] = self.breaker.failures
+        stats["timeout"] = self.timeout.current
+        stats["source"] = self.cache["source"]
+        return stats
+
+    def source_urls(self) -> list[str]:
+        """Return the sources in the order they are asked."""
+        return self.sources or [self.url or URL]
+
+    def _conditional_headers(self, today: date, url: str | None = None):
+        """
+        Return request headers, including validators when the cached calendar can be reused.
+        Validators are only sent while the cache covers the current year, because a 304
+        cannot be used to rebuild the calendar for a new year, and only to the source
+        they came from (a cache from before sources were tracked counts as the first).
+        """
+        cache = self.cache
+        headers = {hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING}
+        last_update = cache["last_update"]
+        if not cache["vlagdagen"] or last_update is None or last_update.year != today.year:
+            return headers
+        if url is not None and (cache["source"] or self.source_urls()[0]) != url:
+            return headers
+        if cache["etag"]:
+            headers[hdrs.IF_NONE_MATCH] = cache["etag"]
+        if cache["last_modified"]:
+            headers[hdrs.IF_MODIFIED_SINCE] = cache["last_modified"]
+        return headers
+
+    # ---------- fetch stage (async) ----------
+    async def _async_fetch_page(self, today: date, stream: bool = True):
+        """
+        Download the flag days from the first source that gives a valid answer.
+        With stream=True an HTML body is read in chunks and the download stops once
+        the flag table has been received; the unread rest of the response is discarded.
+        Returns a dict with the body and response metadata, _NOT_MODIFIED for a 304,
+        or None when every source failed.
+        """
+        stats = self.stats
+        urls = self.source_urls()
+        timeout = aiohttp.ClientTimeout(total=self.timeout.current)
+        if self.session is not None:
+            session_context = contextlib.nullcontext(self.session)
+        else:
+            session_context = aiohttp.ClientSession(timeout=timeout)
+
+        def on_hedge(index: int):
+            stats["hedged"] += 1
+            _LOGGER.debug(
+                "fetch_vlagdagen - no answer within %.1f s, also asking %s", self.hedge_delay, urls[index]
+            )
+
+        errors = []
+        async with session_context as session:
+            attempts = [
+                (lambda url=url: self._async_request(session, url, today, timeout, stream, errors))
+                for url in urls
+            ]
+            index, page = await async_hedged(attempts, self.hedge_delay, on_hedge)
+
+        if page is None:
+            stats["failures"] += 1
+            error = "; ".join(errors) or "no valid answer"
+            self.metrics.record_failure(error)
+            # warn once per outage, the breaker reports when it opens
+            _LOGGER.log(
+                logging.WARNING if not self.breaker.failures else logging.DEBUG,
+                "fetch_vlagdagen - fetch failed: %s, returning cache (%d items)",
+                error,
+                len(self.cache["vlagdagen"]),
+            )
+            return None
+
+        if index:
+            stats["fallback_answers"] += 1
+        self.timeout.observe(page["latency"])
+        self.metrics.record_response(page["latency"], page["wire_size"])
+        if page["not_modified"]:
+            stats["not_modified"] += 1
+            stats["bytes_saved"] += self.cache["body_size"]
+            return _NOT_MODIFIED
+        stats["bytes_received"] += page["wire_size"]
+        # decompression savings: decoded size minus what actually went over the wire
+        stats["bytes_saved"] += max(len(page["body"]) - page["wire_size"], 0)
+        return page
+
+    async def _async_request(self, session, url: str, today: date, timeout, stream: bool, errors: list):
+        """
+        Request one source; returns the page dict, or None when the answer is not usable.
+        A JSON export is parsed right away, it is small and parsing is what validates it.
+        """
+        stats = self.stats
+        headers = self._conditional_headers(today, url)
+        conditional = hdrs.IF_NONE_MATCH in headers or hdrs.IF_MODIFIED_SINCE in headers
+        started = time.monotonic()
+        try:
+            async with session.get(url, headers=headers, timeout=timeout) as resp:
+                stats["requests"] += 1
+                if conditional:
+                    stats["conditional_requests"] += 1
+                if resp.status == 304 and conditional:
+                    return {"url": url, "not_modified": True, "latency": time.monotonic() - started, "wire_size": 0}
+                resp.raise_for_status()
+                export = resp.content_type == "application/json" or url.endswith(".json")
+                if stream and not export:
+                    body, complete = await _async_read_until_table_end(resp)
+                    if not complete:
+                        stats["streams_stopped_early"] += 1
+                        # leaving the context releases the connection; the
+                        # unread remainder makes aiohttp close it instead of reusing it
+                        resp.release()
+                    wire_size = (resp.content_length if complete else None) or len(body)
+                else:
+                    body = await resp.read()
+                    wire_size = resp.content_length or len(body)
+                html = _decode_body(body, resp.charset)
+                etag = resp.headers.get(hdrs.ETAG)
+                last_modified = resp.headers.get(hdrs.LAST_MODIFIED)
+        except asyncio.CancelledError:
+            stats["cancelled"] += 1
+            raise
+        except (aiohttp.ClientError, TimeoutError) as e:
+            errors.append(f"{url}: {e!r}")
+            _LOGGER.debug("fetch_vlagdagen - request to %s failed: %s", url, e)
+            return None
+
+        page = {
+            "url": url,
+            "not_modified": False,
+            "latency": time.monotonic() - started,
+            "body": body,
+            "html": html,
+            "etag": etag,
+            "last_modified": last_modified,
+            "wire_size": wire_size,
+            "vlagdagen": None,
+        }
+        if export:
+            counts = {}
+            parse_started = time.perf_counter()
+            page["vlagdagen"] = parse_export(html, counts)
+            self.metrics.record_parse(
+                time.perf_counter() - parse_started, counts.get("rows_parsed", 0), counts.get("rows_skipped", 0)
+            )
+            if page["vlagdagen"] is None:
+                errors.append(f"{url}: not a calendar export")
+                _LOGGER.debug("fetch_vlagdagen - %s is not a calendar export", url)
+                return None
+        elif not _TABLE_START.search(html):
+            errors.append(f"{url}: no table found")
+            _LOGGER.debug("fetch_vlagdagen - no table found at %s", url)
+            return None
+        return page
+
+    # ---------- main fetcher ----------
+    async def async_fetch(self, executor=None, stream: bool = True, fast: bool = True):
+        """
+        Return dict keyed by ISO dates 'YYYY-MM-DD' -> info, see fetch_vlagdagen().
+        A call made while another is in flight waits for that one instead of
+        starting its own request.
+        """
+        if self._inflight is not None:
+            self.stats["coalesced"] += 1
+            _LOGGER.debug("fetch_vlagdagen - joining fetch already in flight")
+        else:
+            self._inflight = asyncio.ensure_future(self._async_fetch(executor, stream, fast))
+            self._inflight.add_done_callback(self._clear_inflight)
+        # a cancelled caller must not cancel the fetch the others are waiting for
+        return await asyncio.shield(self._inflight)
+
+    def _clear_inflight(self, future: asyncio.Future):
+        if self._inflight is future:
+            self._inflight = None
+
+    async def _async_fetch(self, executor, stream: bool, fast: bool):
+        cache = self.cache
+        stats = self.stats
+        today = self._today()
+        should_fetch = today.day == 1 or self.cache_is_stale(today)
+        if not should_fetch:
+            self.metrics.cache_hits += 1
+            _LOGGER.debug(
+                "fetch_vlagdagen - skipping remote fetch (day=%d), returning cached %d items",
+                today.day,
+                len(cache["vlagdagen"]),
+            )
+            return cache["vlagdagen"]
+
+        if cache["last_update"] == today and cache["vlagdagen"]:
+            self.metrics.cache_hits += 1
+            _LOGGER.debug("fetch_vlagdagen - already fetched today, returning cached %d items", len(cache["vlagdagen"]))
+            return cache["vlagdagen"]
+
+        if not self.breaker.allow_request():
+            stats["rejected"] += 1
+            _LOGGER.debug(
+                "fetch_vlagdagen - circuit open, retry in %.0f s, returning cached %d items",
+                self.breaker.retry_in(),
+                len(cache["vlagdagen"]),
+            )
+            return cache["vlagdagen"]
+
+        page = await self._async_fetch_page(today, stream)
+        if page is None:
+            self.breaker.record_failure()
+            return cache["vlagdagen"]
+        self.breaker.record_success()
+        if page is _NOT_MODIFIED:
+            self.metrics.record_success()
+            cache["last_update"] = today
+            _LOGGER.debug(
+                "fetch_vlagdagen - page not modified, returning cached %d items (304 ratio %.2f)",
+                len(cache["vlagdagen"]),
+                self.get_fetch_stats()["not_modified_ratio"],
+            )
+            return cache["vlagdagen"]
+
+        # the cached calendar can only be reused while it was built for this year
+        reusable = bool(cache["vlagdagen"]) and cache["last_update"].year == today.year
+        fingerprint = hashlib.sha256(page["body"]).hexdigest()
+        if reusable and fingerprint == cache["fingerprint"]:
+            self.metrics.record_success()
+            stats["unchanged_body"] += 1
+            cache["last_update"] = today
+            cache["etag"] = page["etag"]
+            cache["last_modified"] = page["last_modified"]
+            cache["source"] = page["url"]
+            _LOGGER.debug(
+                "fetch_vlagdagen - page unchanged, returning cached %d items without parsing",
+                len(cache["vlagdagen"]),
+            )
+            return cache["vlagdagen"]
+
+        known = cache["rows_fingerprint"] if reusable else None
+        if page["vlagdagen"] is not None:
+            # a JSON export, already parsed while validating the answer
+            table_fingerprint, result = None, page["vlagdagen"]
+        else:
+            # filled in by parse_page in the executor thread, read after it returned
+            counts = {}
+            if executor is None:
+                table_fingerprint, result = await asyncio.get_running_loop().run_in_executor(
+                    None, parse_page, page["html"], today, fast, known, counts
+                )
+            else:
+                table_fingerprint, result = await executor(parse_page, page["html"], today, fast, known, counts)
+            self.metrics.record_parse(
+                counts["seconds"], counts.get("rows_parsed", 0), counts.get("rows_skipped", 0)
+            )
+
+            if table_fingerprint is None:
+                self.metrics.record_failure("no table found")
+                _LOGGER.warning(
+                    "fetch_vlagdagen - no table found at %s, returning cache (%d items)",
+                    page["url"],
+                    len(cache["vlagdagen"]),
+                )
+                return cache["vlagdagen"]
 
-    if _cache["last_update"] == today and _cache["vlagdagen"]:
-        _LOGGER.debug("fetch_vlagdagen - already fetched today, returning cached %d items", len(_cache["vlagdagen"]))
-        return _cache["vlagdagen"]
+        self.metrics.record_success()
+        cache["last_update"] = today
+        cache["etag"] = page["etag"]
+        cache["last_modified"] = page["last_modified"]
+        cache["fingerprint"] = fingerprint
+        cache["body_size"] = page["wire_size"]
+        cache["source"] = page["url"]
 
-    try:
-        async with aiohttp.ClientSession(timeout=REQUEST_TIMEOUT) as session:
-            async with session.get(URL) as resp:
-                resp.raise_for_status()
-                html = await resp.text()
-    except (aiohttp.ClientError, TimeoutError) as e:
-        _LOGGER.warning(
-            "fetch_vlagdagen - fetch failed: %s, returning cache (%d items)",
-            e,
-            len(_cache["vlagdagen"]),
-        )
-        return _cache["vlagdagen"]
+        if result is None:
+            stats["unchanged_rows"] += 1
+            _LOGGER.debug(
+                "fetch_vlagdagen - table rows unchanged, returning cached %d items",
+                len(cache["vlagdagen"]),
+            )
+            return cache["vlagdagen"]
 
-    soup = BeautifulSoup(html, "html.parser")
+        # cache and return
+        cache["vlagdagen"] = result
+        cache["rows_fingerprint"] = table_fingerprint
+        _LOGGER.debug("fetch_vlagdagen - parsed %d iso-date entries", len(result))
+        return result
 
-    table = soup.find("table")
-    result = {}
 
-    if not table:
-        _LOGGER.warning(
-            "fetch_vlagdagen - no table found, returning cache (%d items)",
-            len(_cache["vlagdagen"]),
-        )
-        return _cache["vlagdagen"]
+# ---------- module-level API (default manager) ----------
+_default_manager = FetchManager()
+_cache = _default_manager.cache
+_stats = _default_manager.stats
 
-    rows = table.find_all("tr")
-    for row in rows[1:]:
-        cols = row.find_all("td")
-        if len(cols) < 2:
-            continue
 
-        raw_date_cell = cols[0].get_text(" ", strip=True)
-        reason = cols[1].get_text(" ", strip=True)
+def cache_is_stale(today: date | None = None) -> bool:
+    """Return True when the default cache is empty or from before the current month."""
+    return _default_manager.cache_is_stale(today)
+
+
+def export_cache():
+    """Return a JSON-serializable snapshot of the default cache, or None when it is empty."""
+    return _default_manager.export_cache()
 
-        pm = re.match(r"^(.*?)\s*\((.*?)\)\s*$", raw_date_cell)
-        if pm:
-            main_raw = pm.group(1).strip()
-            alt_raw = pm.group(2).strip()
-        else:
-            main_raw = raw_date_cell.strip()
-            alt_raw = None
-
-        main_day, main_month, main_year, main_has_year = parse_date_string(main_raw)
-        alt_day = alt_month = alt_year = None
-        alt_has_year = False
-        if alt_raw:
-            alt_day, alt_month, alt_year, alt_has_year = parse_date_string(alt_raw)
-
-        years = [main_year] if main_has_year else [today.year, today.year + 1]
-
-        for y in years:
-            if main_day is None or main_month is None:
-                _LOGGER.debug("Skipping unparseable date cell: %s", raw_date_cell)
-                continue
-
-            try:
-                main_dt = date(y, main_month, main_day)
-            except ValueError as e:
-                _LOGGER.debug("Skipping invalid date cell '%s': %s", raw_date_cell, e)
-                continue
-
-            alt_dt = None
-            if alt_raw and (alt_day is not None and alt_month is not None):
-                try:
-                    alt_dt = date(alt_year if alt_has_year else y, alt_month, alt_day)
-                except ValueError as e:
-                    _LOGGER.debug("Ignoring invalid alternative date '%s': %s", alt_raw, e)
-
-            use_dt = main_dt
-            if alt_dt and (main_dt.weekday() == 6 or is_christian_holiday(main_dt)):
-                use_dt = alt_dt
-                _LOGGER.debug(
-                    "Row '%s' reason '%s': main %s is Sunday/holiday -> using alt %s for year %d",
-                    raw_date_cell, reason, main_dt.isoformat(), alt_dt.isoformat(), y
-                )
 
-            key = use_dt.isoformat()
-            result[key] = {
-                "name": reason,
-                "halfstok": "dodenherdenking" in reason.lower(),
-                "wimpel": "koning" in reason.lower() or "koningsdag" in reason.lower() or "wimpel" in reason.lower(),
-                "scope": "all",
-            }
-
-    # add variable days for this and next year
-    result.update(get_variable_days_for_year(today.year))
-    result.update(get_variable_days_for_year(today.year + 1))
-
-    # cache and return
-    _cache["vlagdagen"] = result
-    _cache["last_update"] = today
-    _LOGGER.debug("fetch_vlagdagen - parsed %d iso-date entries", len(result))
-    return result
+def restore_cache(snapshot) -> bool:
+    """Load a snapshot produced by export_cache() into the default cache."""
+    return _default_manager.restore_cache(snapshot)
+
+
+def get_fetch_stats():
+    """Return transfer counters of the default cache."""
+    return _default_manager.get_fetch_stats()
+
+
+async def fetch_vlagdagen(executor=None, stream: bool = True, fast: bool = True):
+    """
+    Return dict keyed by ISO dates 'YYYY-MM-DD' -> info.
+    Only fetches remote data on the first day of the month (or when the cache is
+    empty or was fetched before the current month, e.g. restored from disk).
+
+    executor runs the synchronous parse stage, with the signature of
+    hass.async_add_executor_job; it defaults to the event loop's default executor.
+    stream stops downloading once the flag table is complete, fast selects the
+    stdlib table extractor (with BeautifulSoup as fallback) over BeautifulSoup only.
+
+    Uses a module-wide default FetchManager; the integration gives each config
+    entry its own manager.
+    """
+    return await _default_manager.async_fetch(executor, stream, fast)
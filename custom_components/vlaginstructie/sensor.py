@@ -1,17 +1,17 @@
-"""Sensors for Vlaginstructie using ISO-date keys from scraper."""
+"""Sensors for Vlaginstructie, read from the coordinator's day snapshot."""
 
-import logging
-from datetime import date, datetime, timedelta
-
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .entity import ChangeOnlyWriteMixin
 
-_LOGGER = logging.getLogger(__name__)
+# metric summaries change on every fetch and are rebuilt from the fetcher
+SUMMARY_ATTRIBUTES = frozenset({"count", "last", "mean", "p95", "max"})
 
 
-class VlagInstructieBaseSensor(CoordinatorEntity, SensorEntity):
+class VlagInstructieBaseSensor(ChangeOnlyWriteMixin, CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, name: str, unique_id: str):
         super().__init__(coordinator)
         self._name = name
@@ -27,35 +27,27 @@ class VlagInstructieBaseSensor(CoordinatorEntity, SensorEntity):
 
 
 class VlagInstructieDaySensor(VlagInstructieBaseSensor):
+    # reason repeats the state, the rest follows from the date or is on the binary sensors
+    _unrecorded_attributes = frozenset(
+        {"reason", "date", "scope", "wimpel", "halfstok", "data_age_days"}
+    )
+
     def __init__(self, coordinator, name: str, unique_id: str, offset_days: int):
         super().__init__(coordinator, name, unique_id)
         self._offset_days = offset_days
 
     @property
-    def _target_date(self):
-        return date.today() + timedelta(days=self._offset_days)
+    def _day(self):
+        snapshot = self.coordinator.day_snapshot
+        return snapshot.tomorrow if self._offset_days else snapshot.today
 
     @property
     def state(self):
-        info = self.coordinator.data.get(self._target_date.isoformat())
-        if info:
-            return info.get("name")
-        return "No flag instruction"
+        return self._day.name or "No flag instruction"
 
     @property
     def extra_state_attributes(self):
-        target_date = self._target_date
-        target_iso = target_date.isoformat()
-        info = self.coordinator.data.get(target_iso)
-        if info:
-            return {
-                "reason": info.get("name"),
-                "date": target_iso,
-                "scope": info.get("scope"),
-                "wimpel": info.get("wimpel"),
-                "halfstok": info.get("halfstok"),
-            }
-        return {"date": target_iso}
+        return self._day.attributes
 
 
 class VlagInstructieTodaySensor(VlagInstructieDaySensor):
@@ -79,56 +71,133 @@ class VlagInstructieTomorrowSensor(VlagInstructieDaySensor):
 
 
 class NextFlagDaySensor(VlagInstructieBaseSensor):
+    # date repeats the state; reason is kept so the history shows the occasion
+    _unrecorded_attributes = frozenset({"date", "scope", "wimpel", "halfstok", "data_age_days"})
+
     def __init__(self, coordinator):
         super().__init__(coordinator, "next_flag_day", "vlaginstructie_sensor_next_flag_day")
 
-    def _next_flag_day(self):
-        vlagdagen = self.coordinator.data
-        _LOGGER.debug("NextFlagDaySensor - fetched %d items", len(vlagdagen))
+    @property
+    def state(self):
+        next_day = self.coordinator.day_snapshot.next_flag_day
+        if next_day is None:
+            return "No upcoming flag day"
+        return next_day.day.isoformat()
 
-        parsed = []
-        for iso_key, info in vlagdagen.items():
-            try:
-                d = datetime.strptime(iso_key, "%Y-%m-%d").date()
-                parsed.append((d, info))
-            except Exception:
-                _LOGGER.debug("NextFlagDaySensor - skipping invalid key: %s", iso_key)
+    @property
+    def extra_state_attributes(self):
+        next_day = self.coordinator.day_snapshot.next_flag_day
+        if next_day is None:
+            return {}
+        return next_day.attributes
 
-        if not parsed:
-            _LOGGER.warning("NextFlagDaySensor - no parsed dates available")
-            return None, None
 
-        today = date.today()
-        future = [(d, info) for d, info in parsed if d >= today]
-        future.sort(key=lambda x: x[0])
+class VlagInstructieDiagnosticSensor(ChangeOnlyWriteMixin, SensorEntity):
+    """Fetch metric, updated after every refresh; disabled by default."""
 
-        _LOGGER.debug("NextFlagDaySensor - %d future entries after %s", len(future), today.isoformat())
-        if not future:
-            return None, None
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = False
 
-        return future[0]
+    def __init__(self, coordinator, key: str):
+        self.coordinator = coordinator
+        self._key = key
+        self._attr_name = f"vlaginstructie_{key}"
+        self._attr_unique_id = f"vlaginstructie_diagnostic_{key}"
 
     @property
-    def state(self):
-        next_d, _next_info = self._next_flag_day()
-        if not next_d:
-            return "No upcoming flag day"
-        return next_d.isoformat()
+    def _metrics(self):
+        return self.coordinator.fetcher.metrics
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_metrics_listener(self.async_write_ha_state_if_changed)
+        )
+
+
+class LastFetchSuccessSensor(VlagInstructieDiagnosticSensor):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator, "last_fetch_success")
+
+    @property
+    def native_value(self):
+        return self._metrics.last_success
+
+
+class LastFetchFailureSensor(VlagInstructieDiagnosticSensor):
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator, "last_fetch_failure")
+
+    @property
+    def native_value(self):
+        return self._metrics.last_failure
 
     @property
     def extra_state_attributes(self):
-        next_d, next_info = self._next_flag_day()
-        if not next_d:
-            return {}
+        return {"error": self._metrics.last_error}
+
+
+class FetchLatencySensor(VlagInstructieDiagnosticSensor):
+    _unrecorded_attributes = SUMMARY_ATTRIBUTES
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator, "fetch_latency")
+
+    @property
+    def native_value(self):
+        return self._metrics.http_latency_ms.mean
+
+    @property
+    def extra_state_attributes(self):
+        return self._metrics.http_latency_ms.summary()
+
+
+class ParseDurationSensor(VlagInstructieDiagnosticSensor):
+    _unrecorded_attributes = SUMMARY_ATTRIBUTES | {"rows_parsed", "rows_skipped"}
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator, "parse_duration")
+
+    @property
+    def native_value(self):
+        return self._metrics.parse_ms.mean
+
+    @property
+    def extra_state_attributes(self):
+        metrics = self._metrics
         return {
-            "reason": next_info.get("name"),
-            "date": next_d.isoformat(),
-            "scope": next_info.get("scope"),
-            "wimpel": next_info.get("wimpel"),
-            "halfstok": next_info.get("halfstok"),
+            **metrics.parse_ms.summary(),
+            "rows_parsed": metrics.rows_parsed,
+            "rows_skipped": metrics.rows_skipped,
         }
 
 
+class CacheHitRatioSensor(VlagInstructieDiagnosticSensor):
+    _unrecorded_attributes = frozenset({"cache_hits", "fetches"})
+    _attr_native_unit_of_measurement = PERCENTAGE
+
+    def __init__(self, coordinator):
+        super().__init__(coordinator, "cache_hit_ratio")
+
+    @property
+    def native_value(self):
+        ratio = self._metrics.cache_hit_ratio
+        return round(ratio * 100, 1) if ratio is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        return {"cache_hits": self._metrics.cache_hits, "fetches": self._metrics.fetches}
+
+
 async def async_setup_entry(hass, entry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
@@ -136,5 +205,10 @@ async def async_setup_entry(hass, entry, async_add_entities):
             VlagInstructieTodaySensor(coordinator),
             VlagInstructieTomorrowSensor(coordinator),
             NextFlagDaySensor(coordinator),
+            LastFetchSuccessSensor(coordinator),
+            LastFetchFailureSensor(coordinator),
+            FetchLatencySensor(coordinator),
+            ParseDurationSensor(coordinator),
+            CacheHitRatioSensor(coordinator),
         ]
     )
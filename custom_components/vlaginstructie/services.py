@@ -0,0 +1,203 @@
+"""Services for the Vlaginstructie integration."""
+
+from datetime import date, timedelta
+import logging
+from pathlib import Path
+import sqlite3
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util import dt as dt_util
+
+from .archive import GROUPS, KINDS
+from .const import DOMAIN
+from .profiler import ProfileResult, write_results
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_GET_FLAG_DAYS = "get_flag_days"
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+SERVICE_GET_ARCHIVED_FLAG_DAYS = "get_archived_flag_days"
+SERVICE_GET_FLAG_DAY_HISTORY = "get_flag_day_history"
+
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_HALFSTOK = "halfstok"
+ATTR_WIMPEL = "wimpel"
+ATTR_NAME = "name"
+ATTR_COUNT = "count"
+ATTR_TRACE_MEMORY = "trace_memory"
+ATTR_TOP = "top"
+ATTR_REFRESH = "refresh"
+ATTR_KIND = "kind"
+ATTR_GROUP_BY = "group_by"
+ATTR_DATE = "date"
+
+# end_date defaults to a year after start_date; longer ranges are refused
+DEFAULT_RANGE = timedelta(days=365)
+MAX_RANGE = timedelta(days=366 * 50)
+
+GET_FLAG_DAYS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_HALFSTOK): cv.boolean,
+        vol.Optional(ATTR_WIMPEL): cv.boolean,
+        vol.Optional(ATTR_NAME): cv.string,
+    }
+)
+
+GET_ARCHIVED_FLAG_DAYS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_KIND): vol.In(KINDS),
+        vol.Optional(ATTR_NAME): cv.string,
+        vol.Optional(ATTR_GROUP_BY): vol.In(GROUPS),
+    }
+)
+
+GET_FLAG_DAY_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DATE): cv.date,
+    }
+)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_COUNT, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+        vol.Optional(ATTR_TRACE_MEMORY, default=False): cv.boolean,
+        vol.Optional(ATTR_TOP, default=20): vol.All(vol.Coerce(int), vol.Range(min=5, max=100)),
+        vol.Optional(ATTR_REFRESH, default=True): cv.boolean,
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant):
+    coordinators = hass.data.get(DOMAIN)
+    if not coordinators:
+        raise ServiceValidationError("Vlaginstructie is not loaded")
+    return next(iter(coordinators.values()))
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_get_flag_days(call: ServiceCall) -> ServiceResponse:
+        """Return the flag days in a date range, end date excluded."""
+        coordinator = _get_coordinator(hass)
+
+        start = call.data.get(ATTR_START_DATE) or dt_util.now().date()
+        end = call.data.get(ATTR_END_DATE) or start + DEFAULT_RANGE
+        if end <= start:
+            raise ServiceValidationError("end_date must be after start_date")
+        if end - start > MAX_RANGE:
+            raise ServiceValidationError("The date range can span at most 50 years")
+        # the rules only describe the calendar's years and later, not past flag days
+        store = coordinator.event_store
+        first = date(store.first_year, 1, 1)
+        if start < first:
+            raise ServiceValidationError(
+                f"start_date must be on or after {first.isoformat()};"
+                f" use {DOMAIN}.{SERVICE_GET_ARCHIVED_FLAG_DAYS} for past flag days"
+            )
+
+        flag_days = store.query(
+            start,
+            end,
+            halfstok=call.data.get(ATTR_HALFSTOK),
+            wimpel=call.data.get(ATTR_WIMPEL),
+            name=call.data.get(ATTR_NAME),
+        )
+        return {"flag_days": flag_days}
+
+    async def async_get_archived_flag_days(call: ServiceCall) -> ServiceResponse:
+        """Return the archived official flag days in a date range, or their counts."""
+        coordinator = _get_coordinator(hass)
+
+        end = call.data.get(ATTR_END_DATE) or dt_util.now().date() + timedelta(days=1)
+        start = call.data.get(ATTR_START_DATE) or end - DEFAULT_RANGE
+        if end <= start:
+            raise ServiceValidationError("end_date must be after start_date")
+
+        kind = call.data.get(ATTR_KIND)
+        name = call.data.get(ATTR_NAME)
+        group_by = call.data.get(ATTR_GROUP_BY)
+        archive = coordinator.archive
+        try:
+            if group_by is not None:
+                counts = await hass.async_add_executor_job(archive.counts, start, end, group_by, kind, name)
+                return {"counts": counts}
+            flag_days = await hass.async_add_executor_job(archive.days, start, end, kind, name)
+        except sqlite3.Error as err:
+            raise HomeAssistantError(f"Could not read the flag day archive: {err}") from err
+        return {"flag_days": flag_days}
+
+    async def async_get_flag_day_history(call: ServiceCall) -> ServiceResponse:
+        """Return how a date appeared in every archived table covering its year."""
+        coordinator = _get_coordinator(hass)
+        try:
+            history = await hass.async_add_executor_job(coordinator.archive.history, call.data[ATTR_DATE])
+        except sqlite3.Error as err:
+            raise HomeAssistantError(f"Could not read the flag day archive: {err}") from err
+        return {"history": history}
+
+    async def async_write_profile(result: ProfileResult) -> None:
+        prof_path, summary_path = await hass.async_add_executor_job(
+            write_results, result, Path(hass.config.path()), dt_util.now()
+        )
+        _LOGGER.info("Refresh profile written to %s (summary in %s)", prof_path, summary_path)
+
+    async def async_profile_refresh(call: ServiceCall) -> None:
+        """Profile the next refreshes and write the results to the config directory."""
+        coordinator = _get_coordinator(hass)
+        profiler = coordinator.profiler
+        if profiler.armed:
+            raise ServiceValidationError("A refresh profile is already being recorded")
+
+        count = call.data[ATTR_COUNT]
+        profiler.arm(
+            lambda result: hass.async_create_task(async_write_profile(result)),
+            shots=count,
+            trace_memory=call.data[ATTR_TRACE_MEMORY],
+            top=call.data[ATTR_TOP],
+        )
+        if call.data[ATTR_REFRESH]:
+            for _ in range(count):
+                await coordinator.async_refresh()
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FLAG_DAYS,
+        async_get_flag_days,
+        schema=GET_FLAG_DAYS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ARCHIVED_FLAG_DAYS,
+        async_get_archived_flag_days,
+        schema=GET_ARCHIVED_FLAG_DAYS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FLAG_DAY_HISTORY,
+        async_get_flag_day_history,
+        schema=GET_FLAG_DAY_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,46 @@
+"""HTTP views for the Vlaginstructie integration."""
+
+from http import HTTPStatus
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+
+from .const import DOMAIN
+
+ICS_URL = "/api/vlaginstructie/flag_days.ics"
+
+
+class VlagInstructieIcsView(HomeAssistantView):
+    """Serve the flag calendar as an iCalendar feed."""
+
+    url = ICS_URL
+    name = "api:vlaginstructie:ics"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the feed, or 304 when the client already has this version."""
+        coordinators = request.app[KEY_HASS].data.get(DOMAIN)
+        if not coordinators:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        feed = next(iter(coordinators.values())).ics_feed
+
+        # pollers revalidate on every request; the feed is only sent when it changed
+        headers = {hdrs.CACHE_CONTROL: "private, no-cache"}
+        if_none_match = request.if_none_match
+        if if_none_match and any(
+            tag.value == "*" or tag.value == feed.etag for tag in if_none_match
+        ):
+            response = web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        else:
+            response = web.Response(
+                body=feed.body,
+                content_type="text/calendar",
+                charset="utf-8",
+                headers={
+                    **headers,
+                    hdrs.CONTENT_DISPOSITION: 'inline; filename="vlaginstructie.ics"',
+                },
+            )
+        response.etag = feed.etag
+        return response
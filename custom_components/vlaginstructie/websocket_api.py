@@ -0,0 +1,57 @@
+"""Websocket commands for frontend cards."""
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api import ActiveConnection
+from homeassistant.components.websocket_api.messages import construct_result_message
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+def _event_message(iden: int, payload: bytes) -> bytes:
+    """Wrap an already serialized payload in an event message."""
+    return b"".join((b'{"id":', str(iden).encode(), b',"type":"event","event":', payload, b"}"))
+
+
+def _coordinator(hass: HomeAssistant, connection: ActiveConnection, msg: dict):
+    coordinators = hass.data.get(DOMAIN)
+    if not coordinators:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Vlaginstructie is not loaded")
+        return None
+    return next(iter(coordinators.values()))
+
+
+@websocket_api.websocket_command({vol.Required("type"): "vlaginstructie/calendar"})
+@callback
+def websocket_get_calendar(hass: HomeAssistant, connection: ActiveConnection, msg: dict) -> None:
+    """Return all flag days and today's state in one message."""
+    if (coordinator := _coordinator(hass, connection, msg)) is None:
+        return
+    connection.send_message(construct_result_message(msg["id"], coordinator.calendar_payload))
+
+
+@websocket_api.websocket_command({vol.Required("type"): "vlaginstructie/subscribe_calendar"})
+@callback
+def websocket_subscribe_calendar(hass: HomeAssistant, connection: ActiveConnection, msg: dict) -> None:
+    """Send the full calendar, then only the changes of every new version."""
+    if (coordinator := _coordinator(hass, connection, msg)) is None:
+        return
+    iden = msg["id"]
+
+    @callback
+    def send(payload: bytes) -> None:
+        connection.send_message(_event_message(iden, payload))
+
+    full = coordinator.calendar_payload
+    connection.subscriptions[iden] = coordinator.async_subscribe_calendar(send)
+    connection.send_result(iden)
+    send(full)
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_get_calendar)
+    websocket_api.async_register_command(hass, websocket_subscribe_calendar)
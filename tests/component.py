@@ -0,0 +1,22 @@
+"""Load Vlaginstructie modules that do not depend on Home Assistant.
+
+The integration's __init__ imports Home Assistant, so modules are imported as
+submodules of a bare stand-in package; relative imports between them still work.
+"""
+
+import importlib
+from pathlib import Path
+import sys
+import types
+
+COMPONENT_PATH = Path(__file__).resolve().parents[1] / "custom_components" / "vlaginstructie"
+PACKAGE = "vlaginstructie_standalone"
+
+
+def load(name: str):
+    """Import and return custom_components/vlaginstructie/<name>.py."""
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(COMPONENT_PATH)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
@@ -0,0 +1,468 @@
+"""Light stand-ins for the parts of Home Assistant the coordinator, entities and services use.
+
+load_integration() imports integration modules (see component.py) while these
+stand-ins are installed as the homeassistant modules, then restores sys.modules,
+so nothing else sees them. StubHass runs timers and tasks on a caller-supplied
+clock: async_fire_due() fires the timers due at the current time and waits for
+the tasks they start, like async_fire_time_changed in Home Assistant's tests.
+
+The stand-ins follow Home Assistant's behaviour where the integration depends on
+it: DataUpdateCoordinator notifies only on changed data when always_update is
+False and reschedules the next refresh after every refresh, CoordinatorEntity
+writes on every notification, and the platform writes an entity's first state
+after async_added_to_hass.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import date, datetime, timedelta, timezone
+from enum import StrEnum
+import heapq
+import itertools
+import json
+from pathlib import Path
+import sys
+import types
+from typing import Any, Generic, TypeVar
+from zoneinfo import ZoneInfo
+
+from component import load
+
+TIME_ZONE = ZoneInfo("Europe/Amsterdam")
+
+CALLBACK_TYPE = Callable[[], None]
+_DataT = TypeVar("_DataT")
+
+
+def callback(func):
+    """Mark a function as safe to run in the event loop."""
+    func._hass_callback = True
+    return func
+
+
+class HomeAssistantError(Exception):
+    pass
+
+
+class ServiceValidationError(HomeAssistantError):
+    pass
+
+
+class SupportsResponse(StrEnum):
+    NONE = "none"
+    OPTIONAL = "optional"
+    ONLY = "only"
+
+
+class ServiceCall:
+    def __init__(self, domain: str, service: str, data: dict | None = None) -> None:
+        self.domain = domain
+        self.service = service
+        self.data = data or {}
+
+
+class StubServices:
+    """Service registry; handlers are called directly, without their schema."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[tuple[str, str], Callable] = {}
+
+    def async_register(self, domain: str, service: str, handler, schema=None, supports_response=None) -> None:
+        self.handlers[(domain, service)] = handler
+
+    async def async_call(self, domain: str, service: str, data: dict | None = None):
+        return await self.handlers[(domain, service)](ServiceCall(domain, service, data))
+
+
+def async_register_admin_service(hass, domain: str, service: str, service_func, schema=None) -> None:
+    hass.services.async_register(domain, service, service_func, schema)
+
+
+class StubConfig:
+    def __init__(self, config_dir: Path | str) -> None:
+        self.config_dir = str(config_dir)
+
+    def path(self, *parts: str) -> str:
+        return str(Path(self.config_dir, *parts))
+
+
+class StubHass:
+    """Event loop side of Home Assistant on a simulated clock."""
+
+    def __init__(self, utcnow: Callable[[], datetime], config_dir: Path | str, session) -> None:
+        self.utcnow = utcnow
+        self.config = StubConfig(config_dir)
+        self.session = session
+        self.data: dict = {}
+        self.services = StubServices()
+        # entity_id -> (state, attributes) as last written
+        self.states: dict[str, tuple] = {}
+        self.state_writes = 0
+        self._timers: list = []
+        self._order = itertools.count()
+        self._tasks: set[asyncio.Task] = set()
+
+    def async_create_task(self, target, name: str | None = None) -> asyncio.Task:
+        task = asyncio.ensure_future(target)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def async_add_executor_job(self, func, *args):
+        # run inline; the simulation measures CPU time, not concurrency
+        return func(*args)
+
+    def async_track_point(self, point: datetime, action) -> CALLBACK_TYPE:
+        """Call action(point) once the clock reaches point; returns the cancel callback."""
+        timer = [point, next(self._order), action]
+        heapq.heappush(self._timers, timer)
+
+        def cancel() -> None:
+            timer[2] = None
+
+        return cancel
+
+    async def async_block_till_done(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*tuple(self._tasks))
+
+    async def async_fire_due(self) -> None:
+        """Fire the timers due at the current time, in order, and wait for their tasks."""
+        now = self.utcnow()
+        while self._timers and self._timers[0][0] <= now:
+            point, _order, action = heapq.heappop(self._timers)
+            if action is not None:
+                action(point)
+                await self.async_block_till_done()
+        await self.async_block_till_done()
+
+    def async_write_state(self, entity) -> None:
+        attributes = {**(entity.state_attributes or {}), **(entity.extra_state_attributes or {})}
+        self.states[entity.entity_id] = (entity.state, attributes)
+        self.state_writes += 1
+
+
+class StubConfigEntry:
+    def __init__(self, entry_id: str = "sim", options: dict | None = None) -> None:
+        self.entry_id = entry_id
+        self.options = options or {}
+        self._on_unload: list = []
+
+    def async_create_background_task(self, hass: StubHass, target, name: str) -> asyncio.Task:
+        return hass.async_create_task(target, name)
+
+    def async_on_unload(self, func) -> None:
+        self._on_unload.append(func)
+
+
+class Store:
+    """In-memory storage helper; nothing is restored."""
+
+    def __init__(self, hass, version: int, key: str) -> None:
+        self.key = key
+        self.saved = None
+
+    async def async_load(self):
+        return None
+
+    def async_delay_save(self, data_func, delay: float = 0) -> None:
+        self.saved = data_func()
+
+
+def async_call_later(hass: StubHass, delay: float, action) -> CALLBACK_TYPE:
+    return hass.async_track_point(hass.utcnow() + timedelta(seconds=delay), action)
+
+
+def async_track_point_in_utc_time(hass: StubHass, action, point_in_time: datetime) -> CALLBACK_TYPE:
+    return hass.async_track_point(point_in_time, action)
+
+
+def async_get_clientsession(hass: StubHass):
+    return hass.session
+
+
+def json_bytes(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def now() -> datetime:
+    return datetime.now(TIME_ZONE)
+
+
+def as_utc(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc)
+
+
+def as_local(value: datetime) -> datetime:
+    return value.astimezone(TIME_ZONE)
+
+
+class DataUpdateCoordinator(Generic[_DataT]):
+    def __init__(
+        self,
+        hass: StubHass,
+        logger,
+        *,
+        config_entry: StubConfigEntry | None = None,
+        name: str,
+        update_interval: timedelta | None = None,
+        always_update: bool = True,
+    ) -> None:
+        self.hass = hass
+        self.logger = logger
+        self.config_entry = config_entry
+        self.name = name
+        self.update_interval = update_interval
+        self.always_update = always_update
+        self.data: _DataT | None = None
+        self.last_update_success = True
+        self._listeners: dict[CALLBACK_TYPE, CALLBACK_TYPE] = {}
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE, context: Any = None) -> CALLBACK_TYPE:
+        schedule_refresh = not self._listeners
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.pop(remove_listener)
+            if not self._listeners:
+                self._async_unsub_refresh()
+
+        self._listeners[remove_listener] = update_callback
+        if schedule_refresh:
+            self._schedule_refresh()
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        for update_callback in tuple(self._listeners.values()):
+            update_callback()
+
+    @callback
+    def _async_unsub_refresh(self) -> None:
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        if self.update_interval is None:
+            return
+        self._async_unsub_refresh()
+        self._unsub_refresh = self.hass.async_track_point(
+            self.hass.utcnow() + self.update_interval, self._handle_refresh_interval
+        )
+
+    @callback
+    def _handle_refresh_interval(self, _now: datetime) -> None:
+        self._unsub_refresh = None
+        self.hass.async_create_task(self._async_refresh())
+
+    async def _async_update_data(self) -> _DataT:
+        raise NotImplementedError
+
+    async def async_refresh(self) -> None:
+        await self._async_refresh()
+
+    async def _async_refresh(self) -> None:
+        self._async_unsub_refresh()
+        previous_data = self.data
+        try:
+            self.data = await self._async_update_data()
+        finally:
+            if self._listeners:
+                self._schedule_refresh()
+        if self.always_update or previous_data != self.data:
+            self.async_update_listeners()
+
+    @callback
+    def async_set_updated_data(self, data: _DataT) -> None:
+        self._async_unsub_refresh()
+        self.data = data
+        self.last_update_success = True
+        if self._listeners:
+            self._schedule_refresh()
+        self.async_update_listeners()
+
+
+class Entity:
+    entity_id: str | None = None
+    hass: StubHass | None = None
+    _attr_name: str | None = None
+    _attr_unique_id: str | None = None
+    _unrecorded_attributes: frozenset = frozenset()
+
+    @property
+    def name(self):
+        return self._attr_name
+
+    @property
+    def unique_id(self):
+        return self._attr_unique_id
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @property
+    def state(self):
+        return None
+
+    @property
+    def state_attributes(self) -> dict | None:
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        pass
+
+    @callback
+    def async_on_remove(self, func: CALLBACK_TYPE) -> None:
+        pass
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self.hass.async_write_state(self)
+
+
+class CoordinatorEntity(Entity):
+    def __init__(self, coordinator: DataUpdateCoordinator, context: Any = None) -> None:
+        self.coordinator = coordinator
+
+    @property
+    def available(self) -> bool:
+        return self.coordinator.last_update_success
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self.async_write_ha_state()
+
+
+class SensorEntity(Entity):
+    @property
+    def native_value(self):
+        return None
+
+    @property
+    def state(self):
+        return self.native_value
+
+
+class BinarySensorEntity(Entity):
+    @property
+    def is_on(self) -> bool | None:
+        return None
+
+    @property
+    def state(self):
+        is_on = self.is_on
+        return None if is_on is None else ("on" if is_on else "off")
+
+
+async def async_add_entity(hass: StubHass, domain: str, entity: Entity) -> None:
+    """Add an entity the way an entity platform does."""
+    entity.hass = hass
+    entity.entity_id = f"{domain}.{entity.name}"
+    await entity.async_added_to_hass()
+    entity.async_write_ha_state()
+
+
+class SensorDeviceClass(StrEnum):
+    DURATION = "duration"
+    TIMESTAMP = "timestamp"
+
+
+class EntityCategory(StrEnum):
+    DIAGNOSTIC = "diagnostic"
+
+
+class UnitOfTime(StrEnum):
+    MILLISECONDS = "ms"
+
+
+def _module(name: str, **attributes) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    return module
+
+
+def _package(name: str) -> types.ModuleType:
+    return _module(name, __path__=[])
+
+
+MODULES = {
+    module.__name__: module
+    for module in (
+        _package("homeassistant"),
+        _package("homeassistant.components"),
+        _package("homeassistant.helpers"),
+        _package("homeassistant.util"),
+        _module("homeassistant.components.binary_sensor", BinarySensorEntity=BinarySensorEntity),
+        _module(
+            "homeassistant.components.sensor",
+            SensorDeviceClass=SensorDeviceClass,
+            SensorEntity=SensorEntity,
+        ),
+        _module("homeassistant.config_entries", ConfigEntry=StubConfigEntry),
+        _module(
+            "homeassistant.const",
+            PERCENTAGE="%",
+            EntityCategory=EntityCategory,
+            UnitOfTime=UnitOfTime,
+        ),
+        _module(
+            "homeassistant.core",
+            CALLBACK_TYPE=CALLBACK_TYPE,
+            HomeAssistant=StubHass,
+            ServiceCall=ServiceCall,
+            ServiceResponse=dict | None,
+            SupportsResponse=SupportsResponse,
+            callback=callback,
+        ),
+        _module(
+            "homeassistant.exceptions",
+            HomeAssistantError=HomeAssistantError,
+            ServiceValidationError=ServiceValidationError,
+        ),
+        _module("homeassistant.helpers.config_validation", boolean=bool, date=date.fromisoformat, string=str),
+        _module("homeassistant.helpers.service", async_register_admin_service=async_register_admin_service),
+        _module("homeassistant.helpers.aiohttp_client", async_get_clientsession=async_get_clientsession),
+        _module(
+            "homeassistant.helpers.event",
+            async_call_later=async_call_later,
+            async_track_point_in_utc_time=async_track_point_in_utc_time,
+        ),
+        _module("homeassistant.helpers.json", json_bytes=json_bytes),
+        _module("homeassistant.helpers.storage", Store=Store),
+        _module(
+            "homeassistant.helpers.update_coordinator",
+            CoordinatorEntity=CoordinatorEntity,
+            DataUpdateCoordinator=DataUpdateCoordinator,
+        ),
+        _module("homeassistant.util.dt", as_local=as_local, as_utc=as_utc, now=now),
+    )
+}
+
+
+def load_integration(*names: str) -> tuple[types.ModuleType, ...]:
+    """Import custom_components/vlaginstructie/<name>.py for each name against the stand-ins."""
+    saved = {name: sys.modules.get(name) for name in MODULES}
+    sys.modules.update(MODULES)
+    try:
+        return tuple(load(name) for name in names)
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                del sys.modules[name]
+            else:
+                sys.modules[name] = module
@@ -0,0 +1,254 @@
+"""Time-travel simulation of the Vlaginstructie coordinator and its entities.
+
+The integration's own coordinator and its nine sensor and binary sensor
+entities run on light Home Assistant stand-ins (ha_stubs.py) and a SimClock
+instead of the wall clock. async_simulate sets them up like async_setup_entry,
+then steps the clock minute by minute against a local stand-in for the
+government page, firing the coordinator's refresh and transition timers when
+they are due. It reports every entity state change, the requests and parses it
+cost, the state writes made and avoided, and the CPU time per simulated day.
+
+Every verify_every minutes each published state is compared with the same
+entity class reading a snapshot resolved from scratch for that minute; a
+difference means the entity would show a stale value at that moment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+import tempfile
+import time as time_module
+from zoneinfo import ZoneInfo
+
+from aiohttp import ClientSession, hdrs, web
+from aiohttp.test_utils import TestServer
+
+from component import load
+from ha_stubs import StubConfigEntry, StubHass, async_add_entity, load_integration
+
+coordinator_module, sensor, binary_sensor = load_integration("coordinator", "sensor", "binary_sensor")
+const = load("const")
+day_snapshot = load("day_snapshot")
+
+LOCAL = ZoneInfo("Europe/Amsterdam")
+PAGE = Path(__file__).resolve().parent / "fixtures" / "vlaginstructie.html"
+
+# (platform, entity class), as the platforms add them
+ENTITY_CLASSES = (
+    ("sensor", sensor.VlagInstructieTodaySensor),
+    ("sensor", sensor.VlagInstructieTomorrowSensor),
+    ("sensor", sensor.NextFlagDaySensor),
+    ("binary_sensor", binary_sensor.VlagUithangenToday),
+    ("binary_sensor", binary_sensor.VlagHalfstokToday),
+    ("binary_sensor", binary_sensor.OranjeWimpelToday),
+    ("binary_sensor", binary_sensor.VlagUithangenTomorrow),
+    ("binary_sensor", binary_sensor.VlagHalfstokTomorrow),
+    ("binary_sensor", binary_sensor.OranjeWimpelTomorrow),
+)
+
+
+class SnapshotProbe:
+    """Stands in for the coordinator with a day snapshot resolved from scratch."""
+
+    day_snapshot = None
+
+
+class SimClock:
+    """Clock that moves in UTC and reports Europe/Amsterdam local time."""
+
+    def __init__(self, start: datetime) -> None:
+        self.utc = start.astimezone(timezone.utc)
+
+    def now(self) -> datetime:
+        return self.utc.astimezone(LOCAL)
+
+    def today(self) -> date:
+        return self.now().date()
+
+    def advance(self, delta: timedelta) -> None:
+        self.utc += delta
+
+
+class StubServer:
+    """Local stand-in for the government page that answers If-None-Match with 304."""
+
+    def __init__(self, html: str) -> None:
+        self.html = html
+        self.etag = '"sim-1"'
+        self.responses = 0
+        self.not_modified = 0
+        self._server: TestServer | None = None
+
+    async def handler(self, request: web.Request) -> web.Response:
+        if request.headers.get(hdrs.IF_NONE_MATCH) == self.etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={hdrs.ETAG: self.etag})
+        self.responses += 1
+        return web.Response(text=self.html, content_type="text/html", headers={hdrs.ETAG: self.etag})
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/", self.handler)
+        self._server = TestServer(app)
+        await self._server.start_server()
+        return str(self._server.make_url("/"))
+
+    async def close(self) -> None:
+        await self._server.close()
+
+
+@dataclass
+class SimulationReport:
+    """What happened during a simulation."""
+
+    start: datetime
+    end: datetime
+    entities: list[str] = field(default_factory=list)
+    minutes: int = 0
+    # (local time, entity id, old state, new state)
+    transitions: list[tuple] = field(default_factory=list)
+    # (local time, entity id, published state, expected state)
+    stale: list[tuple] = field(default_factory=list)
+    requests: int = 0
+    not_modified: int = 0
+    parses: int = 0
+    refreshes: int = 0
+    # coordinator notifications after the entities were added
+    notifications: int = 0
+    # state writes after the entities were added, and the ones ChangeOnlyWriteMixin skipped
+    state_writes: int = 0
+    avoided_writes: int = 0
+    cpu_per_day: list[float] = field(default_factory=list)
+
+    def transitions_of(self, entity_id: str) -> list[tuple]:
+        return [change for change in self.transitions if change[1] == entity_id]
+
+    def summary(self) -> dict:
+        """Return the counters as a JSON-serializable dict."""
+        days = len(self.cpu_per_day)
+        per_entity = {entity_id: len(self.transitions_of(entity_id)) for entity_id in self.entities}
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "days": days,
+            "minutes": self.minutes,
+            "transitions": per_entity,
+            "stale_minutes": len(self.stale),
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "parses": self.parses,
+            "refreshes": self.refreshes,
+            "notifications": self.notifications,
+            "state_writes": self.state_writes,
+            "avoided_writes": self.avoided_writes,
+            "cpu_ms_per_day_mean": sum(self.cpu_per_day) / days * 1000 if days else 0.0,
+            "cpu_ms_per_day_max": max(self.cpu_per_day) * 1000 if days else 0.0,
+        }
+
+
+async def async_simulate(
+    start: date, days: int, verify_every: int = 60, html: str | None = None
+) -> SimulationReport:
+    """Simulate days days from local midnight of start, one minute per step."""
+    clock = SimClock(datetime.combine(start, time.min, LOCAL))
+    end = datetime.combine(start + timedelta(days=days), time.min, LOCAL).astimezone(timezone.utc)
+    report = SimulationReport(clock.now(), end.astimezone(LOCAL))
+    server = StubServer(html if html is not None else PAGE.read_text(encoding="utf-8"))
+    url = await server.start()
+    minute = timedelta(minutes=1)
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            async with ClientSession() as session:
+                hass = StubHass(lambda: clock.utc, config_dir, session)
+                entry = StubConfigEntry(options={const.CONF_SOURCES: [url]})
+                coordinator = coordinator_module.VlagInstructieDataUpdateCoordinator(hass, entry)
+                coordinator.now = clock.now
+                update_data = coordinator._async_update_data
+                parse_executor = coordinator.parse_executor
+
+                async def counted_update_data():
+                    report.refreshes += 1
+                    return await update_data()
+
+                async def counted_parse(func, *args):
+                    report.parses += 1
+                    return await parse_executor(func, *args)
+
+                coordinator._async_update_data = counted_update_data
+                coordinator.parse_executor = counted_parse
+
+                try:
+                    await _async_simulate_entry(hass, coordinator, clock, end, verify_every, report, minute)
+                finally:
+                    await coordinator.async_close_archive()
+    finally:
+        await server.close()
+
+    report.requests = server.responses
+    report.not_modified = server.not_modified
+    return report
+
+
+async def _async_simulate_entry(hass, coordinator, clock, end, verify_every, report, minute) -> None:
+    day_started = time_module.process_time()
+    day = clock.today()
+
+    # as async_setup_entry, then the platforms adding their entities
+    if not await coordinator.async_restore_snapshot():
+        coordinator.async_publish_rules_calendar()
+    if coordinator.snapshot_is_stale:
+        coordinator.async_start_background_refresh()
+    coordinator.async_start_transitions()
+    entities = [(domain, entity_class(coordinator)) for domain, entity_class in ENTITY_CLASSES]
+    for domain, entity in entities:
+        await async_add_entity(hass, domain, entity)
+    report.entities = [entity.entity_id for _domain, entity in entities]
+
+    def count_notification() -> None:
+        report.notifications += 1
+
+    coordinator.async_add_listener(count_notification)
+    initial_writes = hass.state_writes
+    await hass.async_block_till_done()
+
+    probe = SnapshotProbe()
+    probes = [entity_class(probe) for _domain, entity_class in ENTITY_CLASSES]
+    states = [hass.states[entity_id][0] for entity_id in report.entities]
+    writes_seen = hass.state_writes
+    while clock.utc < end:
+        await hass.async_fire_due()
+        if hass.state_writes != writes_seen:
+            writes_seen = hass.state_writes
+            for index, entity_id in enumerate(report.entities):
+                new = hass.states[entity_id][0]
+                if new != states[index]:
+                    report.transitions.append((clock.now(), entity_id, states[index], new))
+                    states[index] = new
+
+        if report.minutes % verify_every == 0:
+            now = clock.now()
+            probe.day_snapshot = day_snapshot.build_day_snapshot(
+                coordinator.data, now, coordinator.fetcher.cache["last_update"]
+            )
+            for entity_id, published, expected in zip(report.entities, states, probes):
+                if published != expected.state:
+                    report.stale.append((now, entity_id, published, expected.state))
+
+        clock.advance(minute)
+        report.minutes += 1
+        if clock.today() != day:
+            now_cpu = time_module.process_time()
+            report.cpu_per_day.append(now_cpu - day_started)
+            day_started = now_cpu
+            day = clock.today()
+
+    report.state_writes = hass.state_writes - initial_writes
+    report.avoided_writes = coordinator.avoided_state_writes
+
+
+def simulate(start: date, days: int, verify_every: int = 60, html: str | None = None) -> SimulationReport:
+    """Run async_simulate in a new event loop."""
+    return asyncio.run(async_simulate(start, days, verify_every, html))
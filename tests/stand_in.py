@@ -0,0 +1,42 @@
+"""Local stand-in servers for the Vlaginstructie fetch tests.
+
+Importing this module needs aiohttp; test modules import it inside their
+optional-dependency guard.
+"""
+
+from datetime import date
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from component import load
+
+scraper = load("scraper")
+
+TODAY = date(2026, 5, 1)
+
+
+class StandInServerTestCase(unittest.IsolatedAsyncioTestCase):
+    """Start local servers for a test and close them afterwards."""
+
+    async def asyncSetUp(self):
+        self.servers = []
+
+    async def asyncTearDown(self):
+        for server in self.servers:
+            await server.close()
+
+    async def async_serve(self, handler, path="/"):
+        """Start a server answering GET requests for path with handler; returns its URL."""
+        app = web.Application()
+        app.router.add_get(path, handler)
+        server = TestServer(app)
+        await server.start_server()
+        self.servers.append(server)
+        return str(server.make_url(path))
+
+    def make_manager(self, url=None, **kwargs):
+        """Return a FetchManager whose current date is TODAY unless today is given."""
+        kwargs.setdefault("today", lambda: TODAY)
+        return scraper.FetchManager(url, **kwargs)
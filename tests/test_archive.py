@@ -0,0 +1,156 @@
+"""Tests for the Vlaginstructie SQLite archive."""
+
+from datetime import date
+from pathlib import Path
+import sqlite3
+import tempfile
+import unittest
+
+from component import load
+
+archive = load("archive")
+
+
+def info(name, halfstok=False, wimpel=False):
+    return {"name": name, "halfstok": halfstok, "wimpel": wimpel, "scope": "all"}
+
+
+TABLE_2025 = {
+    "2025-04-26": info("Koningsdag", wimpel=True),
+    "2025-05-04": info("Dodenherdenking", halfstok=True),
+    "2025-05-05": info("Bevrijdingsdag"),
+}
+TABLE_2026 = {
+    "2026-04-27": info("Koningsdag", wimpel=True),
+    "2026-05-04": info("Dodenherdenking", halfstok=True),
+    "2026-05-05": info("Bevrijdingsdag"),
+    "2026-12-15": info("Koninkrijksdag"),
+}
+
+
+class FlagArchiveTests(unittest.TestCase):
+    """Test archiving, deduplication and queries on a temporary database."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = Path(self._directory.name) / "archive.db"
+        self.archive = archive.FlagArchive(self.path)
+
+    def tearDown(self):
+        self.archive.close()
+        self._directory.cleanup()
+
+    def rows(self, table):
+        connection = self.archive._connect()
+        return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_identical_tables_are_stored_once(self):
+        self.assertTrue(self.archive.add(TABLE_2025, date(2025, 1, 1), "https://example.org/"))
+        self.assertFalse(self.archive.add(dict(reversed(TABLE_2025.items())), date(2025, 2, 1)))
+        self.assertFalse(self.archive.add({}, date(2025, 3, 1)))
+
+        self.assertEqual((self.rows("snapshots"), self.rows("observations"), self.rows("flag_days")), (1, 1, 3))
+
+    def test_days_resolve_from_the_latest_table_of_their_year(self):
+        self.archive.add(TABLE_2025, date(2025, 1, 1))
+        self.archive.add(TABLE_2026, date(2026, 1, 1))
+        # Koninkrijksdag dropped from the 2026 table
+        changed = dict(TABLE_2026)
+        del changed["2026-12-15"]
+        self.archive.add(changed, date(2026, 6, 1))
+
+        days = self.archive.days(date(2025, 1, 1), date(2027, 1, 1))
+
+        self.assertEqual(
+            [day["date"] for day in days],
+            ["2025-04-26", "2025-05-04", "2025-05-05", "2026-04-27", "2026-05-04", "2026-05-05"],
+        )
+        self.assertEqual(days[1], {"date": "2025-05-04", **info("Dodenherdenking", halfstok=True)})
+
+    def test_returning_table_is_observed_again_but_not_stored_again(self):
+        self.archive.add(TABLE_2026, date(2026, 1, 1))
+        changed = {**TABLE_2026, "2026-12-15": info("Koninkrijksdag (gewijzigd)")}
+        self.archive.add(changed, date(2026, 2, 1))
+        self.archive.add(TABLE_2026, date(2026, 3, 1))
+
+        self.assertEqual((self.rows("snapshots"), self.rows("observations")), (2, 3))
+        self.assertEqual(self.archive.days(date(2026, 12, 15), date(2026, 12, 16))[0]["name"], "Koninkrijksdag")
+        self.assertEqual(
+            [entry["flag_day"]["name"] for entry in self.archive.history(date(2026, 12, 15))],
+            ["Koninkrijksdag", "Koninkrijksdag (gewijzigd)", "Koninkrijksdag"],
+        )
+
+    def test_history_shows_removed_days(self):
+        self.archive.add(TABLE_2026, date(2026, 1, 1))
+        changed = dict(TABLE_2026)
+        del changed["2026-12-15"]
+        self.archive.add(changed, date(2026, 6, 1), "mirror")
+
+        history = self.archive.history(date(2026, 12, 15))
+
+        self.assertEqual([entry["observed_on"] for entry in history], ["2026-01-01", "2026-06-01"])
+        self.assertIsNone(history[1]["flag_day"])
+        self.assertEqual(history[1]["source"], "mirror")
+        self.assertEqual(self.archive.history(date(2020, 5, 4)), [])
+
+    def test_filters_and_counts(self):
+        self.archive.add(TABLE_2025, date(2025, 1, 1))
+        self.archive.add(TABLE_2026, date(2026, 1, 1))
+        start, end = date(2025, 1, 1), date(2027, 1, 1)
+
+        halfstok = self.archive.days(start, end, kind=archive.KIND_HALFSTOK)
+        self.assertEqual([day["date"] for day in halfstok], ["2025-05-04", "2026-05-04"])
+        self.assertEqual(len(self.archive.days(start, end, name="KONING")), 2)
+
+        self.assertEqual(self.archive.counts(start, end), {"2025": 3, "2026": 4})
+        self.assertEqual(
+            self.archive.counts(start, end, group_by="kind"), {"halfstok": 2, "vlag": 3, "wimpel": 2}
+        )
+        self.assertEqual(self.archive.counts(start, end, group_by="name", kind=archive.KIND_WIMPEL), {"Koningsdag": 2})
+        with self.assertRaises(ValueError):
+            self.archive.counts(start, end, group_by="scope")
+
+    def test_name_filter_folds_non_ascii_letters(self):
+        self.archive.add({"2026-05-17": info("Verjaardag van Koningin Máxima", wimpel=True)}, date(2026, 1, 1))
+
+        days = self.archive.days(date(2026, 1, 1), date(2027, 1, 1), name="MÁXIMA")
+
+        self.assertEqual([day["date"] for day in days], ["2026-05-17"])
+
+    def test_range_and_kind_queries_use_the_indexes(self):
+        self.archive.add(TABLE_2026, date(2026, 1, 1))
+        connection = self.archive._connect()
+
+        for column in ("day", "kind"):
+            plan = " ".join(
+                row[3]
+                for row in connection.execute(
+                    f"EXPLAIN QUERY PLAN SELECT * FROM flag_days WHERE {column} = ? AND day < ?",
+                    ("x", "2027-01-01"),
+                )
+            )
+            self.assertIn(f"flag_days_{column}", plan)
+
+    def test_closing_is_final(self):
+        self.archive.add(TABLE_2025, date(2025, 1, 1))
+        self.archive.close()
+
+        self.assertFalse(self.archive.add(TABLE_2026, date(2026, 1, 1)))
+        self.assertIsNone(self.archive._connection)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.archive.days(date(2025, 1, 1), date(2026, 1, 1))
+
+    def test_archive_persists_across_connections(self):
+        self.archive.add(TABLE_2026, date(2026, 1, 1))
+        self.archive.close()
+
+        reopened = archive.FlagArchive(self.path)
+        try:
+            self.assertFalse(reopened.add(TABLE_2026, date(2026, 2, 1)))
+            self.assertEqual(len(reopened.days(date(2026, 1, 1), date(2027, 1, 1))), 4)
+        finally:
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
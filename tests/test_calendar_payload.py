@@ -0,0 +1,84 @@
+"""Tests for the Vlaginstructie websocket calendar payloads."""
+
+from datetime import datetime, timezone
+import json
+import unittest
+
+from component import load
+
+calendar_payload = load("calendar_payload")
+day_snapshot = load("day_snapshot")
+flag_calendar = load("flag_calendar")
+rules = load("rules")
+
+
+def dumps(obj) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class CalendarPublisherTests(unittest.TestCase):
+    """Test versioning and diffs of the published payload."""
+
+    def setUp(self):
+        self.serialized = 0
+
+        def counting_dumps(obj):
+            self.serialized += 1
+            return dumps(obj)
+
+        self.publisher = calendar_payload.CalendarPublisher(counting_dumps)
+        self.calendar = flag_calendar.FlagCalendar(rules.compile_calendar(2026, 2026))
+
+    def snapshot(self, calendar, hour=9):
+        return day_snapshot.build_day_snapshot(calendar, datetime(2026, 5, 4, hour, tzinfo=timezone.utc))
+
+    def test_first_update_sends_everything(self):
+        diff = json.loads(self.publisher.update(self.calendar, self.snapshot(self.calendar)))
+
+        self.assertEqual(diff["version"], 1)
+        self.assertEqual(diff["set"]["2026-05-04"], ["Dodenherdenking (vlag halfstok van 18.00 uur tot zonsondergang)", 3])
+        self.assertEqual(diff["removed"], [])
+        self.assertEqual(diff["day"]["today"], "2026-05-04")
+        self.assertTrue(diff["day"]["halfstok_today"])
+
+    def test_unchanged_state_sends_nothing(self):
+        self.publisher.update(self.calendar, self.snapshot(self.calendar))
+
+        self.assertIsNone(self.publisher.update(self.calendar, self.snapshot(self.calendar)))
+        self.assertEqual(self.publisher.version, 1)
+
+    def test_day_transition_sends_only_the_day_state(self):
+        self.publisher.update(self.calendar, self.snapshot(self.calendar))
+
+        diff = json.loads(self.publisher.update(self.calendar, self.snapshot(self.calendar, hour=19)))
+
+        self.assertEqual(diff, {"day": diff["day"], "version": 2})
+        self.assertFalse(diff["day"]["halfstok_today"])
+
+    def test_new_data_sends_only_changed_days(self):
+        self.publisher.update(self.calendar, self.snapshot(self.calendar))
+        vlagdagen = self.calendar.as_dict()
+        del vlagdagen["2026-08-15"]
+        vlagdagen["2026-07-01"] = {"name": "Keti Koti", "halfstok": False, "wimpel": False}
+        updated = flag_calendar.FlagCalendar(vlagdagen)
+
+        diff = json.loads(self.publisher.update(updated, self.snapshot(updated)))
+
+        self.assertEqual(diff, {"set": {"2026-07-01": ["Keti Koti", 1]}, "removed": ["2026-08-15"], "version": 2})
+
+    def test_full_payload_is_serialized_once_per_version(self):
+        self.publisher.update(self.calendar, self.snapshot(self.calendar))
+        before = self.serialized
+
+        first = self.publisher.full
+        self.assertIs(self.publisher.full, first)
+        self.assertEqual(self.serialized, before + 1)
+
+        full = json.loads(first)
+        self.assertEqual(full["version"], 1)
+        self.assertEqual(len(full["days"]), len(rules.RULES))
+        self.assertEqual(full["day"]["next_flag_day"], "2026-05-04")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for the Vlaginstructie day snapshot."""
+
+from datetime import date, datetime
+import unittest
+from zoneinfo import ZoneInfo
+
+from component import load
+
+day_snapshot = load("day_snapshot")
+
+AMSTERDAM = ZoneInfo("Europe/Amsterdam")
+VLAGDAGEN = {
+    "2026-05-04": {"name": "Dodenherdenking", "halfstok": True, "wimpel": False, "scope": "all"},
+    "2026-05-05": {"name": "Bevrijdingsdag", "halfstok": False, "wimpel": False, "scope": "all"},
+    "2026-12-07": {"name": "Verjaardag van Prinses Amalia", "halfstok": False, "wimpel": True, "scope": "all"},
+}
+
+
+class DaySnapshotTests(unittest.TestCase):
+    """Test resolving today, tomorrow and the next flag day."""
+
+    def test_dodenherdenking_cutoff(self):
+        morning = day_snapshot.build_day_snapshot(VLAGDAGEN, datetime(2026, 5, 4, 17, 59, tzinfo=AMSTERDAM))
+        evening = day_snapshot.build_day_snapshot(VLAGDAGEN, datetime(2026, 5, 4, 18, 0, tzinfo=AMSTERDAM))
+
+        self.assertTrue(morning.halfstok_today)
+        self.assertEqual(morning.valid_until, datetime(2026, 5, 4, 18, 0, tzinfo=AMSTERDAM))
+        self.assertFalse(evening.halfstok_today)
+        self.assertEqual(evening.today.name, "Dodenherdenking")
+        self.assertEqual(evening.tomorrow.name, "Bevrijdingsdag")
+        self.assertEqual(evening.next_flag_day.day.isoformat(), "2026-05-04")
+
+    def test_day_without_instruction(self):
+        snapshot = day_snapshot.build_day_snapshot(VLAGDAGEN, datetime(2026, 12, 6, 12, 0, tzinfo=AMSTERDAM))
+
+        self.assertIsNone(snapshot.today.info)
+        self.assertIsNone(snapshot.today.name)
+        self.assertEqual(
+            dict(snapshot.today.attributes),
+            {"date": "2026-12-06", "data_fetched": None, "data_age_days": None},
+        )
+        self.assertTrue(snapshot.tomorrow.wimpel)
+        self.assertEqual(snapshot.tomorrow.attributes["reason"], "Verjaardag van Prinses Amalia")
+        self.assertEqual(snapshot.next_flag_day, snapshot.tomorrow)
+
+    def test_no_upcoming_flag_day(self):
+        snapshot = day_snapshot.build_day_snapshot(VLAGDAGEN, datetime(2026, 12, 8, tzinfo=AMSTERDAM))
+        self.assertIsNone(snapshot.next_flag_day)
+
+        empty = day_snapshot.build_day_snapshot(None, datetime(2026, 12, 8, tzinfo=AMSTERDAM))
+        self.assertFalse(empty.halfstok_today)
+
+    def test_data_age(self):
+        snapshot = day_snapshot.build_day_snapshot(
+            VLAGDAGEN, datetime(2026, 5, 4, 12, 0, tzinfo=AMSTERDAM), date(2026, 4, 1)
+        )
+
+        self.assertEqual(snapshot.data_age_days, 33)
+        self.assertEqual(snapshot.today.attributes["data_fetched"], "2026-04-01")
+        self.assertEqual(snapshot.next_flag_day.attributes["data_age_days"], 33)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = day_snapshot.build_day_snapshot(VLAGDAGEN, datetime(2026, 5, 5, tzinfo=AMSTERDAM))
+
+        with self.assertRaises(AttributeError):
+            snapshot.halfstok_today = True
+        with self.assertRaises(TypeError):
+            snapshot.today.info["name"] = "x"
+
+
+if __name__ == "__main__":
+    unittest.main()
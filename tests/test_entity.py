@@ -0,0 +1,58 @@
+"""Tests for the change-only state writes shared by the Vlaginstructie entities."""
+
+import asyncio
+from datetime import datetime, timezone
+import logging
+import unittest
+
+import ha_stubs
+
+(entity,) = ha_stubs.load_integration("entity")
+
+
+class Coordinator(ha_stubs.DataUpdateCoordinator):
+    avoided_state_writes = 0
+
+
+class ValueSensor(entity.ChangeOnlyWriteMixin, ha_stubs.CoordinatorEntity, ha_stubs.SensorEntity):
+    _attr_name = "value"
+    value = "a"
+
+    @property
+    def native_value(self):
+        return self.value
+
+
+class ChangeOnlyWriteMixinTests(unittest.TestCase):
+    """Test which writes are skipped, whoever writes the state."""
+
+    def setUp(self):
+        self.hass = ha_stubs.StubHass(lambda: datetime(2026, 1, 1, tzinfo=timezone.utc), ".", None)
+        self.coordinator = Coordinator(self.hass, logging.getLogger(__name__), name="test")
+        self.sensor = ValueSensor(self.coordinator)
+        asyncio.run(ha_stubs.async_add_entity(self.hass, "sensor", self.sensor))
+
+    def test_only_changed_states_are_written(self):
+        self.coordinator.async_update_listeners()
+        self.sensor.value = "b"
+        self.coordinator.async_update_listeners()
+
+        self.assertEqual(self.hass.state_writes, 2)
+        self.assertEqual(self.hass.states["sensor.value"], ("b", {}))
+        self.assertEqual(self.coordinator.avoided_state_writes, 1)
+
+    def test_writes_outside_coordinator_updates_are_remembered(self):
+        # like the calendar's alarms, which write the state themselves
+        self.sensor.value = "b"
+        self.sensor.async_write_ha_state()
+        self.coordinator.async_update_listeners()
+        self.sensor.value = "a"
+        self.coordinator.async_update_listeners()
+
+        self.assertEqual(self.hass.state_writes, 3)
+        self.assertEqual(self.hass.states["sensor.value"], ("a", {}))
+        self.assertEqual(self.coordinator.avoided_state_writes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Tests for the Vlaginstructie calendar event store."""
+
+from datetime import date, timedelta
+import unittest
+
+from component import load
+
+event_store = load("event_store")
+flag_calendar = load("flag_calendar")
+rules = load("rules")
+
+
+class FlagEventStoreTests(unittest.TestCase):
+    """Test range queries over covered and lazily compiled years."""
+
+    def setUp(self):
+        vlagdagen = rules.compile_calendar(2026, 2027)
+        # a scraped patch that the rules do not produce
+        vlagdagen["2026-06-01"] = {"name": "Extra", "halfstok": False, "wimpel": False, "scope": "Den Haag"}
+        self.store = event_store.FlagEventStore(flag_calendar.FlagCalendar(vlagdagen))
+
+    def test_range_is_half_open_and_sorted(self):
+        events = self.store.between(date(2026, 5, 4), date(2026, 6, 1))
+
+        self.assertEqual(
+            [event.day for event in events],
+            [date(2026, 5, 4), date(2026, 5, 5), date(2026, 5, 17)],
+        )
+        self.assertTrue(events[0].halfstok)
+        self.assertEqual(events[0].description, "Flag at half-mast until 18:00.")
+
+    def test_covered_years_come_from_the_calendar(self):
+        events = self.store.between(date(2026, 6, 1), date(2026, 6, 2))
+
+        self.assertEqual([event.name for event in events], ["Extra"])
+
+    def test_later_years_are_compiled_lazily(self):
+        self.assertNotIn(2040, self.store._years)
+
+        events = self.store.between(date(2040, 1, 1), date(2041, 1, 1))
+
+        self.assertIn(2040, self.store._years)
+        self.assertEqual(len(events), len(rules.RULES))
+        self.assertEqual(events, self.store.between(date(2040, 1, 1), date(2041, 1, 1)))
+
+    def test_range_across_years(self):
+        events = self.store.between(date(2027, 12, 15), date(2028, 2, 1))
+
+        self.assertEqual([event.day for event in events], [date(2027, 12, 15), date(2028, 1, 31)])
+        self.assertFalse(events[1].wimpel)
+        self.assertEqual(events[1].description, "Fly the flag.")
+
+    def test_description(self):
+        events = {event.day: event for event in self.store.between(date(2026, 4, 27), date(2026, 6, 2))}
+
+        self.assertEqual(events[date(2026, 4, 27)].description, "Fly the flag. Add the orange pennant.")
+        self.assertEqual(events[date(2026, 6, 1)].description, "Fly the flag. Applies to: Den Haag.")
+
+    def test_next_on_or_after(self):
+        self.assertEqual(self.store.next_on_or_after(date(2026, 5, 5)).day, date(2026, 5, 5))
+        self.assertEqual(self.store.next_on_or_after(date(2027, 12, 16)).day, date(2028, 1, 31))
+
+    def test_years_before_the_calendar_have_no_rule_made_events(self):
+        self.assertEqual(self.store.first_year, 2026)
+        self.assertEqual(self.store.between(date(1950, 1, 1), date(2026, 1, 1)), [])
+        self.assertEqual(self.store.between(date(1200, 1, 1), date(1300, 1, 1)), [])
+        self.assertEqual(self.store.next_on_or_after(date(1950, 1, 1)).day, date(2026, 1, 31))
+        self.assertEqual(self.store.between(date(2025, 12, 1), date(2026, 2, 1))[0].day, date(2026, 1, 31))
+        self.assertNotIn(2025, self.store._years)
+
+
+class QueryTests(unittest.TestCase):
+    """Test filtered, memoized range queries."""
+
+    def setUp(self):
+        calendar = flag_calendar.FlagCalendar(rules.compile_calendar(2026, 2027))
+        self.store = event_store.FlagEventStore(calendar)
+
+    def test_filters(self):
+        start, end = date(2026, 1, 1), date(2028, 1, 1)
+
+        halfstok = self.store.query(start, end, halfstok=True)
+        self.assertEqual([day["date"] for day in halfstok], ["2026-05-04", "2027-05-04"])
+        self.assertEqual(len(self.store.query(start, end, wimpel=True)), 6)
+        self.assertEqual(
+            [day["date"] for day in self.store.query(start, end, name="koningsdag")],
+            ["2026-04-27", "2027-04-27"],
+        )
+        self.assertEqual(self.store.query(start, end, halfstok=True, wimpel=True), [])
+
+    def test_responses_are_memoized(self):
+        first = self.store.query(date(2026, 1, 1), date(2026, 7, 1), name="Dag")
+        second = self.store.query(date(2026, 1, 1), date(2026, 7, 1), name="dag")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.store.query_hits, 1)
+
+    def test_memoized_responses_are_fresh_copies(self):
+        first = self.store.query(date(2026, 1, 1), date(2026, 7, 1))
+        first[0]["name"] = "changed"
+        first.clear()
+
+        second = self.store.query(date(2026, 1, 1), date(2026, 7, 1))
+
+        self.assertEqual(self.store.query_hits, 1)
+        self.assertEqual(second[0]["name"], "Verjaardag van Prinses Beatrix")
+        self.assertEqual(len(second), 6)
+
+    def test_least_recently_used_is_evicted(self):
+        start = date(2026, 1, 1)
+        self.store.query(start, date(2026, 2, 1))
+        for days in range(1, event_store.QUERY_CACHE_SIZE + 1):
+            self.store.query(start, date(2026, 2, 1) + timedelta(days=days))
+
+        self.store.query(start, date(2026, 2, 1))
+        self.assertEqual(self.store.query_hits, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
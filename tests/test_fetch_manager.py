@@ -0,0 +1,82 @@
+"""Tests for single-flight fetching in the Vlaginstructie scraper."""
+
+import asyncio
+from pathlib import Path
+import unittest
+
+try:
+    from aiohttp import ClientSession, web
+    from stand_in import StandInServerTestCase, scraper
+except ImportError as err:
+    raise unittest.SkipTest(f"Optional scraper dependency is unavailable: {err}") from err
+
+PAGE = (Path(__file__).resolve().parent / "fixtures" / "vlaginstructie.html").read_text(encoding="utf-8")
+
+
+class FetchManagerTests(StandInServerTestCase):
+    """Test coalescing overlapping refreshes against a local stub server."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.requests = 0
+
+        async def handler(request):
+            self.requests += 1
+            await asyncio.sleep(0.05)
+            return web.Response(text=PAGE, content_type="text/html")
+
+        self.url = await self.async_serve(handler)
+
+    async def test_overlapping_refreshes_share_one_request(self):
+        manager = self.make_manager(self.url)
+
+        results = await asyncio.gather(*(manager.async_fetch() for _ in range(25)))
+
+        self.assertEqual(self.requests, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertIn("2026-05-04", results[0])
+        self.assertEqual(manager.stats["coalesced"], 24)
+
+        # a later refresh on the same day is answered from the cache
+        self.assertIs(await manager.async_fetch(), results[0])
+        self.assertEqual(self.requests, 1)
+        self.assertEqual(manager.metrics.fetches, 1)
+        self.assertEqual(manager.metrics.cache_hits, 1)
+        self.assertIsNotNone(manager.metrics.last_success)
+
+    async def test_cancelled_caller_does_not_cancel_fetch(self):
+        manager = self.make_manager(self.url)
+        first = asyncio.ensure_future(manager.async_fetch())
+        second = asyncio.ensure_future(manager.async_fetch())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        result = await second
+
+        self.assertIn("2026-05-04", result)
+        self.assertEqual(self.requests, 1)
+
+    async def test_managers_have_isolated_state(self):
+        entries = [self.make_manager(self.url) for _ in range(3)]
+
+        results = await asyncio.gather(*(manager.async_fetch() for manager in entries))
+
+        self.assertEqual(self.requests, 3)
+        self.assertIsNot(results[0], results[1])
+        self.assertIsNot(entries[0].cache, entries[1].cache)
+        self.assertEqual(scraper.FetchManager().cache["vlagdagen"], {})
+
+    async def test_injected_session_is_reused_and_left_open(self):
+        async with ClientSession() as session:
+            manager = self.make_manager(self.url, session=session)
+            result = await manager.async_fetch()
+
+            self.assertIn("2026-05-04", result)
+            self.assertFalse(session.closed)
+            manager.cache["vlagdagen"] = {}
+            await manager.async_fetch()
+        self.assertEqual(self.requests, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
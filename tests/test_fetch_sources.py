@@ -0,0 +1,159 @@
+"""Tests for hedged fetching over several Vlaginstructie sources."""
+
+import asyncio
+from datetime import date
+import json
+from pathlib import Path
+import time
+import unittest
+
+try:
+    from aiohttp import web
+    from stand_in import StandInServerTestCase, scraper
+except ImportError as err:
+    raise unittest.SkipTest(f"Optional scraper dependency is unavailable: {err}") from err
+
+PAGE = (Path(__file__).resolve().parent / "fixtures" / "vlaginstructie.html").read_text(encoding="utf-8")
+EXPORT = {
+    "vlagdagen": {
+        "2026-05-04": {"name": "Dodenherdenking", "halfstok": True, "wimpel": False, "scope": "all"},
+        "2026-05-05": {"name": "Bevrijdingsdag", "halfstok": False, "wimpel": False},
+        "not a date": {"name": "Skipped"},
+        "2026-05-06": "Skipped",
+    }
+}
+
+
+class ParseExportTests(unittest.TestCase):
+    """Test reading a JSON export of the calendar."""
+
+    def test_wrapped_and_bare_exports(self):
+        counts = {}
+        result = scraper.parse_export(json.dumps(EXPORT), counts)
+
+        self.assertEqual(list(result), ["2026-05-04", "2026-05-05"])
+        self.assertEqual(result["2026-05-05"]["scope"], "all")
+        self.assertTrue(result["2026-05-04"]["halfstok"])
+        self.assertEqual(counts, {"rows_parsed": 2, "rows_skipped": 2})
+        self.assertEqual(scraper.parse_export(json.dumps(EXPORT["vlagdagen"])), result)
+
+    def test_invalid_exports(self):
+        self.assertIsNone(scraper.parse_export("<html></html>"))
+        self.assertIsNone(scraper.parse_export("[1, 2]"))
+        self.assertIsNone(scraper.parse_export('{"vlagdagen": {}}'))
+
+
+class HedgedFetchTests(StandInServerTestCase):
+    """Test source order, hedging and fallback against delayed local stand-in servers."""
+
+    async def source(
+        self, delay=0.0, status=200, body=PAGE, content_type="text/html", path="/", charset="utf-8"
+    ):
+        """Start a stand-in server; returns its URL and the list of request headers it saw."""
+        seen = []
+        headers = {"ETag": '"v1"', "Content-Type": f"{content_type}; charset={charset}"}
+
+        async def handler(request):
+            seen.append(dict(request.headers))
+            await asyncio.sleep(delay)
+            return web.Response(status=status, body=body.encode(), headers=headers)
+
+        return await self.async_serve(handler, path), seen
+
+    async def test_fast_first_source_is_the_only_request(self):
+        primary, primary_seen = await self.source()
+        mirror, mirror_seen = await self.source()
+        manager = self.make_manager(sources=[primary, mirror], hedge_delay=1)
+
+        result = await manager.async_fetch()
+
+        self.assertIn("2026-05-04", result)
+        self.assertEqual((len(primary_seen), len(mirror_seen)), (1, 0))
+        self.assertEqual(manager.stats["hedged"], 0)
+        self.assertEqual(manager.get_fetch_stats()["source"], primary)
+
+    async def test_slow_source_is_hedged_and_cancelled(self):
+        primary, primary_seen = await self.source(delay=5)
+        mirror, mirror_seen = await self.source(delay=0.05)
+        manager = self.make_manager(sources=[primary, mirror], hedge_delay=0.1)
+
+        started = time.monotonic()
+        result = await manager.async_fetch()
+
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertIn("2026-05-04", result)
+        self.assertEqual((len(primary_seen), len(mirror_seen)), (1, 1))
+        stats = manager.get_fetch_stats()
+        self.assertEqual(stats["hedged"], 1)
+        self.assertEqual(stats["cancelled"], 1)
+        self.assertEqual(stats["fallback_answers"], 1)
+        self.assertEqual(stats["source"], mirror)
+        self.assertEqual(manager.metrics.fetches, 1)
+
+    async def test_failing_source_falls_back_without_waiting(self):
+        broken, _ = await self.source(status=503)
+        empty, _ = await self.source(body="<html><body>Onderhoud</body></html>")
+        mirror, mirror_seen = await self.source()
+        manager = self.make_manager(sources=[broken, empty, mirror], hedge_delay=10)
+
+        started = time.monotonic()
+        result = await manager.async_fetch()
+
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertIn("2026-05-04", result)
+        self.assertEqual(len(mirror_seen), 1)
+        self.assertEqual(manager.stats["hedged"], 0)
+        self.assertEqual(manager.breaker.failures, 0)
+
+    async def test_unknown_charset_is_decoded_as_utf8(self):
+        mislabelled, _ = await self.source(charset="x-bogus")
+        mirror, mirror_seen = await self.source()
+        manager = self.make_manager(sources=[mislabelled, mirror], hedge_delay=10)
+
+        result = await manager.async_fetch()
+
+        self.assertIn("2026-05-04", result)
+        self.assertEqual(len(mirror_seen), 0)
+        self.assertEqual(manager.cache["source"], mislabelled)
+        self.assertEqual(manager.breaker.failures, 0)
+
+    async def test_json_export_source(self):
+        broken, _ = await self.source(status=500)
+        export, _ = await self.source(
+            body=json.dumps(EXPORT), content_type="application/json", path="/vlagdagen.json"
+        )
+        manager = self.make_manager(sources=[broken, export])
+
+        result = await manager.async_fetch()
+
+        self.assertEqual(set(result), {"2026-05-04", "2026-05-05"})
+        self.assertEqual(manager.metrics.rows_parsed, 2)
+        self.assertEqual(manager.cache["source"], export)
+
+    async def test_all_sources_failing(self):
+        first, _ = await self.source(status=500)
+        second, _ = await self.source(status=404)
+        manager = self.make_manager(sources=[first, second])
+
+        self.assertEqual(await manager.async_fetch(), {})
+        self.assertEqual(manager.stats["failures"], 1)
+        self.assertEqual(manager.breaker.failures, 1)
+        self.assertIn(first, manager.metrics.last_error)
+        self.assertIn(second, manager.metrics.last_error)
+
+    async def test_validators_only_go_to_their_source(self):
+        primary, primary_seen = await self.source(status=503)
+        mirror, mirror_seen = await self.source()
+        manager = self.make_manager(sources=[primary, mirror])
+        await manager.async_fetch()
+        # a new month: revalidate
+        manager.cache["last_update"] = date(2026, 4, 1)
+
+        await manager.async_fetch()
+
+        self.assertNotIn("If-None-Match", primary_seen[1])
+        self.assertEqual(mirror_seen[1]["If-None-Match"], '"v1"')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Tests for the indexed Vlaginstructie flag calendar."""
+
+from datetime import date
+import unittest
+
+from component import load
+
+flag_calendar = load("flag_calendar")
+
+VLAGDAGEN = {
+    "2027-01-31": {"name": "Verjaardag van Prinses Beatrix", "halfstok": False, "wimpel": False, "scope": "all"},
+    "2026-05-04": {"name": "Dodenherdenking", "halfstok": True, "wimpel": False, "scope": "all"},
+    "2026-04-27": {"name": "Koningsdag", "halfstok": False, "wimpel": True, "scope": "all"},
+    "2026-12-31": {"name": "Oudjaar", "halfstok": False, "wimpel": False, "scope": "all"},
+    "not-a-date": {"name": "Ongeldig"},
+}
+
+
+class FlagCalendarTests(unittest.TestCase):
+    """Test the mapping view and indexed lookups."""
+
+    def setUp(self):
+        self.calendar = flag_calendar.FlagCalendar(VLAGDAGEN)
+
+    def test_mapping_view(self):
+        self.assertEqual(len(self.calendar), 5)
+        self.assertEqual(self.calendar["2026-05-04"]["name"], "Dodenherdenking")
+        self.assertEqual(self.calendar.get("2026-05-05"), None)
+        self.assertEqual(self.calendar, VLAGDAGEN)
+        self.assertEqual(self.calendar, flag_calendar.FlagCalendar(VLAGDAGEN))
+        self.assertEqual(self.calendar.as_dict(), VLAGDAGEN)
+        with self.assertRaises(TypeError):
+            self.calendar["2026-05-05"] = {}
+
+    def test_info_and_flags(self):
+        self.assertTrue(self.calendar.info(date(2026, 5, 4))["halfstok"])
+        self.assertIsNone(self.calendar.info(date(2026, 5, 5)))
+        self.assertEqual(
+            self.calendar.flags(date(2026, 4, 27)), flag_calendar.UITHANGEN | flag_calendar.WIMPEL
+        )
+        self.assertEqual(
+            self.calendar.flags(date(2026, 5, 4)), flag_calendar.UITHANGEN | flag_calendar.HALFSTOK
+        )
+        self.assertEqual(self.calendar.flags(date(2026, 12, 31)), flag_calendar.UITHANGEN)
+        self.assertEqual(self.calendar.flags(date(2026, 5, 5)), 0)
+        self.assertEqual(self.calendar.flags(date(2030, 5, 4)), 0)
+
+    def test_next_on_or_after(self):
+        self.assertEqual(self.calendar.next_on_or_after(date(2026, 5, 4))[0], date(2026, 5, 4))
+        self.assertEqual(self.calendar.next_on_or_after(date(2026, 5, 5))[0], date(2026, 12, 31))
+        self.assertEqual(self.calendar.next_on_or_after(date(2027, 1, 1))[0], date(2027, 1, 31))
+        self.assertIsNone(self.calendar.next_on_or_after(date(2027, 2, 1)))
+
+    def test_between(self):
+        days = [day for day, _info in self.calendar.between(date(2026, 4, 27), date(2027, 1, 31))]
+        self.assertEqual(days, [date(2026, 4, 27), date(2026, 5, 4), date(2026, 12, 31)])
+        self.assertEqual(self.calendar.between(date(2028, 1, 1), date(2029, 1, 1)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
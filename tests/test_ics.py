@@ -0,0 +1,69 @@
+"""Tests for the Vlaginstructie iCalendar feed."""
+
+from datetime import date
+import unittest
+
+from component import load
+
+flag_calendar = load("flag_calendar")
+ics = load("ics")
+rules = load("rules")
+
+
+class RenderIcsTests(unittest.TestCase):
+    """Test the rendered feed bytes."""
+
+    def setUp(self):
+        self.calendar = flag_calendar.FlagCalendar(rules.compile_calendar(2026, 2026))
+
+    def test_all_day_events(self):
+        body = ics.render_ics(self.calendar, date(2026, 3, 1)).decode("utf-8")
+
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\nVERSION:2.0\r\n"))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+        self.assertEqual(body.count("BEGIN:VEVENT"), len(rules.RULES))
+        self.assertIn(
+            "UID:2026-05-04@vlaginstructie\r\nDTSTAMP:20260301T000000Z\r\n"
+            "DTSTART;VALUE=DATE:20260504\r\nDTEND;VALUE=DATE:20260505\r\n"
+            "SUMMARY:Dodenherdenking (vlag halfstok van 18.00 uur tot zonsondergang)\r\nDESCRIPTION:Flag at half-mast until 18:00.\r\n",
+            body,
+        )
+
+    def test_lines_are_folded_at_75_octets(self):
+        name = "Verjaardag van Koningin Máxima " * 6
+        calendar = flag_calendar.FlagCalendar({"2026-05-18": {"name": name}})
+
+        body = ics.render_ics(calendar, date(2026, 3, 1))
+
+        lines = body.split(b"\r\n")
+        self.assertTrue(all(len(line) <= ics.LINE_LIMIT for line in lines))
+        self.assertIn(b"\r\n ", body)
+        # unfolding restores the original text, also around multi-byte characters
+        self.assertIn(f"SUMMARY:{name}\r\n", body.replace(b"\r\n ", b"").decode("utf-8"))
+
+    def test_text_is_escaped(self):
+        calendar = flag_calendar.FlagCalendar({"2026-07-01": {"name": "Keti Koti; Dag, 1"}})
+
+        body = ics.render_ics(calendar, date(2026, 3, 1)).decode("utf-8")
+
+        self.assertIn(r"SUMMARY:Keti Koti\; Dag\, 1" + "\r\n", body)
+
+
+class IcsFeedTests(unittest.TestCase):
+    """Test the ETag of the rendered feed."""
+
+    def test_etag_follows_the_content(self):
+        calendar = flag_calendar.FlagCalendar(rules.compile_calendar(2026, 2026))
+        stamp = date(2026, 3, 1)
+
+        first = ics.IcsFeed(calendar, stamp)
+        again = ics.IcsFeed(flag_calendar.FlagCalendar(calendar.as_dict()), stamp)
+        other = ics.IcsFeed(flag_calendar.FlagCalendar(rules.compile_calendar(2026, 2027)), stamp)
+
+        self.assertEqual(first.etag, again.etag)
+        self.assertNotEqual(first.etag, other.etag)
+        self.assertIs(first.source, calendar)
+
+
+if __name__ == "__main__":
+    unittest.main()
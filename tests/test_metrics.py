@@ -0,0 +1,71 @@
+"""Tests for the Vlaginstructie fetch metrics."""
+
+from datetime import date
+from pathlib import Path
+import unittest
+
+from component import load
+
+metrics = load("metrics")
+
+PAGE = (Path(__file__).resolve().parent / "fixtures" / "vlaginstructie.html").read_text(encoding="utf-8")
+
+
+class RollingWindowTests(unittest.TestCase):
+    """Test the bounded sample window."""
+
+    def test_window_keeps_the_last_samples(self):
+        window = metrics.RollingWindow(size=20)
+        for value in range(1, 101):
+            window.add(value)
+
+        self.assertEqual(len(window), 20)
+        self.assertEqual(
+            window.summary(), {"count": 20, "last": 100, "mean": 90.5, "p95": 99, "max": 100}
+        )
+
+    def test_empty_summary(self):
+        window = metrics.RollingWindow()
+
+        self.assertIsNone(window.mean)
+        self.assertEqual(window.summary()["count"], 0)
+
+
+class FetchMetricsTests(unittest.TestCase):
+    """Test the counters and timestamps."""
+
+    def test_counters(self):
+        fetch_metrics = metrics.FetchMetrics(window=5)
+        self.assertIsNone(fetch_metrics.cache_hit_ratio)
+
+        fetch_metrics.record_response(0.25, 40_000)
+        fetch_metrics.cache_hits += 3
+        fetch_metrics.record_parse(0.002, 10, 1)
+        fetch_metrics.record_failure("ClientError()")
+
+        result = fetch_metrics.as_dict()
+        self.assertEqual(result["http_latency_ms"]["last"], 250)
+        self.assertEqual(result["cache_hit_ratio"], 0.75)
+        self.assertEqual((result["rows_parsed"], result["rows_skipped"]), (10, 1))
+        self.assertIsNone(result["last_success"])
+        self.assertEqual(result["last_error"], "ClientError()")
+        self.assertIsNotNone(result["last_failure"])
+
+
+class RowCountTests(unittest.TestCase):
+    """Test the row counts reported by the parse stage."""
+
+    def test_parse_page_counts_rows(self):
+        parsing = load("parsing")
+        counts = {}
+
+        _fingerprint, result = parsing.parse_page(PAGE, date(2026, 5, 1), counts=counts)
+
+        self.assertIn("2026-05-04", result)
+        # the two weekday-of-month rows are added from the rules instead
+        self.assertEqual((counts["rows_parsed"], counts["rows_skipped"]), (8, 2))
+        self.assertGreater(counts["seconds"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
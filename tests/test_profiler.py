@@ -0,0 +1,125 @@
+"""Tests for the on-demand refresh profiler."""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+import tempfile
+import unittest
+
+from component import load
+
+profiler = load("profiler")
+
+
+def parse(text):
+    return sorted(text.split())
+
+
+class FakeCoordinator:
+    """The attributes the profiler wraps, as the coordinator has them."""
+
+    def __init__(self):
+        self.parse_executor = self._executor
+        self.notified = 0
+
+    async def _executor(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _async_update_data(self):
+        return await self.parse_executor(parse, "b c a")
+
+    def async_update_listeners(self):
+        self.notified += 1
+
+    async def async_refresh(self):
+        await self._async_update_data()
+        self.async_update_listeners()
+
+
+class RefreshProfilerTests(unittest.TestCase):
+    """Test arming, collecting and restoring."""
+
+    def test_profiles_the_requested_refreshes_then_restores(self):
+        coordinator = FakeCoordinator()
+        original_executor = coordinator.parse_executor
+        refresh_profiler = profiler.RefreshProfiler(coordinator)
+        results = []
+
+        async def run():
+            refresh_profiler.arm(results.append, shots=2, trace_memory=True, top=5)
+            self.assertTrue(refresh_profiler.armed)
+            await coordinator.async_refresh()
+            await asyncio.sleep(0)
+            self.assertEqual(results, [])
+            await coordinator.async_refresh()
+            await asyncio.sleep(0)
+            # a third refresh runs unprofiled
+            await coordinator.async_refresh()
+
+        asyncio.run(run())
+
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertEqual(result.refreshes, 2)
+        self.assertIsNotNone(result.memory)
+        self.assertLessEqual(len(result.memory), 5)
+        functions = {name for (_file, _line, name) in result.stats.stats}
+        self.assertIn("_async_update_data", functions)
+        self.assertIn("async_update_listeners", functions)
+        self.assertEqual(coordinator.notified, 3)
+
+        self.assertFalse(refresh_profiler.armed)
+        self.assertEqual(set(vars(coordinator)), {"parse_executor", "notified"})
+        self.assertIs(coordinator.parse_executor, original_executor)
+
+    def test_disarm_removes_the_wrappers(self):
+        coordinator = FakeCoordinator()
+        refresh_profiler = profiler.RefreshProfiler(coordinator)
+        refresh_profiler.arm(lambda result: self.fail("disarmed profiler completed"))
+        self.assertIn("_async_update_data", vars(coordinator))
+
+        refresh_profiler.disarm()
+
+        self.assertFalse(refresh_profiler.armed)
+        self.assertNotIn("_async_update_data", vars(coordinator))
+        self.assertNotIn("async_update_listeners", vars(coordinator))
+        asyncio.run(coordinator.async_refresh())
+
+    def test_arming_twice_is_refused(self):
+        refresh_profiler = profiler.RefreshProfiler(FakeCoordinator())
+        refresh_profiler.arm(lambda result: None)
+        with self.assertRaises(RuntimeError):
+            refresh_profiler.arm(lambda result: None)
+        refresh_profiler.disarm()
+
+
+class WriteResultsTests(unittest.TestCase):
+    """Test the files written for a result."""
+
+    def test_writes_prof_and_summary(self):
+        coordinator = FakeCoordinator()
+        refresh_profiler = profiler.RefreshProfiler(coordinator)
+        results = []
+
+        async def run():
+            refresh_profiler.arm(results.append, top=5)
+            await coordinator.async_refresh()
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        with tempfile.TemporaryDirectory() as directory:
+            prof_path, summary_path = profiler.write_results(
+                results[0], Path(directory), datetime(2026, 4, 27, 9, 30, 0)
+            )
+
+            self.assertEqual(prof_path.name, "vlaginstructie_profile_20260427_093000.prof")
+            self.assertGreater(prof_path.stat().st_size, 0)
+            summary = summary_path.read_text(encoding="utf-8")
+            self.assertTrue(summary.startswith("Vlaginstructie refresh profile, 1 refresh(es)"))
+            self.assertIn("_async_update_data", summary)
+            self.assertNotIn("allocation sites", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+"""Tests for the Vlaginstructie retry policy, adaptive timeout, hedging and circuit breaker."""
+
+import asyncio
+import unittest
+
+from component import load
+
+resilience = load("resilience")
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class RetryPolicyTests(unittest.TestCase):
+    """Test exponential backoff with jitter."""
+
+    def test_delay_grows_and_is_capped(self):
+        policy = resilience.RetryPolicy(base=60, factor=2, max_delay=600)
+
+        self.assertEqual(policy.delay(0, lambda: 1.0), 60)
+        self.assertEqual(policy.delay(2, lambda: 1.0), 240)
+        self.assertEqual(policy.delay(10, lambda: 1.0), 600)
+
+    def test_jitter_stays_within_half_to_full_delay(self):
+        policy = resilience.RetryPolicy(base=60)
+
+        self.assertEqual(policy.delay(1, lambda: 0.0), 60)
+        self.assertEqual(policy.delay(1, lambda: 0.5), 90)
+
+
+class AdaptiveTimeoutTests(unittest.TestCase):
+    """Test the latency-derived request timeout."""
+
+    def test_initial_value_until_observed(self):
+        self.assertEqual(resilience.AdaptiveTimeout(20, 5, 20).current, 20)
+
+    def test_fast_responses_shrink_timeout_to_minimum(self):
+        timeout = resilience.AdaptiveTimeout(20, 5, 20)
+        for _ in range(20):
+            timeout.observe(0.3)
+
+        self.assertEqual(timeout.current, 5)
+
+    def test_slow_responses_are_clamped_to_maximum(self):
+        timeout = resilience.AdaptiveTimeout(20, 5, 20)
+        timeout.observe(2.0)
+        self.assertEqual(timeout.current, 6.0)
+
+        timeout.observe(30.0)
+        self.assertEqual(timeout.current, 20)
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    """Test opening, half-opening and closing the breaker."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = resilience.CircuitBreaker(
+            failure_threshold=3,
+            policy=resilience.RetryPolicy(base=60, factor=2),
+            clock=self.clock,
+            rng=lambda: 1.0,
+        )
+
+    def test_stays_closed_below_threshold(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, resilience.STATE_CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.retry_in(), 120)
+
+    def test_opens_then_half_opens_after_backoff(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, resilience.STATE_OPEN)
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.retry_in(), 240)
+
+        self.clock.now += 240
+        self.assertEqual(self.breaker.state, resilience.STATE_HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+
+        # a failed trial request opens the breaker for longer
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, resilience.STATE_OPEN)
+        self.assertEqual(self.breaker.retry_in(), 480)
+
+    def test_success_closes_and_resets(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now += 240
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, resilience.STATE_CLOSED)
+        self.assertEqual(self.breaker.failures, 0)
+        self.assertIsNone(self.breaker.retry_in())
+
+
+class HedgedTests(unittest.IsolatedAsyncioTestCase):
+    """Test hedging over ordered attempts."""
+
+    def attempt(self, name, delay, result=True):
+        async def run():
+            self.started.append(name)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(name)
+                raise
+            return name if result else None
+
+        return run
+
+    def setUp(self):
+        self.started = []
+        self.cancelled = []
+
+    async def test_fast_first_attempt_is_not_hedged(self):
+        hedges = []
+        result = await resilience.async_hedged(
+            [self.attempt("a", 0), self.attempt("b", 0)], 0.5, hedges.append
+        )
+
+        self.assertEqual(result, (0, "a"))
+        self.assertEqual(self.started, ["a"])
+        self.assertEqual(hedges, [])
+
+    async def test_slow_attempt_is_hedged_and_cancelled(self):
+        hedges = []
+        result = await resilience.async_hedged(
+            [self.attempt("a", 5), self.attempt("b", 0.01), self.attempt("c", 0)], 0.05, hedges.append
+        )
+
+        self.assertEqual(result, (1, "b"))
+        self.assertEqual(self.started, ["a", "b"])
+        self.assertEqual(self.cancelled, ["a"])
+        self.assertEqual(hedges, [1])
+
+    async def test_failure_moves_on_without_waiting(self):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await resilience.async_hedged(
+            [self.attempt("a", 0, result=False), self.attempt("b", 0)], 5
+        )
+
+        self.assertEqual(result, (1, "b"))
+        self.assertLess(loop.time() - started, 1)
+
+    async def test_all_failing(self):
+        result = await resilience.async_hedged(
+            [self.attempt("a", 0, result=False), self.attempt("b", 0.01, result=False)], 0.001
+        )
+
+        self.assertEqual(result, (None, None))
+        self.assertEqual(self.started, ["a", "b"])
+
+
+try:
+    from aiohttp import web
+    from stand_in import StandInServerTestCase
+except ImportError:  # pragma: no cover - the unit tests above still run
+    web = None
+    StandInServerTestCase = unittest.IsolatedAsyncioTestCase
+
+
+@unittest.skipIf(web is None, "aiohttp is unavailable")
+class FetchManagerBreakerTests(StandInServerTestCase):
+    """Test that a failing server opens the fetch manager's breaker."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.requests = 0
+
+        async def handler(request):
+            self.requests += 1
+            return web.Response(status=503)
+
+        self.url = await self.async_serve(handler)
+
+    async def test_open_circuit_skips_requests(self):
+        clock = FakeClock()
+        breaker = resilience.CircuitBreaker(failure_threshold=2, clock=clock, rng=lambda: 1.0)
+        manager = self.make_manager(self.url, breaker=breaker)
+
+        for _ in range(4):
+            self.assertEqual(await manager.async_fetch(), {})
+
+        self.assertEqual(self.requests, 2)
+        stats = manager.get_fetch_stats()
+        self.assertEqual(stats["failures"], 2)
+        self.assertEqual(stats["rejected"], 2)
+        self.assertEqual(stats["circuit"], resilience.STATE_OPEN)
+
+        clock.now += breaker.retry_in()
+        await manager.async_fetch()
+        self.assertEqual(self.requests, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
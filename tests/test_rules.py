@@ -0,0 +1,92 @@
+"""Tests for the rule-compiled Vlaginstructie calendar."""
+
+from datetime import date
+from pathlib import Path
+import unittest
+
+from component import load
+
+rules = load("rules")
+parsing = load("parsing")
+
+PAGE = (Path(__file__).resolve().parent / "fixtures" / "vlaginstructie.html").read_text(encoding="utf-8")
+
+
+class RuleTests(unittest.TestCase):
+    """Test compiling the flag instruction rules."""
+
+    def test_fixed_and_weekday_rules(self):
+        calendar = rules.compile_calendar(2026, 2026)
+
+        self.assertTrue(calendar["2026-05-04"]["halfstok"])
+        self.assertTrue(calendar["2026-04-27"]["wimpel"])
+        self.assertEqual(calendar["2026-06-27"]["name"], "Veteranendag")
+        self.assertEqual(calendar["2026-09-15"]["name"], "Prinsjesdag")
+        self.assertFalse(calendar["2026-01-31"]["wimpel"])
+        self.assertEqual(len(calendar), len(rules.RULES))
+
+    def test_sunday_and_holiday_shifts(self):
+        # 27 April 2031 is a Sunday: Koningsdag moves back to Saturday
+        self.assertIn("2031-04-26", rules.compile_year(2031))
+        self.assertNotIn("2031-04-27", rules.compile_year(2031))
+        # 15 December 2024 is a Sunday: Koninkrijksdag moves to Monday
+        self.assertIn("2024-12-16", rules.compile_year(2024))
+        # days without an alternate date in the table never move: 17 May 2027 is Whit Monday
+        self.assertTrue(rules.is_christian_holiday(date(2027, 5, 17)))
+        self.assertIn("2027-05-17", rules.compile_year(2027))
+        self.assertIn("2026-01-31", rules.compile_year(2026))
+        # Dodenherdenking never moves, 4 May 2025 is a Sunday
+        self.assertIn("2025-05-04", rules.compile_year(2025))
+
+    def test_rules_match_the_government_table(self):
+        for year in range(2024, 2036):
+            with self.subTest(year=year):
+                scraped = parsing.parse_vlagdagen(PAGE, date(year, 1, 1))
+                # the table's dates without a year cover the current and the next year
+                self.assertEqual(
+                    dict(rules.compile_year(year)),
+                    {key: info for key, info in scraped.items() if key.startswith(str(year))},
+                )
+                merged, mismatches = rules.merge_calendars(rules.compile_calendar(year, year + 1), scraped)
+                self.assertEqual(mismatches, 0)
+
+    def test_easter_offset_rule(self):
+        rule = rules.FlagRule("Hemelvaartsdag", easter_offset=39)
+        self.assertEqual(rule.date_for_year(2026), date(2026, 5, 14))
+
+    def test_compile_is_memoized_and_read_only(self):
+        self.assertIs(rules.compile_year(2030), rules.compile_year(2030))
+        self.assertIs(rules.christian_holidays(2030), rules.christian_holidays(2030))
+        with self.assertRaises(TypeError):
+            rules.compile_year(2030)["2030-01-01"] = {}
+
+    def test_multi_year_horizon(self):
+        calendar = rules.compile_calendar(2026, 2035)
+        self.assertEqual({key[:4] for key in calendar}, {str(year) for year in range(2026, 2036)})
+
+    def test_merge_prefers_scraped_days(self):
+        compiled = rules.compile_calendar(2026, 2028)
+        scraped = {
+            "2026-05-04": {"name": "Dodenherdenking (gescraped)", "halfstok": True, "wimpel": False, "scope": "all"},
+            "2026-05-06": {"name": "Bevrijdingsdag", "halfstok": False, "wimpel": False, "scope": "all"},
+            "2026-07-01": {"name": "Extra dag", "halfstok": False, "wimpel": False, "scope": "all"},
+        }
+
+        merged, mismatches = rules.merge_calendars(compiled, scraped)
+
+        self.assertEqual(merged["2026-05-04"]["name"], "Dodenherdenking (gescraped)")
+        # the scrape moves Bevrijdingsdag; rule days it does not contradict are kept
+        self.assertNotIn("2026-05-05", merged)
+        self.assertEqual(merged["2026-05-06"]["name"], "Bevrijdingsdag")
+        self.assertIn("2026-12-15", merged)
+        self.assertIn("2027-05-05", merged)
+        self.assertEqual(len(merged), 3 * len(rules.RULES) + 1)
+        # nine 2026 rule days missing from the scrape, two scraped days without a rule
+        self.assertEqual(mismatches, len(rules.RULES) + 1)
+
+        offline, _ = rules.merge_calendars(compiled, {})
+        self.assertEqual(offline, compiled)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for the Vlaginstructie transition scheduler."""
+
+from datetime import datetime, timedelta, timezone
+import unittest
+from zoneinfo import ZoneInfo
+
+from component import load
+
+scheduler = load("scheduler")
+
+AMSTERDAM = ZoneInfo("Europe/Amsterdam")
+
+
+class NextTransitionTests(unittest.TestCase):
+    """Test computing the next moment an entity value can change."""
+
+    def test_next_midnight(self):
+        now = datetime(2026, 6, 10, 13, 45, tzinfo=AMSTERDAM)
+        self.assertEqual(scheduler.next_transition(now), datetime(2026, 6, 11, tzinfo=AMSTERDAM))
+
+    def test_dodenherdenking_cutoff(self):
+        morning = datetime(2026, 5, 4, 9, 0, tzinfo=AMSTERDAM)
+        cutoff = scheduler.next_transition(morning)
+        self.assertEqual(cutoff, datetime(2026, 5, 4, 18, 0, tzinfo=AMSTERDAM))
+        self.assertEqual(scheduler.next_transition(cutoff), datetime(2026, 5, 5, tzinfo=AMSTERDAM))
+
+    def test_dst_changes(self):
+        # clocks go forward on 29 March 2026 and back on 25 October 2026
+        for day, hours in ((28, 24), (29, 23)):
+            with self.subTest(day=day):
+                start = datetime(2026, 3, day, tzinfo=AMSTERDAM)
+                end = scheduler.next_transition(start)
+                elapsed = end.astimezone(timezone.utc) - start.astimezone(timezone.utc)
+                self.assertEqual(end, datetime(2026, 3, day + 1, tzinfo=AMSTERDAM))
+                self.assertEqual(elapsed, timedelta(hours=hours))
+
+        start = datetime(2026, 10, 25, tzinfo=AMSTERDAM)
+        end = scheduler.next_transition(start)
+        self.assertEqual(end.astimezone(timezone.utc) - start.astimezone(timezone.utc), timedelta(hours=25))
+
+    def test_stepping_a_year_visits_every_day_once(self):
+        now = datetime(2026, 1, 1, tzinfo=AMSTERDAM)
+        seen = []
+        while now.year == 2026:
+            now = scheduler.next_transition(now)
+            seen.append(now)
+        self.assertEqual(len(seen), 366)
+        self.assertIn(datetime(2026, 5, 4, 18, 0, tzinfo=AMSTERDAM), seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
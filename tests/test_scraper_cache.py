@@ -0,0 +1,57 @@
+"""Tests for the Vlaginstructie scraper cache snapshot."""
+
+from datetime import date
+import unittest
+
+try:
+    import aiohttp  # noqa: F401
+    import bs4  # noqa: F401
+except ImportError as err:
+    raise unittest.SkipTest(f"Optional scraper dependency is unavailable: {err}") from err
+
+from component import load
+
+
+scraper = load("scraper")
+
+VLAGDAGEN = {
+    "2026-05-04": {"name": "Dodenherdenking", "halfstok": True, "wimpel": False, "scope": "all"},
+}
+
+
+class ScraperCacheTests(unittest.TestCase):
+    """Test exporting and restoring the scraper cache."""
+
+    def setUp(self):
+        scraper._cache["vlagdagen"] = {}
+        scraper._cache["last_update"] = None
+
+    def test_export_empty_cache(self):
+        self.assertIsNone(scraper.export_cache())
+        self.assertTrue(scraper.cache_is_stale(date(2026, 5, 10)))
+
+    def test_round_trip(self):
+        scraper._cache["vlagdagen"] = dict(VLAGDAGEN)
+        scraper._cache["last_update"] = date(2026, 5, 1)
+        snapshot = scraper.export_cache()
+
+        self.setUp()
+        self.assertTrue(scraper.restore_cache(snapshot))
+        self.assertEqual(scraper._cache["vlagdagen"], VLAGDAGEN)
+        self.assertEqual(scraper._cache["last_update"], date(2026, 5, 1))
+
+    def test_restore_rejects_malformed_snapshots(self):
+        for snapshot in (None, {}, {"vlagdagen": VLAGDAGEN}, {"vlagdagen": {}, "last_update": "2026-05-01"}):
+            with self.subTest(snapshot=snapshot):
+                self.assertFalse(scraper.restore_cache(snapshot))
+                self.assertEqual(scraper._cache["vlagdagen"], {})
+
+    def test_staleness_follows_calendar_month(self):
+        scraper.restore_cache({"vlagdagen": VLAGDAGEN, "last_update": "2026-04-01"})
+
+        self.assertFalse(scraper.cache_is_stale(date(2026, 4, 30)))
+        self.assertTrue(scraper.cache_is_stale(date(2026, 5, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
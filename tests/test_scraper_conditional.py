@@ -0,0 +1,97 @@
+"""Tests for conditional requests made by the Vlaginstructie scraper."""
+
+from datetime import date
+import unittest
+
+try:
+    from aiohttp import web
+    import bs4  # noqa: F401
+    from stand_in import StandInServerTestCase
+except ImportError as err:
+    raise unittest.SkipTest(f"Optional scraper dependency is unavailable: {err}") from err
+
+PAGE = """
+<html><body><table>
+<tr><th>Datum</th><th>Reden</th></tr>
+<tr><td>4 mei</td><td>Dodenherdenking</td></tr>
+<tr><td>5 mei</td><td>Bevrijdingsdag</td></tr>
+</table></body></html>
+"""
+ETAG = '"v1"'
+
+
+class ConditionalRequestTests(StandInServerTestCase):
+    """Test ETag handling against a local stand-in server."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.requests = []
+        self.page = PAGE
+        self.etag = ETAG
+
+        async def handler(request):
+            self.requests.append(dict(request.headers))
+            if self.etag and request.headers.get("If-None-Match") == self.etag:
+                return web.Response(status=304)
+            headers = {"ETag": self.etag} if self.etag else {}
+            return web.Response(text=self.page, content_type="text/html", headers=headers)
+
+        self.today = date(2026, 5, 1)
+        self.manager = self.make_manager(await self.async_serve(handler), today=lambda: self.today)
+
+    async def test_not_modified_reuses_cache(self):
+        self.today = date(2026, 5, 1)
+        first = await self.manager.async_fetch()
+        self.assertIn("2026-05-04", first)
+        self.assertNotIn("If-None-Match", self.requests[0])
+
+        self.today = date(2026, 6, 1)
+        second = await self.manager.async_fetch()
+        self.assertIs(second, first)
+        self.assertEqual(self.requests[1]["If-None-Match"], ETAG)
+        self.assertIn("gzip", self.requests[1]["Accept-Encoding"])
+
+        stats = self.manager.get_fetch_stats()
+        self.assertEqual(stats["not_modified"], 1)
+        self.assertEqual(stats["not_modified_ratio"], 1.0)
+        self.assertGreater(stats["bytes_saved"], 0)
+        self.assertEqual(self.manager.cache["last_update"], date(2026, 6, 1))
+
+    async def test_new_year_skips_validators(self):
+        self.today = date(2026, 12, 1)
+        await self.manager.async_fetch()
+
+        self.today = date(2027, 1, 1)
+        result = await self.manager.async_fetch()
+        self.assertNotIn("If-None-Match", self.requests[1])
+        self.assertIn("2028-05-04", result)
+
+
+    async def test_unchanged_body_skips_parse(self):
+        self.etag = None
+        self.today = date(2026, 5, 1)
+        first = await self.manager.async_fetch()
+
+        self.today = date(2026, 6, 1)
+        self.assertIs(await self.manager.async_fetch(), first)
+        self.assertEqual(self.manager.stats["unchanged_body"], 1)
+
+    async def test_unchanged_rows_reuse_calendar(self):
+        self.etag = None
+        self.today = date(2026, 5, 1)
+        first = await self.manager.async_fetch()
+
+        self.page = PAGE.replace("<body>", "<body><p>Nieuwe inleiding</p>")
+        self.today = date(2026, 6, 1)
+        self.assertIs(await self.manager.async_fetch(), first)
+        self.assertEqual(self.manager.stats["unchanged_rows"], 1)
+
+        self.page = PAGE.replace("Bevrijdingsdag", "Bevrijdingsdag 80 jaar")
+        self.today = date(2026, 7, 1)
+        third = await self.manager.async_fetch()
+        self.assertIsNot(third, first)
+        self.assertEqual(third["2026-05-05"]["name"], "Bevrijdingsdag 80 jaar")
+
+
+if __name__ == "__main__":
+    unittest.main()
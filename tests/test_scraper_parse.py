@@ -0,0 +1,104 @@
+"""Tests for the synchronous parse stage of the Vlaginstructie scraper."""
+
+from datetime import date
+from pathlib import Path
+import unittest
+
+try:
+    import bs4  # noqa: F401
+except ImportError as err:
+    raise unittest.SkipTest(f"Optional parse dependency is unavailable: {err}") from err
+
+from component import load
+
+
+FIXTURE_PATH = Path(__file__).resolve().parent / "fixtures" / "vlaginstructie.html"
+
+parsing = load("parsing")
+
+PAGE = """
+<html><body>
+<p>Inleiding</p>
+<table>
+<tr><th>Datum</th><th>Reden</th></tr>
+<tr><td>31 januari</td><td>Verjaardag van Prinses Beatrix</td></tr>
+<tr><td>27 april (26 april)</td><td>Koningsdag</td></tr>
+<tr><td>4 mei</td><td>Dodenherdenking (vlag halfstok tot 18.00 uur)</td></tr>
+<tr><td>geen datum</td><td>Onbekend</td></tr>
+<tr><td>alleen een cel</td></tr>
+</table>
+<table><tr><td>1 januari</td><td>Niet de vlaginstructie</td></tr></table>
+</body></html>
+"""
+
+
+class ScraperParseTests(unittest.TestCase):
+    """Test parsing the government page without any network access."""
+
+    def test_extract_table_rows(self):
+        rows = parsing.extract_table_rows(PAGE)
+
+        self.assertEqual(rows[0], ["31 januari", "Verjaardag van Prinses Beatrix"])
+        self.assertEqual(rows[-1], ["alleen een cel"])
+        self.assertEqual(len(rows), 5)
+
+    def test_page_without_table(self):
+        self.assertIsNone(parsing.parse_vlagdagen("<html><p>Geen tabel</p></html>", date(2026, 5, 1)))
+
+    def test_parse_vlagdagen(self):
+        result = parsing.parse_vlagdagen(PAGE, date(2026, 5, 1))
+
+        self.assertTrue(result["2026-05-04"]["halfstok"])
+        self.assertTrue(result["2027-05-04"]["halfstok"])
+        self.assertTrue(result["2026-04-27"]["wimpel"])
+        self.assertNotIn("2026-01-01", result)
+        self.assertEqual(result["2026-06-27"]["name"], "Veteranendag")
+
+    def test_sunday_uses_alternative_date(self):
+        result = parsing.parse_vlagdagen(PAGE, date(2031, 5, 1))
+
+        # 27 April 2031 is a Sunday.
+        self.assertNotIn("2031-04-27", result)
+        self.assertEqual(result["2031-04-26"]["name"], "Koningsdag")
+
+
+    def test_fast_extractor_matches_bs4(self):
+        html = FIXTURE_PATH.read_text(encoding="utf-8")
+
+        rows = parsing.extract_table_rows_fast(html)
+        self.assertEqual(rows, parsing.extract_table_rows_bs4(html))
+        self.assertTrue(parsing.table_rows_are_valid(rows))
+        self.assertEqual(rows[5], ["17 mei", "Verjaardag van Koningin M\u00e1xima (met oranje wimpel)"])
+        self.assertEqual(len(rows), 11)
+
+    def test_fast_extractor_stops_after_first_table(self):
+        extractor = parsing.TableExtractor()
+        extractor.feed("<table><tr><td>4 mei</td><td>Dodenherdenking</td></tr></table>")
+        extractor.feed("<table><tr><td>5 mei</td><td>Bevrijdingsdag</td></tr></table>")
+
+        self.assertTrue(extractor.done)
+        self.assertEqual(extractor.rows, [["4 mei", "Dodenherdenking"]])
+
+    def test_fast_extractor_handles_omitted_end_tags(self):
+        rows = parsing.extract_table_rows_fast(
+            "<table><tr><td>4 mei<td>Dodenherdenking<tr><td>5 mei<td>Bevrijdingsdag</table>"
+        )
+        self.assertEqual(rows, [["4 mei", "Dodenherdenking"], ["5 mei", "Bevrijdingsdag"]])
+
+    def test_nested_table_falls_back_to_bs4(self):
+        html = PAGE.replace("<td>Bevrijdingsdag</td>", "<td><table><tr><td>x</td></tr></table></td>")
+        html = html.replace("<td>31 januari</td>", "<td><table><tr><td>31 januari</td></tr></table></td>")
+
+        self.assertIsNone(parsing.extract_table_rows_fast(html))
+        self.assertEqual(parsing.extract_table_rows(html)[0][0], "31 januari")
+
+    def test_structural_validation(self):
+        self.assertFalse(parsing.table_rows_are_valid(None))
+        self.assertFalse(parsing.table_rows_are_valid([["Datum", "Reden"], ["4 mei", "Dodenherdenking"]]))
+        self.assertFalse(
+            parsing.table_rows_are_valid([[], ["a", "b"], ["c", "d"], ["e", "f"], ["4 mei", "x"]])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""Tests for streaming the government page into the Vlaginstructie scraper."""
+
+from pathlib import Path
+import unittest
+
+try:
+    from aiohttp import web
+    import bs4  # noqa: F401
+    from stand_in import StandInServerTestCase, scraper
+except ImportError as err:
+    raise unittest.SkipTest(f"Optional scraper dependency is unavailable: {err}") from err
+
+FIXTURE_PATH = Path(__file__).resolve().parent / "fixtures" / "vlaginstructie.html"
+
+PAGE = FIXTURE_PATH.read_bytes()
+FILLER = b"<p>" + b"x" * 4096 + b"</p>\n"
+
+
+class TableEndScannerTests(unittest.TestCase):
+    """Test detecting the end of the first table in raw chunks."""
+
+    def test_split_tags_and_nesting(self):
+        scanner = scraper.TableEndScanner()
+        chunks = [b"<p>intro</p><TA", b"BLE class='t'><tr><td><table>", b"</table></td></tr></tab", b"le>rest"]
+        for chunk in chunks[:-1]:
+            scanner.feed(chunk)
+            self.assertFalse(scanner.done)
+        scanner.feed(chunks[-1])
+        self.assertTrue(scanner.done)
+
+
+class StreamingFetchTests(StandInServerTestCase):
+    """Test the streaming fetch stage against a local stand-in server."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        async def handler(request):
+            resp = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+            await resp.prepare(request)
+            await resp.write(PAGE)
+            try:
+                for _ in range(256):
+                    await resp.write(FILLER)
+            except ConnectionError:
+                pass
+            return resp
+
+        self.manager = self.make_manager(await self.async_serve(handler))
+
+    async def _fetch(self, **kwargs):
+        self.manager.cache["vlagdagen"] = {}
+        return await self.manager.async_fetch(**kwargs)
+
+    async def test_stream_stops_after_table(self):
+        for fast in (True, False):
+            with self.subTest(fast=fast):
+                result = await self._fetch(fast=fast)
+
+                self.assertEqual(result["2026-12-15"]["name"], "Koninkrijksdag")
+                self.assertTrue(result["2026-05-04"]["halfstok"])
+                self.assertLess(self.manager.cache["body_size"], len(PAGE) + len(FILLER))
+        self.assertEqual(self.manager.stats["streams_stopped_early"], 2)
+
+    async def test_stream_matches_full_download(self):
+        streamed = await self._fetch(stream=True)
+        full = await self._fetch(stream=False)
+
+        self.assertEqual(streamed, full)
+        self.assertGreater(self.manager.cache["body_size"], len(PAGE) + len(FILLER))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Tests for the Vlaginstructie services."""
+
+import asyncio
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+import unittest
+
+try:
+    import voluptuous  # noqa: F401
+except ImportError as err:
+    raise unittest.SkipTest(f"Service schema dependency is unavailable: {err}") from err
+
+import ha_stubs
+from component import load
+
+(services,) = ha_stubs.load_integration("services")
+event_store = load("event_store")
+flag_calendar = load("flag_calendar")
+rules = load("rules")
+
+
+class GetFlagDaysTests(unittest.TestCase):
+    """Test the get_flag_days range checks against a calendar starting in 2026."""
+
+    def setUp(self):
+        self.hass = ha_stubs.StubHass(lambda: datetime(2026, 6, 1, tzinfo=timezone.utc), ".", None)
+        calendar = flag_calendar.FlagCalendar(rules.compile_calendar(2026, 2030))
+        coordinator = SimpleNamespace(event_store=event_store.FlagEventStore(calendar))
+        self.hass.data["vlaginstructie"] = {"entry": coordinator}
+        services.async_setup_services(self.hass)
+
+    def call(self, **data):
+        return asyncio.run(self.hass.services.async_call("vlaginstructie", services.SERVICE_GET_FLAG_DAYS, data))
+
+    def test_past_range_is_refused(self):
+        with self.assertRaises(ha_stubs.ServiceValidationError) as raised:
+            self.call(start_date=date(1990, 1, 1), end_date=date(2000, 1, 1))
+
+        self.assertIn("2026-01-01", str(raised.exception))
+        self.assertIn(services.SERVICE_GET_ARCHIVED_FLAG_DAYS, str(raised.exception))
+        with self.assertRaises(ha_stubs.ServiceValidationError):
+            self.call(start_date=date(2025, 12, 31), end_date=date(2026, 2, 1))
+
+    def test_range_from_the_first_year(self):
+        response = self.call(start_date=date(2026, 1, 1), end_date=date(2026, 2, 1), name="beatrix")
+
+        self.assertEqual([day["date"] for day in response["flag_days"]], ["2026-01-31"])
+
+
+if __name__ == "__main__":
+    unittest.main()
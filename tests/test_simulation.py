@@ -0,0 +1,55 @@
+"""Simulated-clock tests of the Vlaginstructie coordinator, entities and fetch cache."""
+
+from datetime import date, datetime
+import unittest
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError as err:
+    raise unittest.SkipTest(f"Optional scraper dependency is unavailable: {err}") from err
+
+from simulation import LOCAL, simulate
+
+
+class SimulationTests(unittest.TestCase):
+    """Step the coordinator minute by minute across date-dependent edge cases."""
+
+    def test_dodenherdenking_cutoff_and_midnight_transitions(self):
+        report = simulate(date(2026, 5, 2), 5, verify_every=1)
+
+        self.assertEqual(report.stale, [])
+        self.assertEqual(
+            [(when, old, new) for when, _, old, new in report.transitions_of("binary_sensor.vlag_halfstok_today")],
+            [
+                (datetime(2026, 5, 4, 0, 0, tzinfo=LOCAL), "off", "on"),
+                (datetime(2026, 5, 4, 18, 0, tzinfo=LOCAL), "on", "off"),
+            ],
+        )
+        # the flag stays out after the half-mast cutoff
+        self.assertEqual(
+            [when.day for when, *_ in report.transitions_of("binary_sensor.vlag_uithangen_today")],
+            [4, 6],
+        )
+        # every notification updates the nine entities; most skip the write
+        self.assertEqual(report.state_writes + report.avoided_writes, 9 * report.notifications)
+        self.assertGreater(report.avoided_writes, report.state_writes)
+
+    def test_monthly_revalidation_and_new_year_refetch(self):
+        report = simulate(date(2026, 11, 20), 45)
+
+        self.assertEqual(report.stale, [])
+        # setup, then 1 December answered with 304, then a full fetch for the new year
+        self.assertEqual((report.requests, report.not_modified), (2, 1))
+        self.assertEqual(report.parses, 2)
+        self.assertEqual(report.refreshes, 45 * 4)
+        self.assertEqual(len(report.cpu_per_day), 45)
+
+    def test_dst_changes_do_not_leave_stale_states(self):
+        report = simulate(date(2026, 3, 27), 4, verify_every=1)
+
+        self.assertEqual(report.stale, [])
+        self.assertEqual(report.minutes, 4 * 24 * 60 - 60)
+
+
+if __name__ == "__main__":
+    unittest.main()